@@ -12,17 +12,17 @@ Ce script initialise et lance le bot avec les configurations spécifiées.
 import argparse
 import os
 import sys
-import logging
-import yaml
 from pathlib import Path
 from loguru import logger
 from typing import Dict, Any, List
 
 # Importer les composants principaux du bot
+from src.config.config_loader import load_config_cached
 from src.core.engine import MarketMakingEngine
 from src.exchanges.binance_exchange import BinanceExchange
 from src.market_data.market_data_manager import MarketDataManager
 from src.monitoring.monitor import Monitor
+from src.monitoring.log_bridge import intercept_stdlib_logging
 from src.strategies.market_making_strategy import MarketMakingStrategy
 from src.strategies.adaptive_market_making_strategy import AdaptiveMarketMakingStrategy
 from src.strategies.statistical_arbitrage_strategy import StatisticalArbitrageStrategy
@@ -65,8 +65,7 @@ def load_config(config_path: str = "src/config/default.yaml") -> Dict[str, Any]:
         Configuration chargée
     """
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config_cached(config_path)
         logger.info(f"Configuration chargée depuis {config_path}")
         return config
     except Exception as e:
@@ -85,6 +84,10 @@ def setup_logging(config: Dict[str, Any]):
     logger.remove()
     logger.add(sys.stderr, level=log_level)
     logger.add("logs/ultra_robot_{time}.log", rotation="1 day", retention="30 days")
+    
+    # Les chemins critiques des stratégies journalisent via logging: rediriger
+    # ces messages vers les sorties loguru (console et fichier)
+    intercept_stdlib_logging(log_level)
     logger.info(f"Journalisation configurée avec le niveau {log_level}")
 
 
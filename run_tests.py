@@ -10,12 +10,29 @@ pour vérifier le bon fonctionnement du bot de market making.
 
 import os
 import sys
-import unittest
+import glob
 import argparse
 import time
 from loguru import logger
 
 
+def _select_test_files(test_pattern=None, unit_only=False):
+    """
+    Sélectionne les fichiers de tests correspondant au motif.
+    
+    Args:
+        test_pattern: Motif pour filtrer les fichiers de tests.
+        unit_only: Exclure les tests d'intégration.
+    
+    Returns:
+        Liste triée des chemins des fichiers de tests.
+    """
+    paths = sorted(glob.glob(os.path.join("tests", test_pattern or "test_*.py")))
+    if unit_only:
+        paths = [path for path in paths if os.path.basename(path) != "test_integration.py"]
+    return paths
+
+
 def run_unit_tests(test_pattern=None):
     """
     Exécute les tests unitaires.
@@ -28,27 +45,27 @@ def run_unit_tests(test_pattern=None):
     """
     logger.info("Exécution des tests unitaires...")
     
-    # Créer le chargeur de tests
-    loader = unittest.TestLoader()
+    # Les modules unitaires sont écrits sous forme de fonctions pytest (fixtures),
+    # que le chargeur de unittest ne découvre pas
+    try:
+        import pytest
+    except ImportError as e:
+        logger.error(f"pytest est requis pour les tests unitaires: {str(e)}")
+        return False
     
-    # Charger les tests
-    if test_pattern:
-        suite = loader.discover("tests", pattern=test_pattern)
-    else:
-        suite = loader.discover("tests", pattern="test_*.py")
+    # Sélectionner les fichiers de tests (les tests d'intégration sont exécutés à part)
+    paths = _select_test_files(test_pattern, unit_only=True)
+    if not paths:
+        logger.error(f"Aucun fichier de test ne correspond au motif: {test_pattern}")
+        return False
     
     # Exécuter les tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    result = pytest.main(["-v", *paths])
     
-    # Afficher le résultat
-    logger.info(f"Tests unitaires terminés: {result.testsRun} tests exécutés")
-    logger.info(f"Succès: {result.testsRun - len(result.failures) - len(result.errors)}")
-    logger.info(f"Échecs: {len(result.failures)}")
-    logger.info(f"Erreurs: {len(result.errors)}")
+    logger.info(f"Tests unitaires terminés avec le code {int(result)}")
     
     # Retourner True si tous les tests ont réussi
-    return len(result.failures) == 0 and len(result.errors) == 0
+    return result == 0
 
 
 def run_integration_tests():
@@ -60,24 +77,63 @@ def run_integration_tests():
     """
     logger.info("Exécution des tests d'intégration...")
     
-    # Créer le chargeur de tests
-    loader = unittest.TestLoader()
-    
-    # Charger les tests d'intégration
-    suite = loader.discover("tests", pattern="test_integration.py")
+    # Les tests d'intégration sont écrits sous forme de fonctions pytest (fixtures)
+    try:
+        import pytest
+    except ImportError as e:
+        logger.error(f"pytest est requis pour les tests d'intégration: {str(e)}")
+        return False
     
     # Exécuter les tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    result = pytest.main(["-v", os.path.join("tests", "test_integration.py")])
+    
+    logger.info(f"Tests d'intégration terminés avec le code {int(result)}")
+    
+    # Retourner True si tous les tests ont réussi
+    return result == 0
+
+
+def run_parallel_tests(test_pattern=None, unit_only=False):
+    """
+    Exécute les tests en parallèle sur tous les cœurs avec pytest-xdist.
+    
+    Chaque processus de travail construit ses propres mocks via les fixtures, les
+    tests ne partagent donc aucun état mutable. Les tests marqués serial (threads
+    et attentes bornées) sont exécutés ensuite, dans un seul processus.
+    
+    Args:
+        test_pattern: Motif pour filtrer les fichiers de tests à exécuter.
+        unit_only: Exclure les tests d'intégration.
     
-    # Afficher le résultat
-    logger.info(f"Tests d'intégration terminés: {result.testsRun} tests exécutés")
-    logger.info(f"Succès: {result.testsRun - len(result.failures) - len(result.errors)}")
-    logger.info(f"Échecs: {len(result.failures)}")
-    logger.info(f"Erreurs: {len(result.errors)}")
+    Returns:
+        True si tous les tests ont réussi, False sinon.
+    """
+    logger.info("Exécution des tests en parallèle...")
+    
+    try:
+        import pytest
+        import xdist  # noqa: F401
+    except ImportError as e:
+        logger.error(f"pytest-xdist est requis pour l'exécution parallèle: {str(e)}")
+        return False
+    
+    # Sélectionner les fichiers de tests
+    paths = _select_test_files(test_pattern, unit_only)
+    if not paths:
+        logger.error(f"Aucun fichier de test ne correspond au motif: {test_pattern}")
+        return False
+    
+    # Répartir les tests entre les processus de travail (un par cœur), puis exécuter
+    # les tests marqués serial; un passage sans test sélectionné n'est pas un échec
+    results = [
+        pytest.main(["-n", "auto", "-q", "-m", "not serial", *paths]),
+        pytest.main(["-q", "-m", "serial", *paths])
+    ]
+    
+    logger.info(f"Tests parallèles terminés avec les codes {[int(result) for result in results]}")
     
     # Retourner True si tous les tests ont réussi
-    return len(result.failures) == 0 and len(result.errors) == 0
+    return all(result in (pytest.ExitCode.OK, pytest.ExitCode.NO_TESTS_COLLECTED) for result in results)
 
 
 def run_specific_test(test_name):
@@ -85,53 +141,41 @@ def run_specific_test(test_name):
     Exécute un test spécifique.
     
     Args:
-        test_name: Nom du test à exécuter.
+        test_name: Nom du test à exécuter (fichier, module.test ou expression -k de pytest).
     
     Returns:
         True si le test a réussi, False sinon.
     """
     logger.info(f"Exécution du test spécifique: {test_name}")
     
-    # Créer le chargeur de tests
-    loader = unittest.TestLoader()
-    
-    # Charger le test spécifique
     try:
-        if "." in test_name:
-            # Format: module.classe.méthode
-            parts = test_name.split(".")
-            
-            if len(parts) == 2:
-                # Format: module.classe
-                module_name, class_name = parts
-                suite = loader.loadTestsFromName(f"tests.{module_name}.{class_name}")
-            elif len(parts) == 3:
-                # Format: module.classe.méthode
-                module_name, class_name, method_name = parts
-                suite = loader.loadTestsFromName(f"tests.{module_name}.{class_name}.{method_name}")
-            else:
-                logger.error(f"Format de nom de test invalide: {test_name}")
-                return False
-        else:
-            # Format: nom de fichier
-            suite = loader.discover("tests", pattern=f"{test_name}.py")
-    
-    except Exception as e:
-        logger.error(f"Erreur lors du chargement du test {test_name}: {str(e)}")
+        import pytest
+    except ImportError as e:
+        logger.error(f"pytest est requis pour exécuter un test spécifique: {str(e)}")
         return False
     
+    # Résoudre le fichier de tests et l'expression de sélection
+    module_name, _, keyword = test_name.partition(".")
+    module_path = os.path.join("tests", f"{module_name}.py")
+    if os.path.exists(module_path):
+        # Format: fichier ou module.test (classe et méthode séparées par des points)
+        paths = [module_path]
+        keyword = keyword.replace(".", " and ")
+    else:
+        # Format: expression -k appliquée à tous les fichiers de tests
+        paths = _select_test_files()
+        keyword = test_name
+    
     # Exécuter le test
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    args = ["-v", *paths]
+    if keyword:
+        args += ["-k", keyword]
+    result = pytest.main(args)
     
-    # Afficher le résultat
-    logger.info(f"Test spécifique terminé: {result.testsRun} tests exécutés")
-    logger.info(f"Succès: {result.testsRun - len(result.failures) - len(result.errors)}")
-    logger.info(f"Échecs: {len(result.failures)}")
-    logger.info(f"Erreurs: {len(result.errors)}")
+    logger.info(f"Test spécifique terminé avec le code {int(result)}")
     
-    # Retourner True si tous les tests ont réussi
-    return len(result.failures) == 0 and len(result.errors) == 0
+    # Retourner True si le test a réussi
+    return result == 0
 
 
 def main():
@@ -144,6 +188,7 @@ def main():
     parser.add_argument("--integration", action="store_true", help="Exécuter les tests d'intégration")
     parser.add_argument("--all", action="store_true", help="Exécuter tous les tests")
     parser.add_argument("--test", type=str, help="Exécuter un test spécifique")
+    parser.add_argument("--parallel", action="store_true", help="Exécuter les tests en parallèle (pytest-xdist)")
     parser.add_argument("--pattern", type=str, help="Motif pour filtrer les tests à exécuter")
     args = parser.parse_args()
     
@@ -160,6 +205,9 @@ def main():
     if args.test:
         # Exécuter un test spécifique
         success = run_specific_test(args.test)
+    elif args.parallel:
+        # Exécuter les tests en parallèle (unitaires seulement avec --unit)
+        success = run_parallel_tests(args.pattern, unit_only=args.unit)
     elif args.all:
         # Exécuter tous les tests
         unit_success = run_unit_tests(args.pattern)
@@ -56,6 +56,7 @@ setup(
         "dev": [
             "pytest>=6.0.0",
             "pytest-cov>=2.12.0",
+            "pytest-xdist>=3.0.0",
             "black>=21.5b2",
             "isort>=5.9.0",
             "flake8>=3.9.0",
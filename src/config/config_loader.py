@@ -7,12 +7,92 @@ Module de chargement de configuration pour ULTRA-ROBOT MARKET MAKER IA.
 Ce module gère le chargement et la validation des configurations à partir de fichiers YAML.
 """
 
+import hashlib
+import json
 import os
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 from loguru import logger
 
+# Chargeur YAML: binding C de libyaml si PyYAML a été compilé avec, sinon version Python
+try:
+    from yaml import CSafeLoader as YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as YAML_LOADER
+
+
+def _config_cache_dir() -> Path:
+    """
+    Retourne le répertoire du cache de configuration, hors de l'arborescence du projet.
+    
+    Returns:
+        ULTRA_BOT_CACHE_DIR si défini, sinon le répertoire de cache de l'utilisateur (XDG).
+    """
+    base = os.environ.get("ULTRA_BOT_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "ultra_robot")
+    return Path(base) / "config"
+
+
+def load_config_cached(config_path) -> Dict[str, Any]:
+    """
+    Charge un fichier YAML en passant par un cache JSON sur disque.
+    
+    Le cache est indexé par l'empreinte SHA-256 du contenu du fichier: tant que le
+    YAML n'est pas modifié, seul le JSON (bien plus rapide à analyser) est relu.
+    Le format JSON ne contient que des données, un cache altéré ne peut donc pas
+    exécuter de code. Une configuration que JSON ne restitue pas à l'identique
+    (dates, clés non textuelles) n'est pas mise en cache.
+    
+    Args:
+        config_path: Chemin vers le fichier de configuration YAML.
+        
+    Returns:
+        Configuration chargée (un nouvel objet à chaque appel).
+    """
+    config_path = Path(config_path)
+    content = config_path.read_bytes()
+    path_digest = hashlib.sha256(str(config_path.resolve()).encode('utf-8')).hexdigest()[:16]
+    cache_dir = _config_cache_dir()
+    cache_path = cache_dir / f"{path_digest}-{hashlib.sha256(content).hexdigest()}.json"
+    
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Cache de configuration illisible {cache_path}: {str(e)}")
+    
+    config = yaml.load(content, Loader=YAML_LOADER)
+    
+    # Ne mettre en cache que les configurations restituées à l'identique par JSON
+    try:
+        serialized = json.dumps(config)
+        if json.loads(serialized) != config:
+            return config
+    except (TypeError, ValueError):
+        return config
+    
+    # Écrire le cache de façon atomique et supprimer ceux des versions précédentes
+    try:
+        # Le cache peut contenir des paramètres sensibles: lisible par son seul propriétaire,
+        # y compris pour un répertoire créé par une version précédente
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        os.chmod(cache_dir, 0o700)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w', encoding='utf-8') as file:
+            file.write(serialized)
+        os.replace(tmp_path, cache_path)
+        for stale in cache_dir.glob(f"{path_digest}-*.json"):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Impossible d'écrire le cache de configuration {cache_path}: {str(e)}")
+    
+    return config
+
 
 class ConfigLoader:
     """
@@ -54,9 +134,8 @@ class ConfigLoader:
         if not self.config_path.exists():
             raise FileNotFoundError(f"Fichier de configuration non trouvé: {self.config_path}")
         
-        # Charger la configuration depuis le fichier YAML
-        with open(self.config_path, 'r', encoding='utf-8') as file:
-            config = yaml.safe_load(file)
+        # Charger la configuration depuis le fichier YAML (ou son cache)
+        config = load_config_cached(self.config_path)
         
         # Fusionner avec les valeurs par défaut
         config = self._merge_with_defaults(config)
@@ -108,11 +108,8 @@ class MarketMakingEngine:
         )
         
         # Créer les stratégies
-        for strategy_config in self.config["strategies"]["enabled_strategies"]:
-            strategy_id = strategy_config if isinstance(strategy_config, str) else strategy_config["id"]
-            strategy = self.strategy_factory.create_strategy(strategy_id)
-            self.strategies[strategy_id] = strategy
-            logger.info(f"Stratégie initialisée: {strategy_id}")
+        strategy_ids = self.strategy_factory.get_enabled_strategy_ids()
+        self.strategies.update(zip(strategy_ids, self.strategy_factory.create_strategies(strategy_ids)))
         
         # Initialiser l'optimiseur IA si activé
         if self.config["ai"]["enabled"]:
@@ -116,7 +116,8 @@ class BaseExchange(ABC):
         pass
     
     @abstractmethod
-    def fetch_ohlcv(self, symbol: str, timeframe: str = "1h", limit: int = 100) -> List[List[float]]:
+    def fetch_ohlcv(self, symbol: str, timeframe: str = "1h", limit: int = 100,
+                    since: Optional[int] = None) -> List[List[float]]:
         """
         Récupère les bougies OHLCV pour un symbole.
         
@@ -124,6 +125,7 @@ class BaseExchange(ABC):
             symbol: Symbole de l'actif.
             timeframe: Intervalle des bougies (1m, 5m, 15m, 1h, 4h, 1d).
             limit: Nombre maximum de bougies à récupérer.
+            since: Horodatage en millisecondes de la première bougie à récupérer (dernières bougies si absent).
             
         Returns:
             Liste des bougies OHLCV.
@@ -348,7 +348,8 @@ class BinanceExchange(BaseExchange):
             logger.error(f"Erreur lors de la récupération du carnet d'ordres pour {symbol}: {str(e)}")
             return {}
     
-    def fetch_ohlcv(self, symbol: str, timeframe: str = "1h", limit: int = 100) -> List[List[float]]:
+    def fetch_ohlcv(self, symbol: str, timeframe: str = "1h", limit: int = 100,
+                    since: Optional[int] = None) -> List[List[float]]:
         """
         Récupère les bougies OHLCV pour un symbole.
         
@@ -356,6 +357,7 @@ class BinanceExchange(BaseExchange):
             symbol: Symbole de l'actif.
             timeframe: Intervalle des bougies (1m, 5m, 15m, 1h, 4h, 1d).
             limit: Nombre maximum de bougies à récupérer.
+            since: Horodatage en millisecondes de la première bougie à récupérer (dernières bougies si absent).
             
         Returns:
             Liste des bougies OHLCV.
@@ -373,11 +375,15 @@ class BinanceExchange(BaseExchange):
             
             interval = interval_map.get(timeframe, "1h")
             
-            response = self._request("GET", "klines", {
+            params = {
                 "symbol": symbol,
                 "interval": interval,
                 "limit": limit
-            })
+            }
+            if since is not None:
+                params["startTime"] = int(since)
+            
+            response = self._request("GET", "klines", params)
             
             # Formater les bougies
             candles = []
@@ -87,19 +87,151 @@ class OrderExecutor:
         Returns:
             Informations sur l'ordre placé, ou None si l'ordre a échoué.
         """
-        # Vérifier les paramètres
-        if not symbol or not side or not order_type or amount <= 0:
-            logger.error(f"Paramètres d'ordre invalides: {symbol}, {side}, {order_type}, {amount}")
+        # Déterminer l'exchange à utiliser
+        exchange = self._get_exchange_for_symbol(symbol, exchange_id)
+        if not exchange:
+            logger.error(f"Aucun exchange trouvé pour {symbol}")
             return None
         
-        if order_type == "limit" and (price is None or price <= 0):
-            logger.error(f"Prix invalide pour un ordre limit: {price}")
+        # Vérifier l'ordre et préparer ses paramètres
+        request = self._prepare_order(symbol, side, order_type, amount, price, params)
+        if request is None:
             return None
+        order_params = request["params"]
+        
+        # Mesurer la latence
+        start_time = time.time()
+        
+        try:
+            # Placer l'ordre sur l'exchange
+            if order_type == "limit":
+                order = self._call_with_retry(exchange.create_limit_order, symbol, side, amount, price, order_params)
+            else:
+                order = self._call_with_retry(exchange.create_market_order, symbol, side, amount, order_params)
+        except Exception as e:
+            logger.error(f"Erreur lors du placement de l'ordre: {str(e)}")
+            return None
+        
+        # Calculer la latence
+        latency_ms = (time.time() - start_time) * 1000
+        
+        with self.order_lock:
+            if exchange_id not in self.active_orders:
+                self.active_orders[exchange_id] = {}
+            
+            return self._register_order(order, order_params["clientOrderId"], symbol, side, order_type,
+                                        amount, price, exchange_id, latency_ms)
+    
+    def place_batch(self, symbol: str, orders: List[Dict[str, Any]],
+                    exchange_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Place plusieurs ordres en une seule requête sur l'exchange.
+        
+        Si l'exchange n'expose pas de création groupée (create_orders),
+        les ordres sont placés un par un via place_order.
+        
+        Args:
+            symbol: Symbole de l'actif.
+            orders: Liste d'ordres ({"side", "type", "amount", "price", "params"}).
+            exchange_id: Identifiant de l'exchange (si None, utilise l'exchange par défaut).
+            
+        Returns:
+            Liste des informations sur les ordres placés.
+        """
+        if not orders:
+            return []
         
         # Déterminer l'exchange à utiliser
         exchange = self._get_exchange_for_symbol(symbol, exchange_id)
         if not exchange:
             logger.error(f"Aucun exchange trouvé pour {symbol}")
+            return []
+        
+        create_orders = getattr(exchange, "create_orders", None)
+        if create_orders is None:
+            placed = []
+            for order in orders:
+                order_info = self.place_order(
+                    symbol=symbol,
+                    side=order["side"],
+                    order_type=order.get("type", "limit"),
+                    amount=order["amount"],
+                    price=order.get("price"),
+                    exchange_id=exchange_id,
+                    params=order.get("params")
+                )
+                if order_info:
+                    placed.append(order_info)
+            return placed
+        
+        # Préparer les requêtes de la requête groupée
+        batch = []
+        for i, order in enumerate(orders):
+            request = self._prepare_order(symbol, order["side"], order.get("type", "limit"), order["amount"],
+                                          order.get("price"), order.get("params"), suffix=f"_{i}")
+            if request is not None:
+                batch.append(request)
+        
+        if not batch:
+            return []
+        
+        # Mesurer la latence
+        start_time = time.time()
+        
+        try:
+            # Placer tous les ordres en une seule requête
+            raw_orders = self._call_with_retry(create_orders, batch)
+        except Exception as e:
+            logger.error(f"Erreur lors du placement groupé des ordres pour {symbol}: {str(e)}")
+            return []
+        
+        # Calculer la latence
+        latency_ms = (time.time() - start_time) * 1000
+        
+        with self.order_lock:
+            if exchange_id not in self.active_orders:
+                self.active_orders[exchange_id] = {}
+            
+            placed = []
+            for request, order in zip(batch, raw_orders):
+                if not order or "id" not in order:
+                    self.execution_stats["orders_rejected"] += 1
+                    continue
+                
+                placed.append(self._register_order(
+                    order, request["params"]["clientOrderId"], symbol, request["side"],
+                    request["type"], request["amount"], request["price"], exchange_id, latency_ms
+                ))
+            
+            return placed
+    
+    def _prepare_order(self, symbol: str, side: str, order_type: str, amount: float, price: Optional[float],
+                       params: Optional[Dict[str, Any]], suffix: str = "") -> Optional[Dict[str, Any]]:
+        """
+        Vérifie un ordre et prépare la requête à envoyer à l'exchange.
+        
+        Seul point de contrôle des limites de risque, commun à place_order et place_batch.
+        
+        Args:
+            symbol: Symbole de l'actif.
+            side: Côté de l'ordre ('buy' ou 'sell').
+            order_type: Type d'ordre ('limit' ou 'market').
+            amount: Montant de l'ordre.
+            price: Prix de l'ordre (requis pour les ordres limit).
+            params: Paramètres supplémentaires pour l'ordre (copiés, jamais modifiés).
+            suffix: Suffixe de l'identifiant client (distingue les ordres d'une même requête groupée).
+            
+        Returns:
+            Requête de l'ordre ({"symbol", "type", "side", "amount", "price", "params"}),
+            ou None si l'ordre est invalide ou dépasse les limites de risque.
+        """
+        # Vérifier les paramètres
+        if not symbol or not side or amount <= 0 or order_type not in ("limit", "market"):
+            logger.error(f"Paramètres d'ordre invalides: {symbol}, {side}, {order_type}, {amount}")
+            return None
+        
+        if order_type == "limit" and (price is None or price <= 0):
+            logger.error(f"Prix invalide pour un ordre limit: {price}")
             return None
         
         # Vérifier les limites de risque
@@ -108,7 +240,7 @@ class OrderExecutor:
             return None
         
         # Préparer les paramètres de l'ordre
-        order_params = params or {}
+        order_params = dict(params or {})
         
         # Ajouter les paramètres pour les ordres iceberg si activés
         if self.use_iceberg_orders and order_type == "limit" and amount > 0.1:
@@ -116,93 +248,108 @@ class OrderExecutor:
             order_params["visible_size"] = amount * 0.2  # 20% visible
         
         # Ajouter un identifiant unique pour suivre l'ordre
-        order_id = f"ultra_mm_{int(time.time() * 1000)}_{hash(symbol + side)}"
-        order_params["clientOrderId"] = order_id
-        
-        # Mesurer la latence
-        start_time = time.time()
+        order_params["clientOrderId"] = f"ultra_mm_{int(time.time() * 1000)}_{hash(symbol + side)}{suffix}"
+        
+        return {
+            "symbol": symbol,
+            "type": order_type,
+            "side": side,
+            "amount": amount,
+            "price": price,
+            "params": order_params
+        }
+    
+    def _call_with_retry(self, func, *args):
+        """
+        Appelle l'exchange en réessayant jusqu'à retry_attempts fois en cas d'erreur.
         
-        try:
-            # Placer l'ordre
-            with self.order_lock:
-                if exchange_id not in self.active_orders:
-                    self.active_orders[exchange_id] = {}
-                
-                # Placer l'ordre sur l'exchange
-                if order_type == "limit":
-                    order = exchange.create_limit_order(symbol, side, amount, price, order_params)
-                elif order_type == "market":
-                    order = exchange.create_market_order(symbol, side, amount, order_params)
-                else:
-                    logger.error(f"Type d'ordre non supporté: {order_type}")
-                    return None
-                
-                # Calculer la latence
-                latency_ms = (time.time() - start_time) * 1000
-                
-                # Mettre à jour les statistiques
-                self.execution_stats["orders_placed"] += 1
-                self.execution_stats["average_latency_ms"] = (
-                    (self.execution_stats["average_latency_ms"] * (self.execution_stats["orders_placed"] - 1) + latency_ms) /
-                    self.execution_stats["orders_placed"]
-                )
-                
-                # Stocker l'ordre dans les ordres actifs
-                if symbol not in self.active_orders[exchange_id]:
-                    self.active_orders[exchange_id][symbol] = []
-                
-                order_info = {
-                    "id": order["id"],
-                    "client_id": order_id,
-                    "symbol": symbol,
-                    "side": side,
-                    "type": order_type,
-                    "amount": amount,
-                    "price": price,
-                    "status": order["status"],
-                    "filled": order.get("filled", 0),
-                    "remaining": order.get("remaining", amount),
-                    "timestamp": time.time(),
-                    "exchange_id": exchange_id,
-                    "raw_order": order
-                }
-                
-                self.active_orders[exchange_id][symbol].append(order_info)
-                
-                # Ajouter à l'historique des ordres
-                self.order_history.append(order_info)
-                
-                logger.debug(f"Ordre placé: {symbol}, {side}, {order_type}, {amount}, {price}, latence: {latency_ms:.2f}ms")
-                
-                # Si l'ordre est déjà rempli, mettre à jour les statistiques
-                if order["status"] == "closed" or order["status"] == "filled":
-                    self.execution_stats["orders_filled"] += 1
-                    self.execution_stats["total_volume"] += amount
-                    
-                    # Mettre à jour la position dans le gestionnaire de risques
-                    if self.risk_manager:
-                        self.risk_manager.update_position(symbol, amount, price, side)
-                
-                return order_info
-                
-        except Exception as e:
-            logger.error(f"Erreur lors du placement de l'ordre: {str(e)}")
+        Args:
+            func: Méthode de l'exchange à appeler.
+            *args: Arguments de l'appel.
             
-            # Réessayer si configuré
-            if self.retry_attempts > 0:
-                logger.info(f"Tentative de réessai ({self.retry_attempts} restantes)")
+        Returns:
+            Résultat de l'appel.
+            
+        Raises:
+            Exception: Erreur de la dernière tentative.
+        """
+        for attempt in range(self.retry_attempts + 1):
+            try:
+                return func(*args)
+            except Exception as e:
+                remaining = self.retry_attempts - attempt
+                if remaining <= 0:
+                    raise
+                logger.warning(f"Erreur lors de l'appel à l'exchange: {str(e)}. "
+                               f"Tentative de réessai ({remaining} restantes)")
                 time.sleep(self.retry_delay_seconds)
-                return self.place_order(
-                    symbol=symbol,
-                    side=side,
-                    order_type=order_type,
-                    amount=amount,
-                    price=price,
-                    exchange_id=exchange_id,
-                    params=params
-                )
+    
+    def _register_order(self, order: Dict[str, Any], client_id: str, symbol: str, side: str,
+                        order_type: str, amount: float, price: Optional[float],
+                        exchange_id: Optional[str], latency_ms: float) -> Dict[str, Any]:
+        """
+        Enregistre un ordre placé et met à jour les statistiques d'exécution.
+        
+        Doit être appelée avec order_lock acquis.
+        
+        Args:
+            order: Ordre retourné par l'exchange.
+            client_id: Identifiant client de l'ordre.
+            symbol: Symbole de l'actif.
+            side: Côté de l'ordre ('buy' ou 'sell').
+            order_type: Type d'ordre ('limit', 'market', etc.).
+            amount: Montant de l'ordre.
+            price: Prix de l'ordre.
+            exchange_id: Identifiant de l'exchange.
+            latency_ms: Latence de placement en millisecondes.
             
-            return None
+        Returns:
+            Informations sur l'ordre placé.
+        """
+        # Mettre à jour les statistiques
+        self.execution_stats["orders_placed"] += 1
+        self.execution_stats["average_latency_ms"] = (
+            (self.execution_stats["average_latency_ms"] * (self.execution_stats["orders_placed"] - 1) + latency_ms) /
+            self.execution_stats["orders_placed"]
+        )
+        
+        # Stocker l'ordre dans les ordres actifs
+        if symbol not in self.active_orders[exchange_id]:
+            self.active_orders[exchange_id][symbol] = []
+        
+        order_info = {
+            "id": order["id"],
+            "client_id": client_id,
+            "symbol": symbol,
+            "side": side,
+            "type": order_type,
+            "amount": amount,
+            "price": price,
+            "status": order["status"],
+            "filled": order.get("filled", 0),
+            "remaining": order.get("remaining", amount),
+            "timestamp": time.time(),
+            "exchange_id": exchange_id,
+            "raw_order": order
+        }
+        
+        self.active_orders[exchange_id][symbol].append(order_info)
+        
+        # Ajouter à l'historique des ordres
+        self.order_history.append(order_info)
+        
+        logger.debug(f"Ordre placé: {symbol}, {side}, {order_type}, {amount}, {price}, latence: {latency_ms:.2f}ms")
+        
+        # Si l'ordre est déjà rempli, mettre à jour les statistiques
+        if order["status"] == "closed" or order["status"] == "filled":
+            self.execution_stats["orders_filled"] += 1
+            self.execution_stats["total_volume"] += amount
+            
+            # Mettre à jour la position dans le gestionnaire de risques
+            if self.risk_manager:
+                self.risk_manager.update_position(symbol, amount, price, side)
+        
+        return order_info
     
     def cancel_order(self, symbol: str, order_id: str, exchange_id: Optional[str] = None) -> bool:
         """
@@ -405,6 +552,27 @@ class OrderExecutor:
                            (current_time - order["timestamp"] < self.max_order_age_seconds)
                     ]
     
+    def get_price_increment(self, symbol: str, exchange_id: Optional[str] = None) -> Optional[float]:
+        """
+        Obtient le pas de cotation d'un symbole sur l'exchange.
+        
+        Args:
+            symbol: Symbole de l'actif.
+            exchange_id: Identifiant de l'exchange (si None, détermine automatiquement).
+            
+        Returns:
+            Pas de cotation, ou None si l'exchange ne le fournit pas.
+        """
+        exchange = self._get_exchange_for_symbol(symbol, exchange_id)
+        if not exchange or not hasattr(exchange, "get_min_price_increment"):
+            return None
+        
+        try:
+            return float(exchange.get_min_price_increment(symbol))
+        except Exception as e:
+            logger.error(f"Erreur lors de l'obtention du pas de cotation pour {symbol}: {str(e)}")
+            return None
+    
     def _get_exchange_for_symbol(self, symbol: str, exchange_id: Optional[str] = None) -> Any:
         """
         Obtient l'exchange approprié pour un symbole.
@@ -10,14 +10,13 @@ et configure l'environnement d'exécution.
 
 import os
 import sys
-import yaml
-import logging
 import argparse
 from pathlib import Path
 from dotenv import load_dotenv
 from loguru import logger
 
 # Importer les composants du bot
+from src.config.config_loader import load_config_cached
 from src.core.engine import MarketMakingEngine
 from src.market_data.market_data_manager import MarketDataManager
 from src.exchanges.binance_exchange import BinanceExchange
@@ -28,6 +27,7 @@ from src.strategies.combined_strategy import CombinedStrategy
 from src.risk_management.risk_manager import RiskManager
 from src.execution.order_executor import OrderExecutor
 from src.monitoring.monitor import Monitor
+from src.monitoring.log_bridge import intercept_stdlib_logging
 from src.ai.optimizer import AIOptimizer
 
 
@@ -49,8 +49,8 @@ def setup_logging(log_level="INFO", log_file=None):
     if log_file:
         logger.add(log_file, rotation="10 MB", retention="1 week", level=log_level)
     
-    # Configurer la journalisation pour les bibliothèques tierces
-    logging.basicConfig(level=getattr(logging, log_level))
+    # Rediriger la journalisation des bibliothèques tierces vers loguru
+    intercept_stdlib_logging(log_level)
 
 
 def load_config(config_file):
@@ -64,8 +64,7 @@ def load_config(config_file):
         Configuration chargée.
     """
     try:
-        with open(config_file, "r") as f:
-            config = yaml.safe_load(f)
+        config = load_config_cached(config_file)
         
         logger.info(f"Configuration chargée depuis {config_file}")
         return config
@@ -12,7 +12,6 @@ import os
 import sys
 import time
 import argparse
-import yaml
 import ccxt
 import threading
 from pathlib import Path
@@ -24,12 +23,14 @@ import dotenv
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Importer les composants du bot
+from config.config_loader import load_config_cached
 from market_data.market_data_manager import MarketDataManager
 from exchanges.binance_exchange import BinanceExchange
 from strategies.statistical_arbitrage_strategy import StatisticalArbitrageStrategy
 from strategies.market_making_strategy import MarketMakingStrategy
 from strategies.adaptive_market_making_strategy import AdaptiveMarketMakingStrategy
 from monitoring.monitor import Monitor
+from monitoring.log_bridge import intercept_stdlib_logging
 from core.engine import MarketMakingEngine
 
 
@@ -44,8 +45,7 @@ def load_config(config_path: str) -> Dict[str, Any]:
         Dictionnaire de configuration.
     """
     try:
-        with open(config_path, "r") as f:
-            config = yaml.safe_load(f)
+        config = load_config_cached(config_path)
         
         logger.info(f"Configuration chargée depuis {config_path}")
         return config
@@ -84,6 +84,9 @@ def setup_logging(config: Dict[str, Any]):
         retention="1 week"
     )
     
+    # Rediriger la journalisation via logging (chemins critiques des stratégies) vers loguru
+    intercept_stdlib_logging(log_level)
+    
     logger.info(f"Journalisation configurée avec le niveau {log_level}")
 
 
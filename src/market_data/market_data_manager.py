@@ -5,9 +5,34 @@
 Gestionnaire des données de marché.
 """
 
-from typing import Dict, Any, List
+import threading
+import time
+import numpy as np
+from typing import Dict, Any, List, Optional, Union
 from loguru import logger
 
+# Colonnes des bougies OHLCV renvoyées par les exchanges
+OHLCV_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
+# Durée en millisecondes des unités d'intervalle des bougies
+_INTERVAL_UNIT_MS = {"m": 60000, "h": 3600000, "d": 86400000, "w": 604800000}
+
+
+def _interval_ms(interval: str) -> Optional[int]:
+    """
+    Convertit un intervalle de bougies ("1m", "4h", "1d"...) en millisecondes.
+    
+    Args:
+        interval: Intervalle des bougies
+        
+    Returns:
+        Durée de l'intervalle en millisecondes, ou None si l'intervalle n'est pas reconnu
+    """
+    unit_ms = _INTERVAL_UNIT_MS.get(interval[-1:])
+    if unit_ms is None or not interval[:-1].isdigit():
+        return None
+    return int(interval[:-1]) * unit_ms
+
 class MarketDataManager:
     """Gestionnaire des données de marché."""
     
@@ -22,6 +47,11 @@ class MarketDataManager:
         self.config = config
         self.exchanges = exchanges or {}
         self.data_cache = {}
+        self._cache_times = {}  # Horodatage de la dernière mise à jour de chaque entrée du cache
+        # Durée de validité des tickers en cache (0: toujours interroger l'exchange). Distincte de
+        # cache_expiry_seconds, prévue pour l'historique: les cotations exigent des tickers frais
+        self.ticker_cache_seconds = config.get("ticker_cache_seconds", 0)
+        self._ready = threading.Event()  # Signalé une fois les flux de données démarrés
         logger.info("Gestionnaire de données de marché initialisé")
     
     def get_market_data(self, symbol: str, timeframe: str) -> Dict[str, Any]:
@@ -55,8 +85,174 @@ class MarketDataManager:
         """
         cache_key = f"{symbol}_{timeframe}"
         self.data_cache[cache_key] = data
+        self._cache_times[cache_key] = time.time()
         logger.debug(f"Données mises à jour pour {symbol} {timeframe}")
     
+    def _get_exchange(self, exchange_id: Optional[str] = None) -> Optional[Any]:
+        """
+        Résout le connecteur d'un exchange.
+        
+        Args:
+            exchange_id: Identifiant de l'exchange (premier exchange configuré si absent)
+            
+        Returns:
+            Connecteur de l'exchange, ou None si indisponible
+        """
+        if exchange_id:
+            return self.exchanges.get(exchange_id)
+        return next(iter(self.exchanges.values()), None)
+    
+    def get_ticker(self, symbol: str, exchange_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Récupère le ticker d'un symbole.
+        
+        Args:
+            symbol: Symbole du marché
+            exchange_id: Identifiant de l'exchange (premier exchange configuré si absent)
+            
+        Returns:
+            Ticker du symbole, ou None si indisponible
+        """
+        # Réutiliser le ticker en cache tant qu'il n'a pas expiré
+        if self.ticker_cache_seconds > 0:
+            cache_key = f"{symbol}_ticker"
+            cached_at = self._cache_times.get(cache_key)
+            if cached_at is not None and time.time() - cached_at < self.ticker_cache_seconds:
+                return self.data_cache[cache_key]
+        
+        exchange = self._get_exchange(exchange_id)
+        if exchange is None:
+            logger.warning(f"Aucun exchange disponible pour récupérer le ticker de {symbol}")
+            return None
+        
+        try:
+            ticker = exchange.fetch_ticker(symbol)
+        except Exception as e:
+            logger.error(f"Erreur lors de la récupération du ticker pour {symbol}: {str(e)}")
+            return None
+        
+        self.update_market_data(symbol, "ticker", ticker)
+        return ticker
+    
+    def get_tickers(self, symbols: List[str], exchange_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Récupère les tickers de plusieurs symboles en un seul appel à l'exchange.
+        
+        Si l'exchange n'expose pas de récupération groupée (fetch_tickers),
+        les tickers sont récupérés un par un via get_ticker.
+        
+        Args:
+            symbols: Symboles du marché
+            exchange_id: Identifiant de l'exchange (premier exchange configuré si absent)
+            
+        Returns:
+            Tickers indexés par symbole (vide en cas d'erreur)
+        """
+        exchange = self._get_exchange(exchange_id)
+        if exchange is None:
+            logger.warning(f"Aucun exchange disponible pour récupérer les tickers de {symbols}")
+            return {}
+        
+        fetch_tickers = getattr(exchange, "fetch_tickers", None)
+        if fetch_tickers is None:
+            tickers = {}
+            for symbol in symbols:
+                ticker = self.get_ticker(symbol, exchange_id)
+                if ticker:
+                    tickers[symbol] = ticker
+            return tickers
+        
+        try:
+            tickers = fetch_tickers(symbols) or {}
+        except Exception as e:
+            logger.error(f"Erreur lors de la récupération des tickers sur {exchange_id}: {str(e)}")
+            return {}
+        
+        # Ne conserver que les symboles demandés (certains exchanges renvoient tout le marché)
+        tickers = {symbol: tickers[symbol] for symbol in symbols if symbol in tickers}
+        for symbol, ticker in tickers.items():
+            self.update_market_data(symbol, "ticker", ticker)
+        return tickers
+    
+    def get_order_book(self, symbol: str, exchange_id: Optional[str] = None,
+                       limit: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Récupère le carnet d'ordres d'un symbole.
+        
+        Args:
+            symbol: Symbole du marché
+            exchange_id: Identifiant de l'exchange (premier exchange configuré si absent)
+            limit: Profondeur du carnet (order_book_depth de la configuration si absent)
+            
+        Returns:
+            Carnet d'ordres du symbole, ou None si indisponible
+        """
+        exchange = self._get_exchange(exchange_id)
+        if exchange is None:
+            logger.warning(f"Aucun exchange disponible pour récupérer le carnet d'ordres de {symbol}")
+            return None
+        
+        try:
+            order_book = exchange.fetch_order_book(symbol, limit or self.config.get("order_book_depth", 20))
+        except Exception as e:
+            logger.error(f"Erreur lors de la récupération du carnet d'ordres pour {symbol}: {str(e)}")
+            return None
+        
+        self.update_market_data(symbol, "orderbook", order_book)
+        return order_book
+    
+    def get_recent_candles(self, symbol: str, interval: str = "1h", limit: int = 100,
+                           exchange_id: Optional[str] = None, since: Optional[int] = None,
+                           as_array: bool = False, closed_only: bool = False) -> Union[List[Dict[str, float]], np.ndarray]:
+        """
+        Récupère les bougies OHLCV récentes d'un symbole.
+        
+        Args:
+            symbol: Symbole du marché
+            interval: Intervalle des bougies
+            limit: Nombre maximum de bougies
+            exchange_id: Identifiant de l'exchange (premier exchange configuré si absent)
+            since: Horodatage en millisecondes; transmis à l'exchange, qui ne renvoie que les
+                bougies ouvertes depuis (celles qui le précèdent sont écartées si l'exchange l'ignore)
+            as_array: Si True, retourne un tableau float64 de forme (N, 6) dont les colonnes
+                suivent OHLCV_COLUMNS, sans passer par des dictionnaires
+            closed_only: Si True, écarte la bougie encore ouverte (dernière bougie de la période en cours)
+            
+        Returns:
+            Liste de bougies sous forme de dictionnaires, ou tableau (N, 6) si as_array
+        """
+        exchange = self._get_exchange(exchange_id)
+        if exchange is None:
+            logger.warning(f"Aucun exchange disponible pour récupérer les bougies de {symbol}")
+            return np.empty((0, 6)) if as_array else []
+        
+        try:
+            if since is None:
+                ohlcv = exchange.fetch_ohlcv(symbol, interval, limit)
+            else:
+                ohlcv = exchange.fetch_ohlcv(symbol, interval, limit, since=since)
+        except Exception as e:
+            logger.error(f"Erreur lors de la récupération des bougies pour {symbol}: {str(e)}")
+            return np.empty((0, 6)) if as_array else []
+        
+        # Horodatage d'ouverture maximal d'une bougie clôturée
+        closed_before = None
+        if closed_only:
+            duration_ms = _interval_ms(interval)
+            if duration_ms is not None:
+                closed_before = time.time() * 1000 - duration_ms
+        
+        if as_array:
+            candles = np.asarray(ohlcv, dtype=np.float64).reshape(-1, 6)
+            if since is not None:
+                candles = candles[candles[:, 0] >= since]
+            if closed_before is not None:
+                candles = candles[candles[:, 0] <= closed_before]
+            return candles
+        
+        return [dict(zip(OHLCV_COLUMNS, row)) for row in ohlcv
+                if (since is None or row[0] >= since) and (closed_before is None or row[0] <= closed_before)]
+    
     def update(self):
         """
         Met à jour les données de marché pour tous les symboles configurés.
@@ -88,12 +284,15 @@ class MarketDataManager:
         for exchange_id, exchange in self.exchanges.items():
             if hasattr(exchange, 'start_market_data_stream'):
                 exchange.start_market_data_stream()
+        
+        self._ready.set()
     
     def stop(self):
         """
         Arrête le gestionnaire de données.
         """
         logger.info("Arrêt du gestionnaire de données de marché")
+        self._ready.clear()
         # Fermer les connexions WebSocket
         for exchange_id, exchange in self.exchanges.items():
             if hasattr(exchange, 'stop_market_data_stream'):
@@ -101,3 +300,4 @@ class MarketDataManager:
         
         # Vider le cache
         self.data_cache.clear()
+        self._cache_times.clear()
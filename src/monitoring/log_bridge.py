@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Pont entre le module logging de la bibliothèque standard et loguru.
+
+Les chemins critiques des stratégies et les bibliothèques tierces journalisent
+via logging; leurs messages sont redirigés vers les sorties configurées pour loguru.
+"""
+
+import logging
+from loguru import logger
+
+
+class InterceptHandler(logging.Handler):
+    """
+    Gestionnaire logging qui transmet chaque enregistrement à loguru.
+    """
+
+    def emit(self, record: logging.LogRecord):
+        """
+        Transmet un enregistrement à loguru en conservant son niveau.
+
+        Args:
+            record: Enregistrement émis via logging.
+        """
+        # Niveau loguru correspondant, ou valeur numérique pour les niveaux personnalisés
+        try:
+            level = logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+
+        logger.opt(exception=record.exc_info).log(level, record.getMessage())
+
+
+def stdlib_level(log_level: str) -> int:
+    """
+    Convertit un nom de niveau loguru en niveau numérique utilisable par logging.
+
+    Args:
+        log_level: Nom du niveau (y compris TRACE et SUCCESS, propres à loguru).
+
+    Returns:
+        Niveau numérique, ou logging.INFO si le nom n'est pas reconnu.
+    """
+    try:
+        return logger.level(str(log_level).upper()).no
+    except ValueError:
+        return logging.INFO
+
+
+def intercept_stdlib_logging(log_level: str = "INFO"):
+    """
+    Redirige la journalisation de la bibliothèque standard vers loguru.
+
+    Args:
+        log_level: Nom du niveau minimal transmis.
+    """
+    logging.basicConfig(handlers=[InterceptHandler()], level=stdlib_level(log_level), force=True)
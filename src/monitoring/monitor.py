@@ -74,6 +74,7 @@ class Monitor:
         # État interne
         self.running = False
         self.update_thread = None
+        self._ready = threading.Event()  # Signalé quand la boucle de mise à jour a démarré
         self.dashboard_thread = None
         self.dashboard_app = None
         
@@ -97,6 +98,7 @@ class Monitor:
         
         # Démarrer le thread de mise à jour des métriques
         self.running = True
+        self._ready.clear()
         self.update_thread = threading.Thread(target=self._update_loop)
         self.update_thread.daemon = True
         self.update_thread.start()
@@ -119,6 +121,7 @@ class Monitor:
         
         # Arrêter le thread de mise à jour
         self.running = False
+        self._ready.clear()
         
         # Attendre que le thread de mise à jour se termine
         if self.update_thread and self.update_thread.is_alive():
@@ -327,6 +330,7 @@ class Monitor:
         Boucle de mise à jour des métriques.
         """
         logger.info("Démarrage de la boucle de mise à jour des métriques")
+        self._ready.set()
         
         while self.running:
             try:
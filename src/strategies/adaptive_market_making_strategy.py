@@ -9,12 +9,15 @@ dynamiques en fonction des conditions de marché.
 """
 
 import time
+import logging
 import numpy as np
 from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
 
 from src.strategies.market_making_strategy import MarketMakingStrategy
 
+_log = logging.getLogger(__name__)
+
 
 class AdaptiveMarketMakingStrategy(MarketMakingStrategy):
     """
@@ -79,15 +82,14 @@ class AdaptiveMarketMakingStrategy(MarketMakingStrategy):
         current_time = time.time()
         
         # Exécuter la stratégie pour chaque symbole
-        for symbol in self.symbols:
+        for i, symbol in enumerate(self.symbols):
             try:
                 # Vérifier si un rafraîchissement est nécessaire
-                last_refresh = self.last_refresh_time.get(symbol, 0)
-                if current_time - last_refresh < self.refresh_rate:
+                if current_time - self._last_refresh[i] < self.refresh_rate:
                     continue
                 
                 # Mettre à jour le temps de rafraîchissement
-                self.last_refresh_time[symbol] = current_time
+                self._last_refresh[i] = current_time
                 
                 # Analyser les conditions de marché
                 self._analyze_market_conditions(symbol)
@@ -98,7 +100,8 @@ class AdaptiveMarketMakingStrategy(MarketMakingStrategy):
                 # Exécuter la logique de la stratégie de base
                 super().execute()
                 
-                logger.debug(f"Stratégie adaptative exécutée pour {symbol}")
+                if self._debug_enabled:
+                    _log.debug("Stratégie adaptative exécutée pour %s", symbol)
                 
             except Exception as e:
                 logger.error(f"Erreur lors de l'exécution de la stratégie adaptative pour {symbol}: {str(e)}")
@@ -163,7 +166,8 @@ class AdaptiveMarketMakingStrategy(MarketMakingStrategy):
             if mean_reversion is not None:
                 self.market_conditions[symbol]["mean_reversion"] = mean_reversion
             
-            logger.debug(f"Conditions de marché analysées pour {symbol}: {self.market_conditions[symbol]}")
+            if self._debug_enabled:
+                _log.debug("Conditions de marché analysées pour %s: %s", symbol, self.market_conditions[symbol])
             
         except Exception as e:
             logger.error(f"Erreur lors de l'analyse des conditions de marché pour {symbol}: {str(e)}")
@@ -267,7 +271,8 @@ class AdaptiveMarketMakingStrategy(MarketMakingStrategy):
             # Mettre à jour les paramètres
             self.update_parameters(adapted_params)
             
-            logger.debug(f"Paramètres adaptés pour {symbol}: spread_multiplier={final_spread_multiplier:.2f}, size_multiplier={final_size_multiplier:.2f}")
+            if self._debug_enabled:
+                _log.debug("Paramètres adaptés pour %s: spread_multiplier=%.2f, size_multiplier=%.2f", symbol, final_spread_multiplier, final_size_multiplier)
             
         except Exception as e:
             logger.error(f"Erreur lors de l'adaptation des paramètres pour {symbol}: {str(e)}")
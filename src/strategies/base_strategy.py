@@ -8,6 +8,7 @@ Ce module définit l'interface commune que toutes les stratégies
 doivent implémenter pour être utilisées par le bot.
 """
 
+import threading
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional, Tuple, Union
 from loguru import logger
@@ -23,6 +24,12 @@ class BaseStrategy(ABC):
     et implémenter ses méthodes abstraites.
     """
     
+    __slots__ = (
+        "strategy_id", "market_data_manager", "order_executor", "risk_manager",
+        "config", "name", "enabled", "symbols", "exchanges", "performance",
+        "is_running", "last_update_time", "_ready"
+    )
+    
     def __init__(self, strategy_id: str, market_data_manager: MarketDataManager, order_executor=None, risk_manager=None, config: Dict[str, Any] = None):
         """
         Initialise la stratégie.
@@ -58,6 +65,7 @@ class BaseStrategy(ABC):
         # État interne
         self.is_running = False
         self.last_update_time = 0
+        self._ready = threading.Event()  # Signalé une fois la stratégie démarrée
         
         logger.info(f"Stratégie {self.name} initialisée")
     
@@ -80,6 +88,7 @@ class BaseStrategy(ABC):
             return
         
         self.is_running = True
+        self._ready.set()
         logger.info(f"Stratégie {self.name} démarrée")
     
     def stop(self):
@@ -91,6 +100,7 @@ class BaseStrategy(ABC):
             return
         
         self.is_running = False
+        self._ready.clear()
         logger.info(f"Stratégie {self.name} arrêtée")
     
     def is_enabled(self) -> bool:
@@ -149,6 +149,7 @@ class CombinedStrategy(BaseStrategy):
         
         # Démarrer la stratégie combinée
         self.is_running = True
+        self._ready.set()
     
     def stop(self):
         """
@@ -167,6 +168,7 @@ class CombinedStrategy(BaseStrategy):
         
         # Arrêter la stratégie combinée
         self.is_running = False
+        self._ready.clear()
     
     def get_signals(self, symbol: str, exchange_id: Optional[str] = None) -> Dict[str, Any]:
         """
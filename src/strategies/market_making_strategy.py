@@ -9,10 +9,23 @@ des ordres d'achat et de vente autour du prix du marché avec un spread défini.
 """
 
 import time
+from array import array
+from bisect import bisect_left, bisect_right
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Tuple
+import logging
 from loguru import logger
 from src.strategies.base_strategy import BaseStrategy
 
+# Journalisation des chemins exécutés à chaque cycle via logging: le filtrage par
+# niveau y est une simple comparaison, sans inspection de la pile d'appels.
+# loguru reste utilisé pour les messages d'initialisation et de configuration.
+_log = logging.getLogger(__name__)
+
+# Écart minimal au meilleur bid/ask lorsque le pas de cotation n'est pas connu
+_MIN_PRICE_STEP = 1e-8
+
 
 class MarketMakingStrategy(BaseStrategy):
     """
@@ -22,6 +35,13 @@ class MarketMakingStrategy(BaseStrategy):
     d'achat et de vente autour du prix du marché avec un spread configurable.
     """
     
+    __slots__ = (
+        "spread_bid", "spread_ask", "order_size", "order_count", "refresh_rate",
+        "min_profit", "max_position", "active_orders",
+        "_sym_idx", "_last_refresh", "_positions", "_error_count", "_debug_enabled",
+        "_tick_size", "symbol_executor", "_order_keys"
+    )
+    
     def __init__(self, strategy_id: str, market_data_manager=None, order_executor=None, 
                  risk_manager=None, config=None):
         """
@@ -59,10 +79,23 @@ class MarketMakingStrategy(BaseStrategy):
         self.max_position = parameters.get("max_position", 1.0)
         
         # État interne
-        self.active_orders = {}  # Ordres actifs par symbole
-        self.last_refresh_time = {}  # Dernier temps de rafraîchissement par symbole
-        self.positions = {}  # Positions actuelles par symbole
-        self.order_book_snapshots = {}  # Instantanés du carnet d'ordres par symbole
+        self.active_orders = {}  # Ordres actifs par symbole, triés du plus compétitif au moins compétitif
+        self._order_keys = {}  # Clés de tri parallèles aux ordres actifs (-prix pour les achats, prix pour les ventes)
+        
+        # Temps de rafraîchissement et positions indexés par symbole (tableaux contigus)
+        self._sym_idx = {}
+        self._last_refresh = np.zeros(0)
+        self._positions = np.zeros(0)
+        self._error_count = np.zeros(0, dtype=np.int64)  # Échecs d'obtention des données
+        self._tick_size = {}  # Pas de cotation par symbole
+        self._index_symbols()
+        
+        # Niveau DEBUG actif: évalué une fois pour éviter le formatage des messages
+        # de débogage dans les boucles lorsque ce niveau est filtré
+        self.refresh_log_level()
+        
+        # Pool de threads pour traiter les symboles en parallèle (E/S réseau bloquantes)
+        self.symbol_executor = self._new_symbol_executor()
         
         logger.info(f"Stratégie de Market Making initialisée: {strategy_id} sur {', '.join(self.symbols)}")
     
@@ -75,53 +108,221 @@ class MarketMakingStrategy(BaseStrategy):
         """
         current_time = time.time()
         
-        # Exécuter la stratégie pour chaque symbole
-        for symbol in self.symbols:
-            try:
-                # Vérifier si un rafraîchissement est nécessaire
-                last_refresh = self.last_refresh_time.get(symbol, 0)
-                if current_time - last_refresh < self.refresh_rate:
-                    continue
-                
-                # Mettre à jour le temps de rafraîchissement
-                self.last_refresh_time[symbol] = current_time
-                
-                # Vérifier si le marché est manipulé
-                if self.risk_manager and self.risk_manager.detect_market_manipulation(symbol):
-                    logger.warning(f"Manipulation de marché détectée pour {symbol}. Suspension temporaire.")
-                    self._cancel_all_orders(symbol)
-                    continue
-                
-                # Obtenir les données de marché actuelles
-                market_data = self._get_market_data(symbol)
-                if not market_data:
-                    logger.warning(f"Données de marché non disponibles pour {symbol}")
+        try:
+            # Sélectionner les symboles à rafraîchir et préparer leur état dans ce thread:
+            # les tâches ne modifient que leur propre copie, fusionnée ensuite ici
+            tasks = []
+            for i, symbol in enumerate(self.symbols):
+                if current_time - self._last_refresh[i] < self.refresh_rate:
                     continue
-                
-                # Calculer les prix des ordres
-                order_prices = self._calculate_order_prices(symbol, market_data)
-                
-                # Vérifier les limites de position
-                current_position = self.positions.get(symbol, 0)
-                if abs(current_position) >= self.max_position:
-                    logger.warning(f"Position maximale atteinte pour {symbol}: {current_position}")
-                    # Annuler les ordres du côté qui augmenterait la position
-                    if current_position > 0:
-                        self._cancel_orders_by_side(symbol, "buy")
-                    else:
-                        self._cancel_orders_by_side(symbol, "sell")
-                
-                # Annuler les ordres existants si nécessaire
-                if self._should_refresh_orders(symbol, order_prices):
-                    self._cancel_all_orders(symbol)
-                
-                # Placer de nouveaux ordres
-                self._place_orders(symbol, order_prices)
-                
-                logger.debug(f"Stratégie exécutée pour {symbol}")
-                
-            except Exception as e:
-                logger.error(f"Erreur lors de l'exécution de la stratégie pour {symbol}: {str(e)}")
+                self._last_refresh[i] = current_time
+                tasks.append((i, symbol, current_time, self._get_tick_size(symbol),
+                              float(self._positions[i]), self._symbol_state(symbol)))
+            
+            # Les symboles sont indépendants: traiter chacun dans son propre thread
+            # pour que la latence d'un cycle soit ~max(RTT) au lieu de K·RTT
+            if len(tasks) <= 1:
+                results = [self._run_symbol(task) for task in tasks]
+            else:
+                if self.symbol_executor is None:
+                    self.symbol_executor = self._new_symbol_executor()
+                futures = [self.symbol_executor.submit(self._run_symbol, task) for task in tasks]
+                results = [future.result() for future in futures]
+            
+            for task, state in zip(tasks, results):
+                i, symbol = task[:2]
+                self._merge_symbol_state(i, symbol, state)
+        
+        except Exception as e:
+            _log.error("Erreur lors de l'exécution de la stratégie %s: %s", self.strategy_id, e)
+    
+    def _run_symbol(self, task: Tuple) -> Dict[str, Any]:
+        """
+        Exécute une tâche de symbole sans jamais lever d'exception.
+        
+        L'état du symbole est modifié en place: en cas d'erreur, les ordres déjà
+        placés y restent enregistrés et sont fusionnés comme ceux des autres symboles.
+        
+        Args:
+            task: Arguments de _execute_symbol (i, symbol, current_time, tick, position, state).
+            
+        Returns:
+            État du symbole, à fusionner par _merge_symbol_state.
+        """
+        state = task[-1]
+        try:
+            return self._execute_symbol(*task)
+        except Exception as e:
+            state["errors"] += 1
+            _log.error("Erreur lors de l'exécution de la stratégie %s pour %s: %s", self.strategy_id, task[1], e)
+            return state
+    
+    def _execute_symbol(self, i: int, symbol: str, current_time: float, tick: float,
+                        current_position: float, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Exécute la stratégie de market making pour un symbole.
+        
+        Les méthodes appelées retournent None en cas d'échec au lieu de lever
+        une exception; les échecs sont comptabilisés par symbole. Seul l'état
+        passé en argument est modifié, de sorte que plusieurs symboles peuvent
+        être traités en parallèle sans verrou.
+        
+        Args:
+            i: Indice du symbole dans les tableaux d'état.
+            symbol: Symbole de l'actif.
+            current_time: Horodatage du cycle d'exécution.
+            tick: Pas de cotation du symbole.
+            current_position: Position actuelle sur le symbole.
+            state: Copie de l'état du symbole (voir _symbol_state).
+            
+        Returns:
+            État du symbole mis à jour, à fusionner par _merge_symbol_state.
+        """
+        # Vérifier si le marché est manipulé
+        if self.risk_manager and self.risk_manager.detect_market_manipulation(symbol):
+            _log.warning("Manipulation de marché détectée pour %s. Suspension temporaire.", symbol)
+            self._cancel_all_orders(symbol, state)
+            return state
+        
+        # Obtenir les données de marché actuelles
+        market_data = self._get_ticker_fast(symbol)
+        if not market_data:
+            state["errors"] += 1
+            _log.warning("Données de marché non disponibles pour %s", symbol)
+            return state
+        
+        # Calculer les prix des ordres
+        order_prices = self._calculate_order_prices(symbol, market_data, tick)
+        if order_prices is None:
+            _log.warning("Cotations croisées pour %s, placement ignoré pour ce cycle", symbol)
+            return state
+        
+        # Vérifier les limites de position
+        if abs(current_position) >= self.max_position:
+            _log.warning("Position maximale atteinte pour %s: %s", symbol, current_position)
+            # Annuler les ordres du côté qui augmenterait la position
+            if current_position > 0:
+                self._cancel_orders_by_side(symbol, "buy", state)
+            else:
+                self._cancel_orders_by_side(symbol, "sell", state)
+        
+        # Annuler les ordres existants si nécessaire
+        if self._should_refresh_orders(state, order_prices):
+            self._cancel_all_orders(symbol, state)
+        
+        # Placer de nouveaux ordres
+        self._place_orders(symbol, order_prices, state)
+        
+        if self._debug_enabled:
+            _log.debug("Stratégie exécutée pour %s", symbol)
+        return state
+    
+    def _symbol_state(self, symbol: str) -> Dict[str, Any]:
+        """
+        Copie l'état d'un symbole pour un traitement hors du thread appelant.
+        
+        Args:
+            symbol: Symbole de l'actif.
+            
+        Returns:
+            Dictionnaire contenant les ordres actifs ('orders'), leurs clés de tri ('keys')
+            et le nombre d'échecs du cycle ('errors').
+        """
+        orders = self.active_orders.get(symbol, {})
+        keys = self._order_keys.get(symbol, {})
+        return {
+            "orders": {side: list(orders.get(side, ())) for side in ("buy", "sell")},
+            "keys": {side: array("d", keys.get(side, ())) for side in ("buy", "sell")},
+            "errors": 0
+        }
+    
+    def _merge_symbol_state(self, i: int, symbol: str, state: Dict[str, Any]):
+        """
+        Reporte l'état d'un symbole traité dans l'état partagé de la stratégie.
+        
+        Args:
+            i: Indice du symbole dans les tableaux d'état.
+            symbol: Symbole de l'actif.
+            state: État retourné par _execute_symbol.
+        """
+        self.active_orders[symbol] = state["orders"]
+        self._order_keys[symbol] = state["keys"]
+        self._error_count[i] += state["errors"]
+    
+    def _new_symbol_executor(self) -> ThreadPoolExecutor:
+        """
+        Crée le pool de threads de traitement des symboles, dimensionné sur les symboles suivis.
+        
+        Returns:
+            Pool de threads (les threads ne sont démarrés qu'à la première tâche).
+        """
+        return ThreadPoolExecutor(
+            max_workers=max(1, len(self.symbols)),
+            thread_name_prefix=f"mm_{self.strategy_id}"
+        )
+    
+    def stop(self):
+        """
+        Arrête la stratégie et libère le pool de threads des symboles.
+        """
+        super().stop()
+        if self.symbol_executor is not None:
+            self.symbol_executor.shutdown(wait=True)
+            self.symbol_executor = None
+    
+    def start(self):
+        """
+        Démarre la stratégie, en réévaluant le niveau de journalisation configuré depuis sa création.
+        """
+        self.refresh_log_level()
+        super().start()
+    
+    def refresh_log_level(self):
+        """
+        Réévalue si les messages de niveau DEBUG sont émis.
+        
+        À appeler après une reconfiguration du niveau de journalisation.
+        """
+        self._debug_enabled = _log.isEnabledFor(logging.DEBUG)
+    
+    def _index_symbols(self):
+        """
+        Construit l'index symbole -> position dans les tableaux d'état.
+        
+        Les valeurs déjà connues sont conservées pour les symboles toujours suivis.
+        """
+        old_idx = self._sym_idx
+        last_refresh = np.zeros(len(self.symbols))
+        positions = np.zeros(len(self.symbols))
+        error_count = np.zeros(len(self.symbols), dtype=np.int64)
+        
+        for i, symbol in enumerate(self.symbols):
+            j = old_idx.get(symbol)
+            if j is not None:
+                last_refresh[i] = self._last_refresh[j]
+                positions[i] = self._positions[j]
+                error_count[i] = self._error_count[j]
+        
+        self._sym_idx = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self._last_refresh = last_refresh
+        self._positions = positions
+        self._error_count = error_count
+    
+    def update_config(self, config: Dict[str, Any]):
+        """
+        Met à jour la configuration de la stratégie.
+        
+        Args:
+            config: Nouvelle configuration.
+        """
+        super().update_config(config)
+        self._index_symbols()
+        
+        # Redimensionner le pool de threads sur la nouvelle liste de symboles
+        old_executor = self.symbol_executor
+        self.symbol_executor = self._new_symbol_executor()
+        if old_executor is not None:
+            old_executor.shutdown(wait=True)
     
     def update(self):
         """
@@ -137,9 +338,12 @@ class MarketMakingStrategy(BaseStrategy):
         for symbol in self.symbols:
             self.execute()
     
-    def _get_market_data(self, symbol: str) -> Optional[Dict[str, Any]]:
+    def _get_ticker_fast(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
-        Obtient les données de marché actuelles pour un symbole.
+        Obtient les données de marché du ticker pour un symbole.
+        
+        Seul le ticker est récupéré: le carnet d'ordres n'est pas nécessaire
+        au calcul des prix.
         
         Args:
             symbol: Symbole de l'actif.
@@ -148,7 +352,7 @@ class MarketMakingStrategy(BaseStrategy):
             Dictionnaire contenant les données de marché ou None si non disponibles.
         """
         if not self.market_data_manager:
-            logger.warning("Gestionnaire de données de marché non disponible")
+            _log.warning("Gestionnaire de données de marché non disponible")
             return None
         
         try:
@@ -157,14 +361,6 @@ class MarketMakingStrategy(BaseStrategy):
             if not ticker:
                 return None
             
-            # Obtenir le carnet d'ordres
-            order_book = self.market_data_manager.get_order_book(symbol)
-            if not order_book:
-                return None
-            
-            # Stocker un instantané du carnet d'ordres
-            self.order_book_snapshots[symbol] = order_book
-            
             # Extraire les informations pertinentes
             mid_price = (ticker["bid"] + ticker["ask"]) / 2
             bid_price = ticker["bid"]
@@ -176,212 +372,258 @@ class MarketMakingStrategy(BaseStrategy):
                 "bid_price": bid_price,
                 "ask_price": ask_price,
                 "current_spread": current_spread,
-                "order_book": order_book,
                 "timestamp": time.time()
             }
             
         except Exception as e:
-            logger.error(f"Erreur lors de l'obtention des données de marché pour {symbol}: {str(e)}")
+            _log.error("Erreur lors de l'obtention des données de marché pour %s: %s", symbol, e)
             return None
     
-    def _calculate_order_prices(self, symbol: str, market_data: Dict[str, Any]) -> Dict[str, List[float]]:
+    def _calculate_order_prices(self, symbol: str, market_data: Dict[str, Any],
+                                tick: Optional[float] = None) -> Optional[Dict[str, List[float]]]:
         """
         Calcule les prix des ordres à placer.
         
+        Les prix sont bornés par le meilleur bid/ask du marché afin de ne jamais
+        croiser ni égaler un niveau existant du carnet.
+        
         Args:
             symbol: Symbole de l'actif.
             market_data: Données de marché actuelles.
+            tick: Pas de cotation du symbole (obtenu via _get_tick_size si absent).
             
         Returns:
-            Dictionnaire contenant les prix des ordres d'achat et de vente.
+            Dictionnaire contenant les prix des ordres d'achat et de vente,
+            ou None si les cotations se croisent après bornage.
         """
         mid_price = market_data["mid_price"]
         
-        # Calculer les prix des ordres d'achat
-        bid_prices = []
-        for i in range(self.order_count):
-            # Spread progressif pour les ordres plus éloignés
-            spread_factor = 1 + i * 0.5  # Augmenter le spread pour les ordres plus éloignés
-            bid_spread = self.spread_bid * spread_factor
-            bid_price = mid_price * (1 - bid_spread / 100)
-            bid_prices.append(bid_price)
-        
-        # Calculer les prix des ordres de vente
-        ask_prices = []
-        for i in range(self.order_count):
-            # Spread progressif pour les ordres plus éloignés
-            spread_factor = 1 + i * 0.5  # Augmenter le spread pour les ordres plus éloignés
-            ask_spread = self.spread_ask * spread_factor
-            ask_price = mid_price * (1 + ask_spread / 100)
-            ask_prices.append(ask_price)
+        # Spread progressif pour les ordres plus éloignés
+        spread_factors = 1 + np.arange(self.order_count) * 0.5
+        bid_prices = mid_price * (1 - self.spread_bid * spread_factors / 100)
+        ask_prices = mid_price * (1 + self.spread_ask * spread_factors / 100)
+        
+        # Arrondir au pas de cotation: achats vers le bas, ventes vers le haut
+        if tick is None:
+            tick = self._get_tick_size(symbol)
+        if tick:
+            bid_prices = np.round(np.floor(np.round(bid_prices / tick, 8)) * tick, 12)
+            ask_prices = np.round(np.ceil(np.round(ask_prices / tick, 8)) * tick, 12)
+        
+        # Rester au moins un pas derrière le meilleur bid/ask du marché (un écart
+        # minimal si le pas est inconnu, pour ne jamais égaler le meilleur niveau)
+        step = tick or _MIN_PRICE_STEP
+        bid_prices = np.minimum(bid_prices, market_data["bid_price"] - step)
+        ask_prices = np.maximum(ask_prices, market_data["ask_price"] + step)
+        if tick:
+            bid_prices = np.round(bid_prices, 12)
+            ask_prices = np.round(ask_prices, 12)
+        
+        # Ne rien placer si le meilleur achat atteint la meilleure vente
+        if self.order_count and bid_prices[0] >= ask_prices[0]:
+            return None
         
         return {
-            "bid_prices": bid_prices,
-            "ask_prices": ask_prices
+            "bid_prices": bid_prices.tolist(),
+            "ask_prices": ask_prices.tolist()
         }
     
-    def _should_refresh_orders(self, symbol: str, new_order_prices: Dict[str, List[float]]) -> bool:
+    def _get_tick_size(self, symbol: str) -> float:
         """
-        Détermine si les ordres existants doivent être rafraîchis.
+        Obtient le pas de cotation d'un symbole, mis en cache après la première requête.
         
         Args:
             symbol: Symbole de l'actif.
+            
+        Returns:
+            Pas de cotation, ou 0.0 s'il n'est pas connu.
+        """
+        tick = self._tick_size.get(symbol)
+        if tick is None:
+            tick = 0.0
+            if self.order_executor:
+                tick = self.order_executor.get_price_increment(symbol) or 0.0
+            self._tick_size[symbol] = tick
+        return tick
+    
+    def _should_refresh_orders(self, state: Dict[str, Any], new_order_prices: Dict[str, List[float]]) -> bool:
+        """
+        Détermine si les ordres existants doivent être rafraîchis.
+        
+        Args:
+            state: État du symbole (voir _symbol_state).
             new_order_prices: Nouveaux prix des ordres calculés.
             
         Returns:
             True si les ordres doivent être rafraîchis, False sinon.
         """
+        # Obtenir les ordres actifs
+        active_orders = state["orders"]
+        keys = state["keys"]
+        
         # Si aucun ordre actif, rafraîchir
-        if symbol not in self.active_orders or not self.active_orders[symbol]:
+        if not active_orders["buy"] and not active_orders["sell"]:
             return True
         
-        # Obtenir les ordres actifs
-        active_orders = self.active_orders[symbol]
-        
         # Vérifier si le nombre d'ordres a changé
-        if len(active_orders.get("buy", [])) != len(new_order_prices["bid_prices"]) or \
-           len(active_orders.get("sell", [])) != len(new_order_prices["ask_prices"]):
+        bid_prices = new_order_prices["bid_prices"]
+        ask_prices = new_order_prices["ask_prices"]
+        if len(active_orders["buy"]) != len(bid_prices) or len(active_orders["sell"]) != len(ask_prices):
             return True
         
-        # Vérifier si les prix ont changé significativement
-        price_threshold = 0.1  # 0.1% de changement de prix
-        
-        for i, order in enumerate(active_orders.get("buy", [])):
-            if i >= len(new_order_prices["bid_prices"]):
-                break
-            old_price = order["price"]
-            new_price = new_order_prices["bid_prices"][i]
-            price_diff = abs(old_price - new_price) / old_price * 100
-            if price_diff > price_threshold:
+        # Vérifier si les prix ont changé significativement (0.1% de changement),
+        # en s'arrêtant au premier niveau ayant dérivé. Les clés étant triées dans
+        # le même ordre que les nouveaux prix, la comparaison se fait niveau par niveau.
+        price_threshold = 0.001
+        for old_key, new_price in zip(keys["buy"], bid_prices):
+            if abs(new_price + old_key) > -old_key * price_threshold:
                 return True
-        
-        for i, order in enumerate(active_orders.get("sell", [])):
-            if i >= len(new_order_prices["ask_prices"]):
-                break
-            old_price = order["price"]
-            new_price = new_order_prices["ask_prices"][i]
-            price_diff = abs(old_price - new_price) / old_price * 100
-            if price_diff > price_threshold:
+        for old_price, new_price in zip(keys["sell"], ask_prices):
+            if abs(old_price - new_price) > old_price * price_threshold:
                 return True
         
         return False
     
-    def _cancel_all_orders(self, symbol: str):
+    def _cancel_all_orders(self, symbol: str, state: Dict[str, Any]):
         """
         Annule tous les ordres actifs pour un symbole.
         
         Args:
             symbol: Symbole de l'actif.
+            state: État du symbole (voir _symbol_state), réinitialisé après annulation.
         """
         if not self.order_executor:
-            logger.warning("Exécuteur d'ordres non disponible")
-            return
-        
-        if symbol not in self.active_orders:
+            _log.warning("Exécuteur d'ordres non disponible")
             return
         
         try:
             # Annuler tous les ordres d'achat
-            for order in self.active_orders[symbol].get("buy", []):
+            for order in state["orders"]["buy"]:
                 self.order_executor.cancel_order(symbol, order["id"])
             
             # Annuler tous les ordres de vente
-            for order in self.active_orders[symbol].get("sell", []):
+            for order in state["orders"]["sell"]:
                 self.order_executor.cancel_order(symbol, order["id"])
             
             # Réinitialiser les ordres actifs
-            self.active_orders[symbol] = {"buy": [], "sell": []}
+            state["orders"] = {"buy": [], "sell": []}
+            state["keys"] = {"buy": array("d"), "sell": array("d")}
             
-            logger.debug(f"Tous les ordres annulés pour {symbol}")
+            if self._debug_enabled:
+                _log.debug("Tous les ordres annulés pour %s", symbol)
             
         except Exception as e:
-            logger.error(f"Erreur lors de l'annulation des ordres pour {symbol}: {str(e)}")
+            _log.error("Erreur lors de l'annulation des ordres pour %s: %s", symbol, e)
     
-    def _cancel_orders_by_side(self, symbol: str, side: str):
+    def _cancel_orders_by_side(self, symbol: str, side: str, state: Dict[str, Any]):
         """
         Annule tous les ordres actifs d'un côté spécifique pour un symbole.
         
         Args:
             symbol: Symbole de l'actif.
             side: Côté des ordres à annuler ('buy' ou 'sell').
+            state: État du symbole (voir _symbol_state), réinitialisé après annulation.
         """
         if not self.order_executor:
-            logger.warning("Exécuteur d'ordres non disponible")
-            return
-        
-        if symbol not in self.active_orders or side not in self.active_orders[symbol]:
+            _log.warning("Exécuteur d'ordres non disponible")
             return
         
         try:
             # Annuler tous les ordres du côté spécifié
-            for order in self.active_orders[symbol][side]:
+            for order in state["orders"][side]:
                 self.order_executor.cancel_order(symbol, order["id"])
             
             # Réinitialiser les ordres actifs du côté spécifié
-            self.active_orders[symbol][side] = []
+            state["orders"][side] = []
+            state["keys"][side] = array("d")
             
-            logger.debug(f"Ordres {side} annulés pour {symbol}")
+            if self._debug_enabled:
+                _log.debug("Ordres %s annulés pour %s", side, symbol)
             
         except Exception as e:
-            logger.error(f"Erreur lors de l'annulation des ordres {side} pour {symbol}: {str(e)}")
+            _log.error("Erreur lors de l'annulation des ordres %s pour %s: %s", side, symbol, e)
     
-    def _place_orders(self, symbol: str, order_prices: Dict[str, List[float]]):
+    def _place_orders(self, symbol: str, order_prices: Dict[str, List[float]], state: Dict[str, Any]):
         """
         Place de nouveaux ordres pour un symbole.
         
         Args:
             symbol: Symbole de l'actif.
             order_prices: Prix des ordres à placer.
+            state: État du symbole (voir _symbol_state), complété des ordres placés.
         """
         if not self.order_executor:
-            logger.warning("Exécuteur d'ordres non disponible")
+            _log.warning("Exécuteur d'ordres non disponible")
             return
         
-        # Initialiser les ordres actifs si nécessaire
-        if symbol not in self.active_orders:
-            self.active_orders[symbol] = {"buy": [], "sell": []}
+        # Construire les ordres d'achat puis de vente; les limites de position sont
+        # vérifiées une seule fois, par l'exécuteur d'ordres
+        order_size = self.order_size
+        batch = [
+            {"side": side, "type": "limit", "amount": order_size, "price": price}
+            for side, prices in (("buy", order_prices["bid_prices"]), ("sell", order_prices["ask_prices"]))
+            for price in prices
+        ]
         
         try:
-            # Placer les ordres d'achat
-            for price in order_prices["bid_prices"]:
-                # Vérifier les limites de position pour les achats
-                if self.risk_manager and not self.risk_manager.check_position_limit(symbol, "buy", self.order_size):
-                    logger.warning(f"Limite de position atteinte pour les achats sur {symbol}")
-                    break
-                
-                order = self.order_executor.place_order(
-                    symbol=symbol,
-                    side="buy",
-                    order_type="limit",
-                    amount=self.order_size,
-                    price=price
-                )
-                
-                if order:
-                    self.active_orders[symbol]["buy"].append(order)
-                    logger.debug(f"Ordre d'achat placé pour {symbol} à {price:.8f}")
-            
-            # Placer les ordres de vente
-            for price in order_prices["ask_prices"]:
-                # Vérifier les limites de position pour les ventes
-                if self.risk_manager and not self.risk_manager.check_position_limit(symbol, "sell", self.order_size):
-                    logger.warning(f"Limite de position atteinte pour les ventes sur {symbol}")
-                    break
-                
-                order = self.order_executor.place_order(
-                    symbol=symbol,
-                    side="sell",
-                    order_type="limit",
-                    amount=self.order_size,
-                    price=price
-                )
-                
-                if order:
-                    self.active_orders[symbol]["sell"].append(order)
-                    logger.debug(f"Ordre de vente placé pour {symbol} à {price:.8f}")
+            # Placer tous les ordres en une seule requête
+            for order in self.order_executor.place_batch(symbol, batch):
+                self._insert_order(state, order)
+                if self._debug_enabled:
+                    side_label = "d'achat" if order["side"] == "buy" else "de vente"
+                    _log.debug("Ordre %s placé pour %s à %.8f", side_label, symbol, order["price"])
             
         except Exception as e:
-            logger.error(f"Erreur lors du placement des ordres pour {symbol}: {str(e)}")
+            _log.error("Erreur lors du placement des ordres pour %s: %s", symbol, e)
+    
+    def _insert_order(self, state: Dict[str, Any], order: Dict[str, Any]):
+        """
+        Insère un ordre actif à sa place dans le côté trié correspondant.
+        
+        Les achats sont classés par prix décroissant et les ventes par prix croissant,
+        le niveau le plus compétitif restant ainsi toujours en tête de liste.
+        
+        Args:
+            state: État du symbole (voir _symbol_state).
+            order: Ordre placé.
+        """
+        side = order["side"]
+        key = -order["price"] if side == "buy" else order["price"]
+        keys = state["keys"][side]
+        pos = bisect_right(keys, key)
+        keys.insert(pos, key)
+        state["orders"][side].insert(pos, order)
+    
+    def remove_filled_order(self, symbol: str, order: Dict[str, Any]) -> bool:
+        """
+        Retire un ordre exécuté des ordres actifs.
+        
+        Args:
+            symbol: Symbole de l'actif.
+            order: Ordre exécuté (doit contenir 'id', 'side' et 'price').
+            
+        Returns:
+            True si l'ordre a été retiré, False s'il n'était pas suivi.
+        """
+        side = order["side"]
+        keys = self._order_keys.get(symbol, {}).get(side)
+        if not keys:
+            return False
+        
+        key = -order["price"] if side == "buy" else order["price"]
+        orders = self.active_orders[symbol][side]
+        order_id = order["id"]
+        
+        # Parcourir uniquement les ordres partageant le même prix
+        pos = bisect_left(keys, key)
+        while pos < len(keys) and keys[pos] == key:
+            if orders[pos]["id"] == order_id:
+                del keys[pos]
+                del orders[pos]
+                return True
+            pos += 1
+        
+        return False
     
     def update_parameters(self, parameters: Dict[str, Any]):
         """
@@ -436,6 +678,7 @@ class MarketMakingStrategy(BaseStrategy):
             "strategy_id": self.strategy_id,
             "symbols": self.symbols,
             "active_orders": self.active_orders,
-            "positions": self.positions,
+            "positions": {symbol: float(self._positions[i]) for symbol, i in self._sym_idx.items()},
+            "error_counts": {symbol: int(self._error_count[i]) for symbol, i in self._sym_idx.items()},
             "parameters": self.get_parameters()
         }
@@ -8,15 +8,28 @@ Cette stratégie recherche des opportunités d'arbitrage statistique entre des p
 d'actifs corrélés, en exploitant les déviations temporaires de leur relation historique.
 """
 
+import itertools
+import math
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 from typing import Dict, Any, List, Optional, Tuple, Union
 from loguru import logger
-from datetime import datetime, timedelta
+from datetime import datetime
 
 from src.strategies.base_strategy import BaseStrategy
 from src.market_data.market_data_manager import MarketDataManager
 
+# Directions des positions, stockées en entiers (signe appliqué au spread)
+DIR_LONG = 1
+DIR_SHORT = -1
+_DIRECTION_NAMES = {DIR_LONG: "long", DIR_SHORT: "short"}
+
+# Nombre de bougies par jour pour chaque intervalle
+_CANDLES_PER_DAY = {"1m": 1440, "5m": 288, "15m": 96, "1h": 24, "4h": 6, "1d": 1}
+
 
 class StatisticalArbitrageStrategy(BaseStrategy):
     """
@@ -48,12 +61,55 @@ class StatisticalArbitrageStrategy(BaseStrategy):
         self.profit_target_pct = self.config.get("profit_target_pct", 0.02)  # Objectif de profit en %
         self.stop_loss_pct = self.config.get("stop_loss_pct", 0.05)  # Stop loss en %
         self.timeframe = self.config.get("timeframe", "1h")  # Intervalle des données
+        self.kalman_delta = self.config.get("kalman_delta", 1e-4)  # Bruit de processus du filtre de Kalman, relatif à la covariance initiale
+        self.kalman_reset_tolerance = self.config.get("kalman_reset_tolerance", 0.5)  # Écart relatif toléré entre la pente filtrée et la régression complète
         self.rebalance_interval = self.config.get("rebalance_interval", 24)  # Intervalle de rééquilibrage en heures
+        self.prefetch_workers = self.config.get("prefetch_workers", 8)  # Requêtes d'historique simultanées au maximum
+        
+        # Nombre de bougies couvrant la période d'historique (100 pour un intervalle inconnu)
+        candles_per_day = _CANDLES_PER_DAY.get(self.timeframe)
+        self._candle_limit = candles_per_day * self.lookback_period if candles_per_day else 100
         
         # État interne
         self.pair_models = {}  # Modèles pour chaque paire
+        self._symbols_by_exchange = {}  # Symboles suivis, regroupés par exchange
+        
+        # Paramètres des modèles en tableaux parallèles (un indice par paire)
+        self._pair_ids = []
+        self._pair_index = {}
+        self._asset1_keys = []
+        self._asset2_keys = []
+        self._slopes = np.zeros(0)
+        self._intercepts = np.zeros(0)
+        self._means = np.zeros(0)
+        self._stds = np.zeros(0)
         self.active_positions = {}  # Positions actives
-        self.last_rebalance_time = datetime.now()
+        
+        # Champs des positions lus à chaque cycle, en tableaux parallèles. Les positions
+        # ouvertes occupent de façon contiguë les emplacements [0, _n_active)
+        self._pos_dir = np.zeros(self.max_positions, dtype=np.int8)  # DIR_LONG ou DIR_SHORT
+        self._pos_pair = np.zeros(self.max_positions, dtype=np.intp)  # Indice de la paire dans les tableaux des modèles
+        self._pos_entry_spread = np.zeros(self.max_positions)
+        self._pos_entry_z = np.zeros(self.max_positions)
+        self._pos_target = np.zeros(self.max_positions)  # Z-score cible
+        self._pos_stop = np.zeros(self.max_positions)  # Z-score de stop loss, déjà orienté
+        self._pos_amount1 = np.zeros(self.max_positions)
+        self._pos_amount2 = np.zeros(self.max_positions)
+        self._pos_entry1 = np.zeros(self.max_positions)  # Prix d'entrée de asset1
+        self._pos_entry2 = np.zeros(self.max_positions)  # Prix d'entrée de asset2
+        self._pos_ids = []  # Emplacement -> identifiant de paire
+        self._pos_idx = {}  # Identifiant de paire -> emplacement
+        self._n_active = 0
+        
+        self._order_counter = itertools.count()  # Numérotation des ordres de la stratégie
+        
+        # Pool de threads de récupération des historiques, créé à la première requête groupée
+        self.prefetch_executor = None
+        
+        # Intervalles en secondes, comparés à time.monotonic()
+        self._rebalance_interval_s = self.rebalance_interval * 3600
+        self._model_refresh_s = 24 * 3600
+        self._last_rebalance_ts = time.monotonic()
         
         # Initialiser les modèles
         self._initialize_models()
@@ -64,93 +120,229 @@ class StatisticalArbitrageStrategy(BaseStrategy):
         """
         Initialise les modèles pour chaque paire.
         """
+        # Un actif présent dans plusieurs paires n'est récupéré qu'une fois, et tous
+        # les historiques sont récupérés simultanément
+        requests = []
+        for pair_config in self.pairs:
+            requests.append((pair_config["asset1"], pair_config.get("exchange1"), None))
+            requests.append((pair_config["asset2"], pair_config.get("exchange2"), None))
+        prices_cache = self._prefetch_prices(requests)
+        now_ts = time.monotonic()
+        
+        # Regrouper les paires partageant le même actif X (et la même longueur de
+        # données) pour estimer leurs régressions en un seul calcul matriciel
+        groups = {}
         for pair_config in self.pairs:
+            pair_id = f"{pair_config['asset1']}_{pair_config['asset2']}"
             try:
-                pair_id = f"{pair_config['asset1']}_{pair_config['asset2']}"
-                
                 # Récupérer les données historiques
-                asset1_prices = self._get_historical_prices(pair_config["asset1"], pair_config.get("exchange1"))
-                asset2_prices = self._get_historical_prices(pair_config["asset2"], pair_config.get("exchange2"))
+                asset1_candles = self._get_cached_prices(prices_cache, pair_config["asset1"], pair_config.get("exchange1"))
+                asset2_candles = self._get_cached_prices(prices_cache, pair_config["asset2"], pair_config.get("exchange2"))
                 
-                if asset1_prices is None or asset2_prices is None:
+                if asset1_candles is None or asset2_candles is None:
                     logger.warning(f"Données insuffisantes pour la paire {pair_id}, modèle non initialisé")
                     continue
                 
-                # Calculer la régression linéaire
-                slope, intercept, correlation = self._calculate_regression(asset1_prices, asset2_prices)
+                # Les mises à jour reprendront après la dernière bougie consommée
+                n = min(len(asset1_candles), len(asset2_candles))
+                last_ms = int(min(asset1_candles[-1, 0], asset2_candles[-1, 0])) + 1
+                key = (pair_config["asset1"], pair_config.get("exchange1"), n)
+                groups.setdefault(key, []).append((pair_id, pair_config, asset2_candles[-n:, 1], last_ms))
                 
-                # Calculer la série de spread
-                spread_series = self._calculate_spread_series(asset1_prices, asset2_prices, slope, intercept)
+            except Exception as e:
+                logger.error(f"Erreur lors de l'initialisation du modèle pour la paire {pair_config}: {str(e)}")
+        
+        for (asset1, exchange1, n), members in groups.items():
+            try:
+                x = np.ascontiguousarray(prices_cache[(asset1, exchange1, None)][-n:, 1])
+                y = np.column_stack([asset2_prices for _, _, asset2_prices, _ in members])
                 
-                # Calculer les statistiques du spread
-                spread_mean = np.mean(spread_series)
-                spread_std = np.std(spread_series)
+                # Calculer les régressions linéaires de tout le groupe
+                slopes, intercepts, correlations = self._calculate_regression_batch(x, y)
                 
-                # Stocker le modèle
-                self.pair_models[pair_id] = {
-                    "asset1": pair_config["asset1"],
-                    "asset2": pair_config["asset2"],
-                    "exchange1": pair_config.get("exchange1"),
-                    "exchange2": pair_config.get("exchange2"),
-                    "slope": slope,
-                    "intercept": intercept,
-                    "correlation": correlation,
-                    "spread_mean": spread_mean,
-                    "spread_std": spread_std,
-                    "last_update": datetime.now()
-                }
+                # Inverse de la matrice normale, commune au groupe, pour la covariance initiale du filtre
+                xtx_inv = np.linalg.pinv(np.array(((float(n), x.sum()), (x.sum(), float(np.dot(x, x))))))
                 
-                logger.info(f"Modèle initialisé pour la paire {pair_id} avec corrélation {correlation:.2f}")
+                # Calculer les séries de spread et leurs statistiques
+                spreads = y - (x[:, None] * slopes + intercepts)
+                spread_means = spreads.mean(axis=0)
+                spread_stds = spreads.std(axis=0)
+                
+                for k, (pair_id, pair_config, asset2_prices, last_ms) in enumerate(members):
+                    spread_series = spreads[:, k]
+                    correlation = float(correlations[k])
+                    
+                    # État initial du filtre de Kalman: covariance de l'estimation des moindres carrés
+                    spread_var = float(spread_stds[k]) ** 2 or 1.0
+                    kalman_P0 = spread_var * xtx_inv
+                    
+                    # Stocker le modèle
+                    self.pair_models[pair_id] = {
+                        "asset1": asset1,
+                        "asset2": pair_config["asset2"],
+                        "exchange1": exchange1,
+                        "exchange2": pair_config.get("exchange2"),
+                        "asset1_prices": x,
+                        "asset2_prices": asset2_prices,
+                        "slope": float(slopes[k]),
+                        "intercept": float(intercepts[k]),
+                        "correlation": correlation,
+                        "spread_mean": float(spread_means[k]),
+                        "spread_std": float(spread_stds[k]),
+                        # Fenêtre glissante du spread et sommes courantes pour la mise à jour incrémentale
+                        "spread_buffer": deque(spread_series.tolist(), maxlen=n),
+                        "sum_s": float(spread_series.sum()),
+                        "sum_s2": float(np.dot(spread_series, spread_series)),
+                        # Filtre de Kalman sur (intercept, slope): covariance, bruit d'observation et de processus
+                        "kalman_P": kalman_P0,
+                        "kalman_P0": kalman_P0,
+                        "kalman_R": spread_var,
+                        "kalman_Q": self.kalman_delta * kalman_P0,
+                        "last_update_ts": now_ts,  # Horloge monotone, pour l'intervalle de mise à jour
+                        "last_update_ms": last_ms  # Après la dernière bougie consommée, pour les bougies suivantes
+                    }
+                    
+                    logger.info(f"Modèle initialisé pour la paire {pair_id} avec corrélation {correlation:.2f}")
                 
             except Exception as e:
-                logger.error(f"Erreur lors de l'initialisation du modèle pour la paire {pair_config}: {str(e)}")
+                logger.error(f"Erreur lors de l'initialisation des modèles des paires sur {asset1}: {str(e)}")
+        
+        self._index_symbols()
+        self._pack_models()
     
-    def _get_historical_prices(self, symbol: str, exchange_id: Optional[str] = None) -> Optional[List[float]]:
+    def _pack_models(self):
+        """
+        Recopie les paramètres des modèles dans des tableaux parallèles.
+        
+        À appeler dès que pair_models change, afin que les Z-scores de toutes
+        les paires soient évalués en une seule opération vectorielle.
+        """
+        models = self.pair_models
+        self._pair_ids = list(models)
+        self._pair_index = {pair_id: i for i, pair_id in enumerate(self._pair_ids)}
+        self._asset1_keys = [(m["asset1"], m.get("exchange1")) for m in models.values()]
+        self._asset2_keys = [(m["asset2"], m.get("exchange2")) for m in models.values()]
+        self._slopes = np.fromiter((m["slope"] for m in models.values()), dtype=np.float64, count=len(models))
+        self._intercepts = np.fromiter((m["intercept"] for m in models.values()), dtype=np.float64, count=len(models))
+        self._means = np.fromiter((m["spread_mean"] for m in models.values()), dtype=np.float64, count=len(models))
+        self._stds = np.fromiter((m["spread_std"] for m in models.values()), dtype=np.float64, count=len(models))
+    
+    def _index_symbols(self):
+        """
+        Regroupe par exchange les symboles des paires modélisées, sans doublon.
+        """
+        symbols_by_exchange = {}
+        for model in self.pair_models.values():
+            for symbol, exchange_id in ((model["asset1"], model.get("exchange1")),
+                                        (model["asset2"], model.get("exchange2"))):
+                symbols = symbols_by_exchange.setdefault(exchange_id, [])
+                if symbol not in symbols:
+                    symbols.append(symbol)
+        
+        self._symbols_by_exchange = symbols_by_exchange
+    
+    def _prefetch_prices(self, requests: List[Tuple[str, Optional[str], Optional[int]]]) -> Dict[Tuple, Optional[np.ndarray]]:
+        """
+        Récupère simultanément les prix historiques de plusieurs symboles.
+        
+        Les appels bloquants au gestionnaire de données sont répartis sur le pool de
+        threads de la stratégie, limité à prefetch_workers requêtes simultanées pour
+        ne pas dépasser les limites de débit des exchanges.
+        
+        Args:
+            requests: Liste de tuples (symbole, exchange, since); les doublons sont ignorés.
+            
+        Returns:
+            Cache des prix indexé par (symbole, exchange, since), utilisable par _get_cached_prices.
+        """
+        keys = list(dict.fromkeys(requests))
+        
+        # Pas de pool pour une seule requête
+        if len(keys) <= 1:
+            return {key: self._get_historical_prices(key[0], key[1], since=key[2]) for key in keys}
+        
+        # Le pool ne démarre ses threads qu'à la demande: min(len(keys), prefetch_workers) au plus
+        if self.prefetch_executor is None:
+            self.prefetch_executor = ThreadPoolExecutor(
+                max_workers=max(1, self.prefetch_workers),
+                thread_name_prefix=f"arb_{self.strategy_id}"
+            )
+        results = self.prefetch_executor.map(lambda key: self._get_historical_prices(key[0], key[1], since=key[2]), keys)
+        return dict(zip(keys, results))
+    
+    def stop(self):
+        """
+        Arrête la stratégie et libère le pool de threads de récupération des historiques.
+        """
+        super().stop()
+        if self.prefetch_executor is not None:
+            self.prefetch_executor.shutdown(wait=True)
+            self.prefetch_executor = None
+    
+    def _get_cached_prices(self, prices_cache: Dict[Tuple, Optional[np.ndarray]], symbol: str,
+                           exchange_id: Optional[str] = None, since: Optional[int] = None) -> Optional[np.ndarray]:
+        """
+        Récupère les prix historiques d'un symbole en les mémorisant pour la durée d'un rafraîchissement.
+        
+        Args:
+            prices_cache: Cache local au rafraîchissement en cours.
+            symbol: Symbole de l'actif.
+            exchange_id: Identifiant de l'exchange.
+            since: Horodatage en millisecondes à partir duquel récupérer les bougies.
+            
+        Returns:
+            Tableau (N, 2) des horodatages et des prix de clôture, ou None si non disponible.
+        """
+        key = (symbol, exchange_id, since)
+        if key not in prices_cache:
+            prices_cache[key] = self._get_historical_prices(symbol, exchange_id, since=since)
+        return prices_cache[key]
+    
+    def _get_historical_prices(self, symbol: str, exchange_id: Optional[str] = None,
+                               since: Optional[int] = None) -> Optional[np.ndarray]:
         """
         Récupère les prix historiques pour un symbole.
         
+        Seules les bougies clôturées sont retournées: la bougie en cours n'est
+        consommée qu'une fois sa clôture connue.
+        
         Args:
             symbol: Symbole de l'actif.
             exchange_id: Identifiant de l'exchange.
+            since: Horodatage en millisecondes transmis à l'exchange. Si fourni, seules les
+                bougies ouvertes depuis sont récupérées, sans minimum de points.
             
         Returns:
-            Liste des prix historiques, ou None si non disponible.
+            Tableau (N, 2) des horodatages d'ouverture et des prix de clôture, ou None si non disponible.
         """
         try:
-            # Calculer le nombre de bougies nécessaires
-            candle_intervals = {
-                "1m": 60 * 24 * self.lookback_period,
-                "5m": 12 * 24 * self.lookback_period,
-                "15m": 4 * 24 * self.lookback_period,
-                "1h": 24 * self.lookback_period,
-                "4h": 6 * self.lookback_period,
-                "1d": self.lookback_period
-            }
-            
-            limit = candle_intervals.get(self.timeframe, 100)
-            
-            # Récupérer les bougies
+            # Récupérer les bougies sous forme de tableau OHLCV (N, 6)
             candles = self.market_data_manager.get_recent_candles(
                 symbol=symbol,
                 interval=self.timeframe,
-                limit=limit,
-                exchange_id=exchange_id
+                limit=self._candle_limit,
+                exchange_id=exchange_id,
+                since=since,
+                as_array=True,
+                closed_only=True
             )
             
-            if not candles or len(candles) < 30:  # Minimum 30 points de données
-                logger.warning(f"Données insuffisantes pour {symbol}")
+            if candles is None:
                 return None
             
-            # Extraire les prix de clôture
-            prices = [candle["close"] for candle in candles]
+            # Sans since, un minimum de 30 points de données est requis
+            if since is None and len(candles) < 30:
+                logger.warning(f"Données insuffisantes pour {symbol}")
+                return None
             
-            return prices
+            # Extraire les horodatages et les prix de clôture
+            return candles[:, [0, 4]]
             
         except Exception as e:
             logger.error(f"Erreur lors de la récupération des prix historiques pour {symbol}: {str(e)}")
             return None
     
-    def _calculate_regression(self, x_prices: List[float], y_prices: List[float]) -> Tuple[float, float, float]:
+    def _calculate_regression(self, x_prices: np.ndarray, y_prices: np.ndarray) -> Tuple[float, float, float]:
         """
         Calcule la régression linéaire entre deux séries de prix.
         
@@ -167,19 +359,49 @@ class StatisticalArbitrageStrategy(BaseStrategy):
         y_prices = y_prices[-min_length:]
         
         # Convertir en arrays numpy
-        x = np.array(x_prices)
-        y = np.array(y_prices)
+        x = np.asarray(x_prices, dtype=np.float64)
+        y = np.asarray(y_prices, dtype=np.float64)
+        
+        slopes, intercepts, correlations = self._calculate_regression_batch(x, y[:, None])
+        
+        return float(slopes[0]), float(intercepts[0]), float(correlations[0])
+    
+    def _calculate_regression_batch(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calcule les régressions linéaires de plusieurs séries Y sur une même série X.
+        
+        Args:
+            x: Prix de l'actif X, de forme (N,).
+            y: Prix des actifs Y en colonnes, de forme (N, K).
+            
+        Returns:
+            Tuple de tableaux (K,) contenant les pentes, les ordonnées à l'origine et les corrélations.
+        """
+        # Sommes, sommes des carrés et des produits: les termes en X sont calculés
+        # une seule fois pour toutes les colonnes, les produits croisés en un appel BLAS
+        n = x.size
+        sx = x.sum()
+        sxx = np.dot(x, x)
+        sy = y.sum(axis=0)
+        syy = np.einsum("ij,ij->j", y, y)
+        sxy = x @ y
         
-        # Calculer la régression linéaire
-        slope, intercept = np.polyfit(x, y, 1)
+        # Moindres carrés et corrélation de Pearson sous forme fermée
+        cov = n * sxy - sx * sy
+        var_x = n * sxx - sx * sx
+        var_y = n * syy - sy * sy
+        if var_x <= 0:
+            return np.zeros_like(sy), sy / n, np.zeros_like(sy)
         
-        # Calculer la corrélation
-        correlation = np.corrcoef(x, y)[0, 1]
+        slopes = cov / var_x
+        intercepts = (sy - slopes * sx) / n
+        correlations = np.divide(cov, np.sqrt(var_x * np.maximum(var_y, 0.0)),
+                                 out=np.zeros_like(cov), where=var_y > 0)
         
-        return slope, intercept, correlation
+        return slopes, intercepts, correlations
     
-    def _calculate_spread_series(self, x_prices: List[float], y_prices: List[float], 
-                                slope: float, intercept: float) -> List[float]:
+    def _calculate_spread_series(self, x_prices: np.ndarray, y_prices: np.ndarray, 
+                                slope: float, intercept: float) -> np.ndarray:
         """
         Calcule la série de spread entre deux actifs.
         
@@ -197,17 +419,15 @@ class StatisticalArbitrageStrategy(BaseStrategy):
         x_prices = x_prices[-min_length:]
         y_prices = y_prices[-min_length:]
         
-        # Convertir en arrays numpy
-        x = np.array(x_prices)
-        y = np.array(y_prices)
+        # Convertir en arrays numpy (sans copie pour des tableaux float64)
+        x = np.asarray(x_prices, dtype=np.float64)
+        y = np.asarray(y_prices, dtype=np.float64)
         
         # Calculer la valeur théorique de Y
         y_hat = slope * x + intercept
         
         # Calculer le spread (différence entre Y réel et Y théorique)
-        spread = y - y_hat
-        
-        return spread.tolist()
+        return y - y_hat
     
     def _calculate_z_score(self, current_spread: float, pair_id: str) -> float:
         """
@@ -237,44 +457,125 @@ class StatisticalArbitrageStrategy(BaseStrategy):
     def _update_models(self):
         """
         Met à jour les modèles pour toutes les paires.
+        
+        Seules les bougies parues depuis la dernière mise à jour sont récupérées.
+        Le ratio de couverture (intercept, slope) est suivi par un filtre de Kalman
+        mis à jour en O(1) par nouvelle observation; la moyenne et l'écart-type du
+        spread sont mis à jour à partir des sommes courantes de la fenêtre glissante.
+        Une régression complète sur la fenêtre sert uniquement de contrôle de cohérence.
         """
-        for pair_id, model in self.pair_models.items():
+        # Sélectionner les modèles à mettre à jour
+        now_ts = time.monotonic()
+        due = [(pair_id, model) for pair_id, model in self.pair_models.items()
+               if now_ts - model["last_update_ts"] >= self._model_refresh_s]
+        if not due:
+            return
+        
+        # Récupérer simultanément les nouvelles données de tous les actifs concernés
+        requests = []
+        for _, model in due:
+            requests.append((model["asset1"], model.get("exchange1"), model["last_update_ms"]))
+            requests.append((model["asset2"], model.get("exchange2"), model["last_update_ms"]))
+        prices_cache = self._prefetch_prices(requests)
+        
+        for pair_id, model in due:
             try:
-                # Vérifier si une mise à jour est nécessaire
-                time_since_update = datetime.now() - model["last_update"]
-                if time_since_update < timedelta(hours=24):
-                    continue
+                # Récupérer uniquement les nouvelles données
+                since = model["last_update_ms"]
+                x_candles = self._get_cached_prices(prices_cache, model["asset1"], model.get("exchange1"), since=since)
+                y_candles = self._get_cached_prices(prices_cache, model["asset2"], model.get("exchange2"), since=since)
                 
-                # Récupérer les données historiques
-                asset1_prices = self._get_historical_prices(model["asset1"], model.get("exchange1"))
-                asset2_prices = self._get_historical_prices(model["asset2"], model.get("exchange2"))
-                
-                if asset1_prices is None or asset2_prices is None:
+                if x_candles is None or y_candles is None:
                     logger.warning(f"Données insuffisantes pour la paire {pair_id}, modèle non mis à jour")
                     continue
                 
-                # Calculer la régression linéaire
-                slope, intercept, correlation = self._calculate_regression(asset1_prices, asset2_prices)
+                # Apparier les bougies clôturées des deux actifs par horodatage d'ouverture
+                timestamps, ix, iy = np.intersect1d(x_candles[:, 0], y_candles[:, 0], assume_unique=True,
+                                                    return_indices=True)
+                n_new = timestamps.size
+                if not n_new:
+                    # Aucune bougie consommée: conserver l'horodatage pour la prochaine tentative
+                    logger.debug(f"Aucune nouvelle bougie pour la paire {pair_id}")
+                    continue
+                
+                x_new = x_candles[ix, 1]
+                y_new = y_candles[iy, 1]
                 
-                # Calculer la série de spread
-                spread_series = self._calculate_spread_series(asset1_prices, asset2_prices, slope, intercept)
+                # Filtrer le ratio de couverture et faire glisser la fenêtre du spread
+                buffer = model["spread_buffer"]
+                maxlen = buffer.maxlen
+                sum_s = model["sum_s"]
+                sum_s2 = model["sum_s2"]
+                alpha = model["intercept"]
+                beta = model["slope"]
+                (p00, p01), (_, p11) = model["kalman_P"].tolist()
+                (q00, q01), (_, q11) = model["kalman_Q"].tolist()
+                r = model["kalman_R"]
+                for x1, x2 in zip(x_new.tolist(), y_new.tolist()):
+                    # Innovation: écart entre le prix observé et le prix prédit par l'état courant
+                    spread = x2 - (alpha + beta * x1)
+                    
+                    # Gain K = P C / (C P C' + R), avec C = (1, x1)
+                    pc0 = p00 + p01 * x1
+                    pc1 = p01 + p11 * x1
+                    s_inv = 1.0 / (pc0 + pc1 * x1 + r)
+                    k0 = pc0 * s_inv
+                    k1 = pc1 * s_inv
+                    alpha += k0 * spread
+                    beta += k1 * spread
+                    
+                    # P = (I - K C) P + Q
+                    p00 += q00 - k0 * pc0
+                    p01 += q01 - k0 * pc1
+                    p11 += q11 - k1 * pc1
+                    
+                    if len(buffer) == maxlen:
+                        old = buffer[0]
+                        sum_s -= old
+                        sum_s2 -= old * old
+                    buffer.append(spread)
+                    sum_s += spread
+                    sum_s2 += spread * spread
                 
-                # Calculer les statistiques du spread
-                spread_mean = np.mean(spread_series)
-                spread_std = np.std(spread_series)
+                count = len(buffer)
+                spread_mean = sum_s / count
+                model["sum_s"] = sum_s
+                model["sum_s2"] = sum_s2
+                model["spread_mean"] = spread_mean
+                model["spread_std"] = math.sqrt(max(0.0, sum_s2 / count - spread_mean * spread_mean))
+                model["asset1_prices"] = np.concatenate((model["asset1_prices"], x_new))[-maxlen:]
+                model["asset2_prices"] = np.concatenate((model["asset2_prices"], y_new))[-maxlen:]
+                model["intercept"] = alpha
+                model["slope"] = beta
+                model["kalman_P"] = np.array(((p00, p01), (p01, p11)))
                 
-                # Mettre à jour le modèle
-                model["slope"] = slope
-                model["intercept"] = intercept
+                # Contrôle de cohérence: régression complète sur la fenêtre glissante
+                ols_slope, ols_intercept, correlation = self._calculate_regression(model["asset1_prices"], model["asset2_prices"])
                 model["correlation"] = correlation
-                model["spread_mean"] = spread_mean
-                model["spread_std"] = spread_std
-                model["last_update"] = datetime.now()
+                if abs(beta - ols_slope) > self.kalman_reset_tolerance * abs(ols_slope):
+                    logger.warning(f"Ratio de couverture filtré divergent pour la paire {pair_id} ({beta:.4f} contre {ols_slope:.4f}), réinitialisation du filtre")
+                    model["intercept"] = ols_intercept
+                    model["slope"] = ols_slope
+                    model["kalman_P"] = model["kalman_P0"]
+                    
+                    # Recalculer la fenêtre du spread et ses sommes courantes avec le ratio des moindres carrés
+                    spread_series = model["asset2_prices"] - (ols_slope * model["asset1_prices"] + ols_intercept)
+                    buffer.clear()
+                    buffer.extend(spread_series.tolist())
+                    model["sum_s"] = float(spread_series.sum())
+                    model["sum_s2"] = float(np.dot(spread_series, spread_series))
+                    model["spread_mean"] = float(spread_series.mean())
+                    model["spread_std"] = float(spread_series.std())
+                
+                model["last_update_ts"] = now_ts
+                model["last_update_ms"] = int(timestamps[-1]) + 1
                 
-                logger.info(f"Modèle mis à jour pour la paire {pair_id} avec corrélation {correlation:.2f}")
+                logger.info(f"Modèle mis à jour pour la paire {pair_id} avec {n_new} nouveaux points")
                 
             except Exception as e:
                 logger.error(f"Erreur lors de la mise à jour du modèle pour la paire {pair_id}: {str(e)}")
+        
+        self._pack_models()
     
     def _check_rebalance(self):
         """
@@ -283,8 +584,7 @@ class StatisticalArbitrageStrategy(BaseStrategy):
         Returns:
             True si un rééquilibrage est nécessaire, False sinon.
         """
-        time_since_rebalance = datetime.now() - self.last_rebalance_time
-        return time_since_rebalance >= timedelta(hours=self.rebalance_interval)
+        return time.monotonic() - self._last_rebalance_ts >= self._rebalance_interval_s
     
     def _get_position_size(self, symbol: str, exchange_id: Optional[str] = None) -> float:
         """
@@ -317,13 +617,16 @@ class StatisticalArbitrageStrategy(BaseStrategy):
             # Vérifier si un rééquilibrage est nécessaire
             if self._check_rebalance():
                 self._rebalance_portfolio()
-                self.last_rebalance_time = datetime.now()
+                self._last_rebalance_ts = time.monotonic()
+            
+            # Récupérer tous les prix actuels en une requête par exchange
+            prices = self._batch_fetch_tickers(self._symbols_by_exchange)
             
             # Vérifier les opportunités d'arbitrage
-            self._check_arbitrage_opportunities()
+            self._check_arbitrage_opportunities(prices)
             
             # Gérer les positions existantes
-            self._manage_positions()
+            self._manage_positions(prices)
             
         except Exception as e:
             logger.error(f"Erreur lors de la mise à jour de la stratégie d'arbitrage statistique: {str(e)}")
@@ -338,45 +641,103 @@ class StatisticalArbitrageStrategy(BaseStrategy):
         # Par exemple, fermer les positions les moins performantes
         # et allouer le capital aux meilleures opportunités
     
-    def _check_arbitrage_opportunities(self):
+    def _check_arbitrage_opportunities(self, prices: Dict[Tuple[str, Optional[str]], float]):
         """
         Vérifie les opportunités d'arbitrage statistique.
+        
+        Args:
+            prices: Prix actuels indexés par (symbole, exchange).
         """
         # Vérifier si nous pouvons ouvrir de nouvelles positions
-        if len(self.active_positions) >= self.max_positions:
+        if len(self.active_positions) >= self.max_positions or not self._pair_ids:
             return
         
-        for pair_id, model in self.pair_models.items():
+        # Spreads et Z-scores de toutes les paires en une seule opération
+        p1, p2, spreads, z_scores = self._evaluate_z_scores(range(len(self._pair_ids)), prices)
+        
+        # Paires dont le Z-score dépasse le seuil (NaN exclus) et sans position ouverte
+        strength = np.abs(z_scores)
+        mask = strength > self.z_score_threshold
+        mask[self._pos_pair[:self._n_active]] = False
+        candidates = np.flatnonzero(mask)
+        
+        # S'il y a plus de signaux que d'emplacements libres, ne retenir que les plus forts
+        n_open = self.max_positions - len(self.active_positions)
+        if candidates.size > n_open:
+            top = np.argpartition(-strength[candidates], n_open - 1)[:n_open]
+            candidates = candidates[top[np.argsort(-strength[candidates[top]])]]
+        
+        for i in candidates.tolist():
+            pair_id = self._pair_ids[i]
             try:
-                # Vérifier si nous avons déjà une position sur cette paire
-                if pair_id in self.active_positions:
-                    continue
-                
-                # Récupérer les prix actuels
-                asset1_price = self._get_current_price(model["asset1"], model.get("exchange1"))
-                asset2_price = self._get_current_price(model["asset2"], model.get("exchange2"))
-                
-                if asset1_price is None or asset2_price is None:
-                    continue
-                
-                # Calculer le spread actuel
-                current_spread = asset2_price - (model["slope"] * asset1_price + model["intercept"])
-                
-                # Calculer le Z-score
-                z_score = self._calculate_z_score(current_spread, pair_id)
+                asset1_price = float(p1[i])
+                asset2_price = float(p2[i])
+                z_score = float(z_scores[i])
                 
                 # Générer des signaux en fonction du Z-score
                 if z_score > self.z_score_threshold:
                     # Spread trop élevé: vendre asset2, acheter asset1
-                    self._open_arbitrage_position(pair_id, "short", asset1_price, asset2_price, z_score)
+                    self._open_arbitrage_position(pair_id, "short", asset1_price, asset2_price, z_score, float(spreads[i]))
                     
                 elif z_score < -self.z_score_threshold:
                     # Spread trop bas: acheter asset2, vendre asset1
-                    self._open_arbitrage_position(pair_id, "long", asset1_price, asset2_price, z_score)
+                    self._open_arbitrage_position(pair_id, "long", asset1_price, asset2_price, z_score, float(spreads[i]))
                 
             except Exception as e:
                 logger.error(f"Erreur lors de la vérification des opportunités pour la paire {pair_id}: {str(e)}")
     
+    def _evaluate_z_scores(self, pair_idx, prices: Dict[Tuple[str, Optional[str]], float]) -> Tuple[np.ndarray, ...]:
+        """
+        Calcule les spreads et Z-scores actuels d'un ensemble de paires.
+        
+        Args:
+            pair_idx: Indices des paires dans les tableaux des modèles.
+            prices: Prix actuels indexés par (symbole, exchange).
+            
+        Returns:
+            Tuple (prix de l'actif 1, prix de l'actif 2, spreads, Z-scores). Les prix
+            indisponibles donnent NaN; un écart-type nul donne un Z-score de 0.
+        """
+        nan = np.nan
+        asset1_keys = self._asset1_keys
+        asset2_keys = self._asset2_keys
+        p1 = np.array([prices.get(asset1_keys[i], nan) for i in pair_idx], dtype=np.float64)
+        p2 = np.array([prices.get(asset2_keys[i], nan) for i in pair_idx], dtype=np.float64)
+        
+        idx = np.asarray(pair_idx, dtype=np.intp)
+        spreads = p2 - (self._slopes[idx] * p1 + self._intercepts[idx])
+        stds = self._stds[idx]
+        z_scores = np.divide(spreads - self._means[idx], stds, out=np.zeros_like(spreads), where=stds != 0)
+        z_scores[np.isnan(spreads)] = nan
+        
+        return p1, p2, spreads, z_scores
+    
+    def _batch_fetch_tickers(self, symbols_by_exchange: Dict[Optional[str], List[str]]) -> Dict[Tuple[str, Optional[str]], float]:
+        """
+        Récupère les derniers prix de tous les symboles suivis.
+        
+        Les tickers sont demandés en un seul appel par exchange (get_tickers).
+        
+        Args:
+            symbols_by_exchange: Symboles à récupérer, regroupés par exchange.
+            
+        Returns:
+            Dictionnaire des derniers prix indexés par (symbole, exchange).
+        """
+        prices = {}
+        
+        for exchange_id, symbols in symbols_by_exchange.items():
+            try:
+                tickers = self.market_data_manager.get_tickers(symbols, exchange_id) or {}
+                for symbol in symbols:
+                    ticker = tickers.get(symbol)
+                    if ticker and "last" in ticker:
+                        prices[(symbol, exchange_id)] = ticker["last"]
+            except Exception as e:
+                logger.error(f"Erreur lors de la récupération des prix sur {exchange_id}: {str(e)}")
+        
+        return prices
+    
     def _get_current_price(self, symbol: str, exchange_id: Optional[str] = None) -> Optional[float]:
         """
         Récupère le prix actuel d'un symbole.
@@ -398,7 +759,7 @@ class StatisticalArbitrageStrategy(BaseStrategy):
             return None
     
     def _open_arbitrage_position(self, pair_id: str, direction: str, asset1_price: float, 
-                               asset2_price: float, z_score: float):
+                               asset2_price: float, z_score: float, current_spread: Optional[float] = None):
         """
         Ouvre une position d'arbitrage statistique.
         
@@ -408,6 +769,7 @@ class StatisticalArbitrageStrategy(BaseStrategy):
             asset1_price: Prix de l'actif 1.
             asset2_price: Prix de l'actif 2.
             z_score: Z-score actuel.
+            current_spread: Spread actuel, déjà calculé avec le Z-score (recalculé si absent).
         """
         try:
             # Vérifier si nous pouvons ouvrir une nouvelle position
@@ -424,7 +786,8 @@ class StatisticalArbitrageStrategy(BaseStrategy):
             
             # Ajuster les tailles pour maintenir une position neutre en valeur
             ratio = model["slope"]
-            if direction == "long":
+            dir_sign = DIR_LONG if direction == "long" else DIR_SHORT
+            if dir_sign == DIR_LONG:
                 # Acheter asset2, vendre asset1
                 asset1_amount = position_size1 / asset1_price
                 asset2_amount = (position_size1 * ratio) / asset2_price
@@ -433,7 +796,7 @@ class StatisticalArbitrageStrategy(BaseStrategy):
                 order1 = self._create_order(model["asset1"], "sell", asset1_amount, model.get("exchange1"))
                 order2 = self._create_order(model["asset2"], "buy", asset2_amount, model.get("exchange2"))
                 
-            else:  # direction == "short"
+            else:  # DIR_SHORT
                 # Vendre asset2, acheter asset1
                 asset1_amount = position_size1 / asset1_price
                 asset2_amount = (position_size1 * ratio) / asset2_price
@@ -444,15 +807,37 @@ class StatisticalArbitrageStrategy(BaseStrategy):
             
             # Enregistrer la position
             if order1 and order2:
+                entry_spread = current_spread
+                if entry_spread is None:
+                    entry_spread = asset2_price - (model["slope"] * asset1_price + model["intercept"])
+                # Stop loss au-delà du Z-score d'entrée, dans le sens d'un écartement du spread
+                stop_loss_z_score = z_score * (1 + self.stop_loss_pct)
+                
+                # Occuper le premier emplacement libre à la suite des positions ouvertes
+                slot = self._n_active
+                self._pos_dir[slot] = dir_sign
+                self._pos_pair[slot] = self._pair_index[pair_id]
+                self._pos_entry_spread[slot] = entry_spread
+                self._pos_entry_z[slot] = z_score
+                self._pos_target[slot] = 0.0
+                self._pos_stop[slot] = stop_loss_z_score
+                self._pos_amount1[slot] = asset1_amount
+                self._pos_amount2[slot] = asset2_amount
+                self._pos_entry1[slot] = asset1_price
+                self._pos_entry2[slot] = asset2_price
+                self._pos_ids.append(pair_id)
+                self._pos_idx[pair_id] = slot
+                self._n_active = slot + 1
+                
                 self.active_positions[pair_id] = {
-                    "direction": direction,
+                    "direction": dir_sign,
                     "asset1": model["asset1"],
                     "asset2": model["asset2"],
                     "exchange1": model.get("exchange1"),
                     "exchange2": model.get("exchange2"),
                     "entry_asset1_price": asset1_price,
                     "entry_asset2_price": asset2_price,
-                    "entry_spread": asset2_price - (model["slope"] * asset1_price + model["intercept"]),
+                    "entry_spread": entry_spread,
                     "entry_z_score": z_score,
                     "asset1_amount": asset1_amount,
                     "asset2_amount": asset2_amount,
@@ -460,10 +845,10 @@ class StatisticalArbitrageStrategy(BaseStrategy):
                     "order2_id": order2.get("id"),
                     "entry_time": datetime.now(),
                     "target_z_score": 0.0,  # Cible: retour à la moyenne
-                    "stop_loss_z_score": z_score * (1 + self.stop_loss_pct * (1 if direction == "long" else -1))
+                    "stop_loss_z_score": stop_loss_z_score
                 }
                 
-                logger.info(f"Position d'arbitrage ouverte pour {pair_id} en direction {direction} avec Z-score {z_score:.2f}")
+                logger.info(f"Position d'arbitrage ouverte pour {pair_id} en direction {_DIRECTION_NAMES[dir_sign]} avec Z-score {z_score:.2f}")
             
         except Exception as e:
             logger.error(f"Erreur lors de l'ouverture de la position pour {pair_id}: {str(e)}")
@@ -486,104 +871,152 @@ class StatisticalArbitrageStrategy(BaseStrategy):
         
         # Pour l'exemple, nous retournons un ordre fictif
         return {
-            "id": f"order_{symbol}_{side}_{int(time.time())}",
+            "id": f"o{next(self._order_counter):x}_{symbol}",
             "symbol": symbol,
             "side": side,
             "amount": amount,
             "status": "open"
         }
     
-    def _manage_positions(self):
+    def _manage_positions(self, prices: Dict[Tuple[str, Optional[str]], float]):
         """
         Gère les positions existantes.
+        
+        Args:
+            prices: Prix actuels indexés par (symbole, exchange).
         """
-        positions_to_close = []
+        if not self._n_active:
+            return
         
-        for pair_id, position in self.active_positions.items():
-            try:
-                model = self.pair_models.get(pair_id)
-                if not model:
-                    continue
-                
-                # Récupérer les prix actuels
-                asset1_price = self._get_current_price(position["asset1"], position.get("exchange1"))
-                asset2_price = self._get_current_price(position["asset2"], position.get("exchange2"))
-                
-                if asset1_price is None or asset2_price is None:
-                    continue
-                
-                # Calculer le spread actuel
-                current_spread = asset2_price - (model["slope"] * asset1_price + model["intercept"])
-                
-                # Calculer le Z-score actuel
-                current_z_score = self._calculate_z_score(current_spread, pair_id)
-                
-                # Vérifier les conditions de clôture
-                if position["direction"] == "long":
-                    # Position longue: acheter asset2, vendre asset1
-                    # Fermer si le Z-score est revenu à la cible ou a atteint le stop loss
-                    if (current_z_score >= position["target_z_score"] or 
-                        current_z_score <= position["stop_loss_z_score"]):
-                        positions_to_close.append(pair_id)
-                        
-                else:  # position["direction"] == "short"
-                    # Position courte: vendre asset2, acheter asset1
-                    # Fermer si le Z-score est revenu à la cible ou a atteint le stop loss
-                    if (current_z_score <= position["target_z_score"] or 
-                        current_z_score >= position["stop_loss_z_score"]):
-                        positions_to_close.append(pair_id)
-                
-            except Exception as e:
-                logger.error(f"Erreur lors de la gestion de la position pour {pair_id}: {str(e)}")
+        try:
+            live = slice(0, self._n_active)
+            
+            # Z-scores actuels de toutes les positions (NaN si un prix manque)
+            _, _, _, z = self._evaluate_z_scores(self._pos_pair[live].tolist(), prices)
+            
+            # Conditions de clôture évaluées pour toutes les positions à la fois, sans
+            # branche sur la direction: retour à la cible ou stop loss atteint
+            direction = self._pos_dir[live]
+            close_mask = ((direction * (z - self._pos_target[live]) >= 0) |
+                          (direction * (z - self._pos_stop[live]) <= 0))
+            pair_ids = self._pos_ids
+            positions_to_close = [pair_ids[k] for k in np.flatnonzero(close_mask).tolist()]
+            
+        except Exception as e:
+            logger.error(f"Erreur lors de la gestion des positions: {str(e)}")
+            return
         
         # Fermer les positions
-        for pair_id in positions_to_close:
-            self._close_position(pair_id)
+        if positions_to_close:
+            self._close_positions_batch(positions_to_close, prices)
     
-    def _close_position(self, pair_id: str):
+    def _close_position(self, pair_id: str, prices: Optional[Dict[Tuple[str, Optional[str]], float]] = None) -> Optional[float]:
         """
         Ferme une position d'arbitrage statistique.
         
         Args:
             pair_id: Identifiant de la paire.
+            prices: Prix actuels indexés par (symbole, exchange), déjà récupérés pendant
+                la mise à jour. Si absent, les prix sont demandés au gestionnaire de données.
+            
+        Returns:
+            P&L de la position fermée (NaN si un prix de sortie manque), ou None si
+            aucune position n'a été fermée.
         """
-        try:
-            position = self.active_positions.get(pair_id)
-            if not position:
-                return
+        position = self.active_positions.get(pair_id)
+        if not position:
+            return None
+        
+        if prices is None:
+            key1 = (position["asset1"], position.get("exchange1"))
+            key2 = (position["asset2"], position.get("exchange2"))
+            prices = {key1: self._get_current_price(*key1), key2: self._get_current_price(*key2)}
+        
+        return self._close_positions_batch([pair_id], prices).get(pair_id)
+    
+    def _close_positions_batch(self, pair_ids: List[str], prices: Dict[Tuple[str, Optional[str]], float]) -> Dict[str, float]:
+        """
+        Ferme plusieurs positions d'arbitrage statistique en une passe.
+        
+        Le P&L de toutes les positions est calculé d'un bloc à partir des prix déjà
+        récupérés, sans nouvelle requête au gestionnaire de données.
+        
+        Args:
+            pair_ids: Identifiants des paires à fermer.
+            prices: Prix actuels indexés par (symbole, exchange).
             
-            # Créer les ordres de clôture
-            if position["direction"] == "long":
-                # Fermer une position longue: vendre asset2, acheter asset1
-                order1 = self._create_order(position["asset1"], "buy", position["asset1_amount"], position.get("exchange1"))
-                order2 = self._create_order(position["asset2"], "sell", position["asset2_amount"], position.get("exchange2"))
+        Returns:
+            P&L des positions effectivement fermées, indexé par identifiant de paire
+            (NaN si un prix de sortie manque).
+        """
+        pair_ids = [pair_id for pair_id in pair_ids if pair_id in self.active_positions]
+        if not pair_ids:
+            return {}
+        
+        try:
+            # P&L = direction * ((sortie2 - entrée2) * quantité2 - (sortie1 - entrée1) * quantité1),
+            # NaN si un prix de sortie manque
+            slots = np.fromiter((self._pos_idx[pair_id] for pair_id in pair_ids), dtype=np.intp, count=len(pair_ids))
+            positions = [self.active_positions[pair_id] for pair_id in pair_ids]
+            exit_p1 = np.array([prices.get((p["asset1"], p.get("exchange1"))) or np.nan for p in positions])
+            exit_p2 = np.array([prices.get((p["asset2"], p.get("exchange2"))) or np.nan for p in positions])
+            pnl = self._pos_dir[slots] * ((exit_p2 - self._pos_entry2[slots]) * self._pos_amount2[slots] -
+                                          (exit_p1 - self._pos_entry1[slots]) * self._pos_amount1[slots])
+        except Exception as e:
+            logger.error(f"Erreur lors du calcul du P&L des positions {pair_ids}: {str(e)}")
+            return {}
+        
+        closed = []
+        for pair_id, position, value in zip(pair_ids, positions, pnl.tolist()):
+            try:
+                # Créer les ordres de clôture
+                if position["direction"] == DIR_LONG:
+                    # Fermer une position longue: vendre asset2, acheter asset1
+                    order1 = self._create_order(position["asset1"], "buy", position["asset1_amount"], position.get("exchange1"))
+                    order2 = self._create_order(position["asset2"], "sell", position["asset2_amount"], position.get("exchange2"))
+                    
+                else:  # DIR_SHORT
+                    # Fermer une position courte: acheter asset2, vendre asset1
+                    order1 = self._create_order(position["asset1"], "sell", position["asset1_amount"], position.get("exchange1"))
+                    order2 = self._create_order(position["asset2"], "buy", position["asset2_amount"], position.get("exchange2"))
                 
-            else:  # position["direction"] == "short"
-                # Fermer une position courte: acheter asset2, vendre asset1
-                order1 = self._create_order(position["asset1"], "sell", position["asset1_amount"], position.get("exchange1"))
-                order2 = self._create_order(position["asset2"], "buy", position["asset2_amount"], position.get("exchange2"))
-            
-            # Calculer le P&L
-            asset1_price = self._get_current_price(position["asset1"], position.get("exchange1"))
-            asset2_price = self._get_current_price(position["asset2"], position.get("exchange2"))
-            
-            if asset1_price and asset2_price:
-                if position["direction"] == "long":
-                    # P&L = (asset2_exit - asset2_entry) - (asset1_exit - asset1_entry) * ratio
-                    pnl = ((asset2_price - position["entry_asset2_price"]) * position["asset2_amount"] - 
-                           (asset1_price - position["entry_asset1_price"]) * position["asset1_amount"])
-                else:
-                    # P&L = (asset2_entry - asset2_exit) - (asset1_entry - asset1_exit) * ratio
-                    pnl = ((position["entry_asset2_price"] - asset2_price) * position["asset2_amount"] - 
-                           (position["entry_asset1_price"] - asset1_price) * position["asset1_amount"])
+                # Supprimer la position et libérer son emplacement
+                del self.active_positions[pair_id]
+                self._release_slot(pair_id)
+                closed.append((pair_id, value))
                 
-                logger.info(f"Position fermée pour {pair_id} avec P&L {pnl:.2f}")
-            
-            # Supprimer la position
-            del self.active_positions[pair_id]
-            
-        except Exception as e:
-            logger.error(f"Erreur lors de la fermeture de la position pour {pair_id}: {str(e)}")
+            except Exception as e:
+                logger.error(f"Erreur lors de la fermeture de la position pour {pair_id}: {str(e)}")
+        
+        logged = [(pair_id, value) for pair_id, value in closed if not math.isnan(value)]
+        if logged:
+            logger.info("Positions fermées: " + ", ".join(f"{pair_id} (P&L {value:.2f})" for pair_id, value in logged))
+        
+        return dict(closed)
+    
+    def _release_slot(self, pair_id: str):
+        """
+        Libère l'emplacement d'une position en y déplaçant la dernière position ouverte.
+        
+        Args:
+            pair_id: Identifiant de la paire.
+        """
+        slot = self._pos_idx.pop(pair_id, None)
+        if slot is None:
+            return
+        
+        last = self._n_active - 1
+        last_id = self._pos_ids.pop()
+        if slot != last:
+            for arr in (self._pos_dir, self._pos_pair, self._pos_entry_spread, self._pos_entry_z,
+                        self._pos_target, self._pos_stop, self._pos_amount1, self._pos_amount2,
+                        self._pos_entry1, self._pos_entry2):
+                arr[slot] = arr[last]
+            self._pos_ids[slot] = last_id
+            self._pos_idx[last_id] = slot
+        
+        self._pos_dir[last] = 0
+        self._n_active = last
     
     def get_active_positions(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -8,13 +8,73 @@ Ce module permet de créer différentes stratégies de trading en fonction
 de la configuration fournie.
 """
 
-from typing import Dict, Any, List, Optional
+import functools
+import importlib
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Tuple
 from loguru import logger
 
-from src.strategies.market_making_strategy import MarketMakingStrategy
-from src.strategies.adaptive_market_making_strategy import AdaptiveMarketMakingStrategy
-from src.strategies.statistical_arbitrage_strategy import StatisticalArbitrageStrategy
-from src.strategies.combined_strategy import CombinedStrategy
+from src.config.config_loader import load_config_cached
+
+# Types de stratégies intégrés: module et classe, importés au premier usage
+_TYPE_PATHS = {
+    "market_making": ("src.strategies.market_making_strategy", "MarketMakingStrategy"),
+    "adaptive_market_making": ("src.strategies.adaptive_market_making_strategy", "AdaptiveMarketMakingStrategy"),
+    "statistical_arbitrage": ("src.strategies.statistical_arbitrage_strategy", "StatisticalArbitrageStrategy"),
+    "combined": ("src.strategies.combined_strategy", "CombinedStrategy"),
+}
+
+# Configuration des stratégies sans configuration spécifique, partagée en lecture seule
+_DEFAULT_PARAMS = MappingProxyType({
+    "spread_bid": 0.1,  # 0.1%
+    "spread_ask": 0.1,  # 0.1%
+    "order_size": 0.01,
+    "order_count": 3,
+    "refresh_rate": 10,  # secondes
+})
+_DEFAULT_TEMPLATE = MappingProxyType({
+    "type": "market_making",
+    "parameters": _DEFAULT_PARAMS,
+})
+
+
+def _intern_strings(value):
+    """
+    Copie une configuration en internant ses chaînes (clés et valeurs).
+    
+    Les symboles, exchanges et types de stratégie répétés dans la configuration
+    partagent ainsi un même objet, et les recherches par clé se résolvent par identité.
+    
+    Args:
+        value: Configuration (dictionnaires, listes et scalaires imbriqués).
+        
+    Returns:
+        Copie de la configuration avec les chaînes internées.
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {_intern_strings(k): _intern_strings(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_intern_strings(v) for v in value]
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _import_strategy_class(type_name: str):
+    """
+    Importe la classe d'un type de stratégie intégré.
+    
+    Args:
+        type_name: Nom du type de stratégie (clé de _TYPE_PATHS).
+        
+    Returns:
+        Classe de la stratégie.
+    """
+    module_name, class_name = _TYPE_PATHS[type_name]
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 class StrategyFactory:
@@ -25,6 +85,12 @@ class StrategyFactory:
     en fonction de la configuration fournie.
     """
     
+    __slots__ = (
+        "market_data_manager", "order_executor", "risk_manager", "config",
+        "_registered_types", "_types_view", "_config_by_id", "_enabled_ids",
+        "_logged_missing", "_default_symbols", "_cfg_cache"
+    )
+    
     def __init__(self, market_data_manager=None, order_executor=None, risk_manager=None, config=None):
         """
         Initialise la factory de stratégies.
@@ -33,22 +99,63 @@ class StrategyFactory:
             market_data_manager: Gestionnaire de données de marché.
             order_executor: Exécuteur d'ordres.
             risk_manager: Gestionnaire de risques.
-            config: Configuration des stratégies.
+            config: Configuration des stratégies, ou chemin vers un fichier YAML la contenant.
         """
         self.market_data_manager = market_data_manager
         self.order_executor = order_executor
         self.risk_manager = risk_manager
-        self.config = config or {}
+        if isinstance(config, (str, Path)):
+            config = load_config_cached(config)
+        self.config = _intern_strings(config or {})
+        
+        # Configurations des stratégies activées, indexées par identifiant. Les entrées
+        # sont triées par type une seule fois ici, les recherches n'ont plus à le faire
+        self._config_by_id = {}
+        enabled_ids = []
+        config_get = self.config.get
+        default_configs = config_get("default_configs", {})
+        register = self._config_by_id.setdefault
+        for strategy_config in config_get("enabled_strategies", []):
+            if isinstance(strategy_config, dict):
+                strategy_id = strategy_config.get("id")
+                if strategy_id is None:
+                    # Une entrée sans identifiant ne pourrait jamais être créée: l'ignorer
+                    logger.error("Stratégie activée sans identifiant ignorée: {}", strategy_config)
+                    continue
+                register(strategy_id, strategy_config)
+            elif isinstance(strategy_config, str):
+                strategy_id = strategy_config
+                if strategy_id in default_configs:
+                    # Si seul l'ID est fourni, utiliser la configuration par défaut
+                    register(strategy_id, default_configs[strategy_id])
+            else:
+                continue
+            enabled_ids.append(strategy_id)
+        self._enabled_ids = tuple(enabled_ids)
+        self._logged_missing = set()  # Stratégies sans configuration déjà signalées
+        self._cfg_cache = {}  # Configurations résolues, libérées avec la factory
+        self._default_symbols = tuple(config_get("default_symbols", ("BTC/USDT",)))
+        
+        # Types de stratégies enregistrés, prioritaires sur les types intégrés
+        self._registered_types = {}
+        self._types_view = None  # Noms des types disponibles, invalidé à chaque enregistrement
+        
+        logger.info("Factory de stratégies initialisée avec {} types de stratégies", len(_TYPE_PATHS))
+    
+    @property
+    def strategy_types(self) -> Mapping[str, Any]:
+        """
+        Types de stratégies disponibles et leurs classes.
         
-        # Registre des types de stratégies disponibles
-        self.strategy_types = {
-            "market_making": MarketMakingStrategy,
-            "adaptive_market_making": AdaptiveMarketMakingStrategy,
-            "statistical_arbitrage": StatisticalArbitrageStrategy,
-            "combined": CombinedStrategy,
-        }
+        Les types intégrés sont importés à la lecture; les types enregistrés les remplacent.
+        La vue est en lecture seule: utiliser register_strategy_type pour ajouter un type.
         
-        logger.info(f"Factory de stratégies initialisée avec {len(self.strategy_types)} types de stratégies")
+        Returns:
+            Vue en lecture seule des classes de stratégies indexées par type.
+        """
+        strategy_types = {type_name: _import_strategy_class(type_name) for type_name in _TYPE_PATHS}
+        strategy_types.update(self._registered_types)
+        return MappingProxyType(strategy_types)
     
     def create_strategy(self, strategy_id: str):
         """
@@ -69,12 +176,8 @@ class StrategyFactory:
         # Obtenir le type de stratégie
         strategy_type = strategy_config.get("type", "market_making")
         
-        # Vérifier si le type de stratégie est valide
-        if strategy_type not in self.strategy_types:
-            raise ValueError(f"Type de stratégie non reconnu: {strategy_type}")
-        
         # Créer l'instance de stratégie
-        strategy_class = self.strategy_types[strategy_type]
+        strategy_class = self._resolve_class(strategy_type)
         strategy = strategy_class(
             strategy_id=strategy_id,
             market_data_manager=self.market_data_manager,
@@ -83,9 +186,72 @@ class StrategyFactory:
             config=strategy_config
         )
         
-        logger.info(f"Stratégie créée: {strategy_id} (type: {strategy_type})")
+        logger.info("Stratégie créée: {} (type: {})", strategy_id, strategy_type)
         return strategy
     
+    def create_strategies(self, strategy_ids: Sequence[str]) -> List:
+        """
+        Crée les instances de plusieurs stratégies en une passe.
+        
+        Args:
+            strategy_ids: Identifiants des stratégies à créer.
+            
+        Returns:
+            Instances des stratégies créées, dans l'ordre des identifiants.
+            
+        Raises:
+            ValueError: Si un type de stratégie n'est pas reconnu.
+        """
+        get_config = self._get_strategy_config
+        resolve = self._resolve_class
+        market_data_manager = self.market_data_manager
+        order_executor = self.order_executor
+        risk_manager = self.risk_manager
+        
+        strategies = []
+        created = []
+        for strategy_id in strategy_ids:
+            strategy_config = get_config(strategy_id)
+            strategy_type = strategy_config.get("type", "market_making")
+            strategies.append(resolve(strategy_type)(
+                strategy_id=strategy_id,
+                market_data_manager=market_data_manager,
+                order_executor=order_executor,
+                risk_manager=risk_manager,
+                config=strategy_config
+            ))
+            created.append((strategy_id, strategy_type))
+        
+        if created:
+            # Liste formatée seulement si le niveau INFO est journalisé
+            logger.opt(lazy=True).info("Stratégies créées: {}", lambda: ", ".join(
+                f"{strategy_id} (type: {strategy_type})" for strategy_id, strategy_type in created))
+        return strategies
+    
+    def _resolve_class(self, strategy_type: str):
+        """
+        Obtient la classe d'un type de stratégie.
+        
+        Args:
+            strategy_type: Nom du type de stratégie.
+            
+        Returns:
+            Classe de la stratégie.
+            
+        Raises:
+            ValueError: Si le type de stratégie n'est pas reconnu.
+        """
+        strategy_type = sys.intern(strategy_type)
+        strategy_class = self._registered_types.get(strategy_type)
+        if strategy_class is not None:
+            return strategy_class
+        
+        # Vérifier si le type de stratégie est valide
+        if strategy_type not in _TYPE_PATHS:
+            raise ValueError(f"Type de stratégie non reconnu: {strategy_type}")
+        
+        return _import_strategy_class(strategy_type)
+    
     def _get_strategy_config(self, strategy_id: str) -> Dict[str, Any]:
         """
         Obtient la configuration d'une stratégie spécifique.
@@ -94,34 +260,55 @@ class StrategyFactory:
             strategy_id: Identifiant de la stratégie.
             
         Returns:
-            Configuration de la stratégie.
-        """
-        # Obtenir la liste des stratégies activées
-        enabled_strategies = self.config.get("enabled_strategies", [])
-        
-        # Chercher la configuration de la stratégie spécifique
-        for strategy_config in enabled_strategies:
-            if isinstance(strategy_config, dict) and strategy_config.get("id") == strategy_id:
-                return strategy_config
-            elif isinstance(strategy_config, str) and strategy_config == strategy_id:
-                # Si seul l'ID est fourni, chercher dans les configurations par défaut
-                if "default_configs" in self.config and strategy_id in self.config["default_configs"]:
-                    return self.config["default_configs"][strategy_id]
-        
-        # Si aucune configuration spécifique n'est trouvée, utiliser une configuration par défaut
-        logger.warning(f"Aucune configuration trouvée pour la stratégie {strategy_id}. Utilisation des valeurs par défaut.")
-        return {
-            "id": strategy_id,
-            "type": "market_making",
-            "symbols": self.config.get("default_symbols", ["BTC/USDT"]),
-            "parameters": {
-                "spread_bid": 0.1,  # 0.1%
-                "spread_ask": 0.1,  # 0.1%
-                "order_size": 0.01,
-                "order_count": 3,
-                "refresh_rate": 10,  # secondes
-            }
-        }
+            Configuration de la stratégie (une copie superficielle à chaque appel, que la
+            stratégie créée peut modifier sans altérer le cache).
+        """
+        cached = self._cfg_cache.get(strategy_id)
+        if cached is not None:
+            return dict(cached)
+        
+        strategy_config = self._config_by_id.get(strategy_id)
+        if strategy_config is None:
+            # Si aucune configuration spécifique n'est trouvée, utiliser une configuration par défaut
+            strategy_config = self._default_template(strategy_id)
+        
+        self._cfg_cache[strategy_id] = strategy_config
+        return dict(strategy_config)
+    
+    def invalidate_config_cache(self):
+        """
+        Vide le cache des configurations de stratégies résolues.
+        """
+        self._cfg_cache.clear()
+    
+    def _default_template(self, strategy_id: str) -> Dict[str, Any]:
+        """
+        Construit la configuration par défaut d'une stratégie sans configuration spécifique.
+        
+        Args:
+            strategy_id: Identifiant de la stratégie.
+            
+        Returns:
+            Configuration par défaut de la stratégie.
+        """
+        if strategy_id not in self._logged_missing:
+            self._logged_missing.add(strategy_id)
+            logger.warning("Aucune configuration trouvée pour la stratégie {}. Utilisation des valeurs par défaut.", strategy_id)
+        
+        strategy_config = dict(_DEFAULT_TEMPLATE)
+        strategy_config["id"] = strategy_id
+        strategy_config["parameters"] = dict(_DEFAULT_PARAMS)
+        strategy_config["symbols"] = list(self._default_symbols)
+        return strategy_config
+    
+    def get_enabled_strategy_ids(self) -> Tuple[str, ...]:
+        """
+        Obtient les identifiants des stratégies activées, dans l'ordre de la configuration.
+        
+        Returns:
+            Identifiants des stratégies activées.
+        """
+        return self._enabled_ids
     
     def register_strategy_type(self, type_name: str, strategy_class):
         """
@@ -131,14 +318,26 @@ class StrategyFactory:
             type_name: Nom du type de stratégie.
             strategy_class: Classe de stratégie à enregistrer.
         """
-        self.strategy_types[type_name] = strategy_class
-        logger.info(f"Nouveau type de stratégie enregistré: {type_name}")
+        self._registered_types[type_name] = strategy_class
+        self._types_view = None
+        self.invalidate_config_cache()
+        logger.info("Nouveau type de stratégie enregistré: {}", type_name)
     
-    def get_available_strategy_types(self) -> List[str]:
+    def get_available_strategy_types(self) -> Tuple[str, ...]:
         """
         Obtient la liste des types de stratégies disponibles.
         
         Returns:
-            Liste des noms des types de stratégies disponibles.
+            Noms des types de stratégies disponibles.
+        """
+        return self._types_view or self._rebuild_types_view()
+    
+    def _rebuild_types_view(self) -> Tuple[str, ...]:
+        """
+        Reconstruit la liste mise en cache des types de stratégies disponibles.
+        
+        Returns:
+            Noms des types de stratégies disponibles.
         """
-        return list(self.strategy_types.keys())
+        self._types_view = tuple(dict.fromkeys([*_TYPE_PATHS, *self._registered_types]))
+        return self._types_view
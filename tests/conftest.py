@@ -0,0 +1,19 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Configuration pytest commune aux tests d'ULTRA-ROBOT MARKET MAKER IA.
+"""
+
+
+def pytest_configure(config):
+    """
+    Déclare les marqueurs utilisés par les tests.
+    
+    Args:
+        config: Configuration pytest.
+    """
+    config.addinivalue_line(
+        "markers",
+        "serial: test dépendant de threads ou d'attentes bornées, exécuté hors des processus parallèles (run_tests.py --parallel)"
+    )
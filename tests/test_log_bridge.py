@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests unitaires pour le pont entre logging et loguru.
+"""
+
+import logging
+import pytest
+from loguru import logger
+
+from src.monitoring.log_bridge import intercept_stdlib_logging, stdlib_level
+
+
+@pytest.fixture
+def loguru_messages():
+    """
+    Sortie loguru collectant les messages, avec restauration de la configuration de logging.
+    """
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    messages = []
+    sink_id = logger.add(messages.append, level="TRACE", format="{level}|{message}")
+    yield messages
+    logger.remove(sink_id)
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+@pytest.mark.parametrize("name,expected", [
+    ("DEBUG", logging.DEBUG),
+    ("info", logging.INFO),
+    ("TRACE", 5),
+    ("SUCCESS", 25),
+    ("INCONNU", logging.INFO),
+])
+def test_stdlib_level(name, expected):
+    """
+    Teste la conversion des niveaux loguru, y compris ceux absents de logging.
+    """
+    assert stdlib_level(name) == expected
+
+
+def test_stdlib_records_reach_loguru_sinks(loguru_messages):
+    """
+    Teste la transmission des messages logging aux sorties loguru, avec leur niveau.
+    """
+    intercept_stdlib_logging("TRACE")
+
+    logging.getLogger("src.strategies.market_making_strategy").warning("Ordre %s rejeté", "42")
+
+    assert [message.strip() for message in loguru_messages] == ["WARNING|Ordre 42 rejeté"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -8,287 +8,323 @@ Ce module contient les tests unitaires pour valider le fonctionnement
 du gestionnaire de données de marché.
 """
 
-import unittest
 import time
-import threading
 from unittest.mock import MagicMock, patch
 import numpy as np
+import pytest
 from typing import Dict, Any
 
-from src.data.market_data_manager import MarketDataManager
+from src.market_data.market_data_manager import MarketDataManager, OHLCV_COLUMNS
 
+# Réponses du mock de l'exchange, toutes horodatées au même instant
+_NOW_MS = int(time.time() * 1000)
 
-class TestMarketDataManager(unittest.TestCase):
+TICKER_TEMPLATE = {
+    "symbol": "BTC/USDT",
+    "bid": 50000.0,
+    "ask": 50100.0,
+    "last": 50050.0,
+    "high": 51000.0,
+    "low": 49000.0,
+    "volume": 100.0,
+    "timestamp": _NOW_MS
+}
+
+ORDER_BOOK_TEMPLATE = {
+    "bids": [[50000.0, 1.0], [49900.0, 2.0], [49800.0, 3.0]],
+    "asks": [[50100.0, 1.0], [50200.0, 2.0], [50300.0, 3.0]],
+    "timestamp": _NOW_MS,
+    "nonce": 123456789
+}
+
+# Bougies sous forme de tableau NumPy (une ligne par bougie: timestamp, O, H, L, C, V)
+OHLCV_TEMPLATE = np.array([
+    [_NOW_MS - 3600000, 50000.0, 50500.0, 49500.0, 50050.0, 100.0],
+    [_NOW_MS - 3600000 * 2, 49800.0, 50300.0, 49700.0, 50100.0, 120.0],
+    [_NOW_MS - 3600000 * 3, 49900.0, 50400.0, 49600.0, 49800.0, 110.0]
+])
+
+# Configuration pour le gestionnaire de données
+CONFIG = {
+    "update_interval": 1,
+    "exchanges": {
+        "binance": {
+            "symbols": ["BTC/USDT", "ETH/USDT"]
+        }
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def mock_exchange():
     """
-    Tests unitaires pour le gestionnaire de données de marché.
+    Mock de l'exchange, construit une fois pour le module.
     """
+    exchange = MagicMock()
+    exchange.symbols = ["BTC/USDT", "ETH/USDT"]
+    exchange.fetch_ticker.return_value = TICKER_TEMPLATE
+    exchange.fetch_order_book.return_value = ORDER_BOOK_TEMPLATE
+    exchange.fetch_ohlcv.return_value = OHLCV_TEMPLATE
+    return exchange
+
+
+@pytest.fixture
+def market_data_manager(mock_exchange):
+    """
+    Gestionnaire de données neuf pour chaque test, sur le mock remis à zéro.
+    """
+    mock_exchange.reset_mock(side_effect=True)
+    manager = MarketDataManager(CONFIG, {"binance": mock_exchange})
+    yield manager
     
-    def setUp(self):
-        """
-        Initialise l'environnement de test avant chaque test.
-        """
-        # Créer un mock pour les exchanges
-        self.mock_exchange = MagicMock()
-        self.mock_exchange.fetch_ticker.return_value = {
-            "symbol": "BTC/USDT",
-            "bid": 50000.0,
-            "ask": 50100.0,
-            "last": 50050.0,
-            "high": 51000.0,
-            "low": 49000.0,
-            "volume": 100.0,
-            "timestamp": int(time.time() * 1000)
-        }
-        
-        self.mock_exchange.fetch_order_book.return_value = {
-            "bids": [[50000.0, 1.0], [49900.0, 2.0], [49800.0, 3.0]],
-            "asks": [[50100.0, 1.0], [50200.0, 2.0], [50300.0, 3.0]],
-            "timestamp": int(time.time() * 1000),
-            "nonce": 123456789
-        }
-        
-        self.mock_exchange.fetch_ohlcv.return_value = [
-            [int(time.time() * 1000) - 3600000, 50000.0, 50500.0, 49500.0, 50050.0, 100.0],
-            [int(time.time() * 1000) - 3600000 * 2, 49800.0, 50300.0, 49700.0, 50100.0, 120.0],
-            [int(time.time() * 1000) - 3600000 * 3, 49900.0, 50400.0, 49600.0, 49800.0, 110.0]
-        ]
-        
-        self.exchanges = {"binance": self.mock_exchange}
-        
-        # Configuration pour le gestionnaire de données
-        self.config = {
-            "cache_enabled": True,
-            "cache_expiry_seconds": 10,
-            "historical_data_days": 1,
-            "use_websockets": False,
-            "order_book_depth": 10,
-            "tick_interval_seconds": 1,
-            "candle_intervals": ["1m", "5m", "15m", "1h", "4h", "1d"],
-            "exchanges": {
-                "binance": {
-                    "symbols": ["BTC/USDT", "ETH/USDT"]
-                }
-            }
-        }
-        
-        # Créer le gestionnaire de données
-        self.market_data_manager = MarketDataManager(self.exchanges, self.config)
-    
-    def tearDown(self):
-        """
-        Nettoie l'environnement de test après chaque test.
-        """
-        # Arrêter le gestionnaire de données s'il est en cours d'exécution
-        if hasattr(self, "market_data_manager") and self.market_data_manager.running:
-            self.market_data_manager.stop()
-    
-    def test_initialization(self):
-        """
-        Teste l'initialisation du gestionnaire de données.
-        """
-        # Vérifier que le gestionnaire de données est correctement initialisé
-        self.assertEqual(self.market_data_manager.cache_enabled, True)
-        self.assertEqual(self.market_data_manager.cache_expiry_seconds, 10)
-        self.assertEqual(self.market_data_manager.historical_data_days, 1)
-        self.assertEqual(self.market_data_manager.use_websockets, False)
-        self.assertEqual(self.market_data_manager.order_book_depth, 10)
-        self.assertEqual(self.market_data_manager.tick_interval_seconds, 1)
-        self.assertEqual(self.market_data_manager.candle_intervals, ["1m", "5m", "15m", "1h", "4h", "1d"])
-        
-        # Vérifier que les structures de données sont initialisées
-        self.assertEqual(self.market_data_manager.tickers, {})
-        self.assertEqual(self.market_data_manager.order_books, {})
-        self.assertEqual(self.market_data_manager.trades, {})
-        self.assertEqual(self.market_data_manager.candles, {})
-        
-        # Vérifier que le gestionnaire de données n'est pas en cours d'exécution
-        self.assertEqual(self.market_data_manager.running, False)
-    
-    def test_start_stop(self):
-        """
-        Teste le démarrage et l'arrêt du gestionnaire de données.
-        """
-        # Démarrer le gestionnaire de données
-        self.market_data_manager.start()
-        
-        # Vérifier que le gestionnaire de données est en cours d'exécution
-        self.assertEqual(self.market_data_manager.running, True)
-        self.assertIsNotNone(self.market_data_manager.update_thread)
-        
-        # Attendre un peu pour que le thread démarre
-        time.sleep(0.1)
-        
-        # Arrêter le gestionnaire de données
-        self.market_data_manager.stop()
-        
-        # Vérifier que le gestionnaire de données est arrêté
-        self.assertEqual(self.market_data_manager.running, False)
-    
-    def test_get_ticker(self):
-        """
-        Teste la récupération d'un ticker.
-        """
-        # Récupérer un ticker
-        ticker = self.market_data_manager.get_ticker("BTC/USDT", "binance")
-        
-        # Vérifier que le ticker est correctement récupéré
-        self.assertIsNotNone(ticker)
-        self.assertEqual(ticker["symbol"], "BTC/USDT")
-        self.assertEqual(ticker["bid"], 50000.0)
-        self.assertEqual(ticker["ask"], 50100.0)
-        
-        # Vérifier que le mock a été appelé
-        self.mock_exchange.fetch_ticker.assert_called_once_with("BTC/USDT")
-    
-    def test_get_order_book(self):
-        """
-        Teste la récupération d'un carnet d'ordres.
-        """
-        # Récupérer un carnet d'ordres
-        order_book = self.market_data_manager.get_order_book("BTC/USDT", "binance")
-        
-        # Vérifier que le carnet d'ordres est correctement récupéré
-        self.assertIsNotNone(order_book)
-        self.assertEqual(len(order_book["bids"]), 3)
-        self.assertEqual(len(order_book["asks"]), 3)
-        self.assertEqual(order_book["bids"][0][0], 50000.0)
-        self.assertEqual(order_book["asks"][0][0], 50100.0)
-        
-        # Vérifier que le mock a été appelé
-        self.mock_exchange.fetch_order_book.assert_called_once_with("BTC/USDT", 10)
-    
-    def test_get_recent_candles(self):
-        """
-        Teste la récupération des bougies OHLCV récentes.
-        """
-        # Récupérer les bougies OHLCV récentes
-        candles = self.market_data_manager.get_recent_candles("BTC/USDT", "1h", 3, "binance")
-        
-        # Vérifier que les bougies sont correctement récupérées
-        self.assertIsNotNone(candles)
-        self.assertEqual(len(candles), 3)
-        
-        # Vérifier que le mock a été appelé
-        self.mock_exchange.fetch_ohlcv.assert_called_once()
-    
-    def test_get_volatility(self):
-        """
-        Teste le calcul de la volatilité.
-        """
-        # Configurer le mock pour renvoyer des prix spécifiques
-        self.market_data_manager.get_recent_prices = MagicMock(return_value=[
-            50000.0, 50100.0, 50200.0, 50150.0, 50050.0
-        ])
-        
-        # Calculer la volatilité
-        volatility = self.market_data_manager.get_volatility("BTC/USDT", 5, "1h", "binance")
-        
-        # Vérifier que la volatilité est correctement calculée
-        self.assertIsNotNone(volatility)
-        self.assertGreaterEqual(volatility, 0.0)
-        
-        # Vérifier que le mock a été appelé
-        self.market_data_manager.get_recent_prices.assert_called_once_with("BTC/USDT", "1h", 6, "binance")
-    
-    def test_get_trend_indicator(self):
-        """
-        Teste le calcul de l'indicateur de tendance.
-        """
-        # Configurer le mock pour renvoyer des prix spécifiques
-        self.market_data_manager.get_recent_prices = MagicMock(return_value=[
-            50000.0, 50100.0, 50200.0, 50300.0, 50400.0
-        ])
-        
-        # Calculer l'indicateur de tendance
-        trend = self.market_data_manager.get_trend_indicator("BTC/USDT", 5, "1h", "binance")
-        
-        # Vérifier que l'indicateur de tendance est correctement calculé
-        self.assertIsNotNone(trend)
-        self.assertGreaterEqual(trend, 0.0)  # Tendance haussière
-        
-        # Vérifier que le mock a été appelé
-        self.market_data_manager.get_recent_prices.assert_called_once_with("BTC/USDT", "1h", 5, "binance")
-    
-    def test_get_current_spread(self):
-        """
-        Teste le calcul du spread actuel.
-        """
-        # Configurer le mock pour renvoyer un ticker spécifique
-        self.market_data_manager.get_ticker = MagicMock(return_value={
-            "bid": 50000.0,
-            "ask": 50100.0
-        })
-        
-        # Calculer le spread actuel
-        spread = self.market_data_manager.get_current_spread("BTC/USDT", "binance")
-        
-        # Vérifier que le spread est correctement calculé
-        self.assertIsNotNone(spread)
-        self.assertEqual(spread, 0.2)  # (50100 - 50000) / 50050 * 100 = 0.2%
-        
-        # Vérifier que le mock a été appelé
-        self.market_data_manager.get_ticker.assert_called_once_with("BTC/USDT", "binance")
-    
-    def test_get_order_book_depth(self):
-        """
-        Teste le calcul de la profondeur du carnet d'ordres.
-        """
-        # Configurer le mock pour renvoyer un carnet d'ordres spécifique
-        self.market_data_manager.get_order_book = MagicMock(return_value={
-            "bids": [[50000.0, 1.0], [49900.0, 2.0], [49800.0, 3.0]],
-            "asks": [[50100.0, 1.0], [50200.0, 2.0], [50300.0, 3.0]]
-        })
-        
-        # Calculer la profondeur du carnet d'ordres
-        depth = self.market_data_manager.get_order_book_depth("BTC/USDT", "binance")
-        
-        # Vérifier que la profondeur est correctement calculée
-        self.assertIsNotNone(depth)
-        self.assertEqual(depth, 0.12)  # (1+2+3+1+2+3) / 100 = 0.12
-        
-        # Vérifier que le mock a été appelé
-        self.market_data_manager.get_order_book.assert_called_once_with("BTC/USDT", "binance")
-    
-    def test_update(self):
-        """
-        Teste la mise à jour manuelle des données de marché.
-        """
-        # Mettre à jour les données de marché
-        self.market_data_manager.update()
-        
-        # Vérifier que les mocks ont été appelés
-        self.mock_exchange.fetch_ticker.assert_called()
-        self.mock_exchange.fetch_order_book.assert_called()
-        self.mock_exchange.fetch_ohlcv.assert_called()
-    
-    def test_cache_expiry(self):
-        """
-        Teste l'expiration du cache.
-        """
-        # Configurer le gestionnaire de données pour un cache à courte durée
-        self.market_data_manager.cache_expiry_seconds = 0.1
-        
+    # Arrêter le gestionnaire de données s'il est en cours d'exécution
+    if manager._ready.is_set():
+        manager.stop()
+
+
+def test_initialization(market_data_manager, mock_exchange):
+    """
+    Teste l'initialisation du gestionnaire de données.
+    """
+    # Vérifier que le gestionnaire de données est correctement initialisé
+    assert market_data_manager.config is CONFIG
+    assert market_data_manager.exchanges == {"binance": mock_exchange}
+
+    # Vérifier que le cache est vide et que les flux ne sont pas démarrés
+    assert not market_data_manager.data_cache
+    assert not market_data_manager._ready.is_set()
+
+
+def test_start_stop(market_data_manager, mock_exchange):
+    """
+    Teste le démarrage et l'arrêt du gestionnaire de données.
+    """
+    # Démarrer le gestionnaire de données
+    market_data_manager.start()
+
+    # Vérifier que les flux sont démarrés et le gestionnaire signalé prêt
+    assert market_data_manager._ready.is_set()
+    mock_exchange.start_market_data_stream.assert_called_once()
+
+    # Arrêter le gestionnaire de données
+    market_data_manager.update_market_data("BTC/USDT", "ticker", TICKER_TEMPLATE)
+    market_data_manager.stop()
+
+    # Vérifier que les flux sont arrêtés et le cache vidé
+    assert not market_data_manager._ready.is_set()
+    mock_exchange.stop_market_data_stream.assert_called_once()
+    assert not market_data_manager.data_cache
+
+
+def test_market_data_cache(market_data_manager):
+    """
+    Teste la mise en cache des données de marché.
+    """
+    # Un symbole inconnu renvoie des données vides, mises en cache
+    assert market_data_manager.get_market_data("BTC/USDT", "ticker") == {}
+
+    # Mettre à jour les données puis les relire depuis le cache
+    market_data_manager.update_market_data("BTC/USDT", "ticker", TICKER_TEMPLATE)
+    assert market_data_manager.get_market_data("BTC/USDT", "ticker") is TICKER_TEMPLATE
+
+
+def test_get_ticker(market_data_manager, mock_exchange):
+    """
+    Teste la récupération d'un ticker.
+    """
+    # Récupérer un ticker
+    ticker = market_data_manager.get_ticker("BTC/USDT", "binance")
+
+    # Vérifier que le ticker est correctement récupéré et mis en cache
+    assert ticker["bid"] == 50000.0
+    assert ticker["ask"] == 50100.0
+    assert market_data_manager.get_market_data("BTC/USDT", "ticker") is TICKER_TEMPLATE
+
+    # Vérifier que le mock a été appelé
+    mock_exchange.fetch_ticker.assert_called_once_with("BTC/USDT")
+
+    # Une erreur de l'exchange renvoie None
+    mock_exchange.fetch_ticker.side_effect = Exception("timeout")
+    assert market_data_manager.get_ticker("BTC/USDT", "binance") is None
+
+
+def test_cache_expiry(market_data_manager, mock_exchange):
+    """
+    Teste l'expiration du cache des tickers.
+    """
+    market_data_manager.ticker_cache_seconds = 10
+
+    # Horloge simulée: l'expiration est testée sans attente réelle
+    with patch("src.market_data.market_data_manager.time.time", return_value=1000.0) as mock_time:
         # Récupérer un ticker (première requête)
-        ticker1 = self.market_data_manager.get_ticker("BTC/USDT", "binance")
-        
-        # Vérifier que le mock a été appelé une fois
-        self.assertEqual(self.mock_exchange.fetch_ticker.call_count, 1)
-        
+        market_data_manager.get_ticker("BTC/USDT", "binance")
+        assert mock_exchange.fetch_ticker.call_count == 1
+
         # Récupérer à nouveau le ticker (devrait utiliser le cache)
-        ticker2 = self.market_data_manager.get_ticker("BTC/USDT", "binance")
-        
-        # Vérifier que le mock n'a pas été appelé à nouveau
-        self.assertEqual(self.mock_exchange.fetch_ticker.call_count, 1)
-        
-        # Attendre que le cache expire
-        time.sleep(0.2)
-        
+        assert market_data_manager.get_ticker("BTC/USDT", "binance") is TICKER_TEMPLATE
+        assert mock_exchange.fetch_ticker.call_count == 1
+
+        # Avancer l'horloge au-delà de la durée du cache
+        mock_time.return_value += market_data_manager.ticker_cache_seconds + 1
+
         # Récupérer à nouveau le ticker (le cache devrait être expiré)
-        ticker3 = self.market_data_manager.get_ticker("BTC/USDT", "binance")
-        
-        # Vérifier que le mock a été appelé à nouveau
-        self.assertEqual(self.mock_exchange.fetch_ticker.call_count, 2)
+        market_data_manager.get_ticker("BTC/USDT", "binance")
+        assert mock_exchange.fetch_ticker.call_count == 2
+
+
+def test_get_tickers(market_data_manager, mock_exchange):
+    """
+    Teste la récupération groupée des tickers en un seul appel à l'exchange.
+    """
+    eth_ticker = dict(TICKER_TEMPLATE, symbol="ETH/USDT", last=3000.0)
+    mock_exchange.fetch_tickers.return_value = {
+        "BTC/USDT": TICKER_TEMPLATE,
+        "ETH/USDT": eth_ticker,
+        "SOL/USDT": dict(TICKER_TEMPLATE, symbol="SOL/USDT")
+    }
+
+    # Récupérer les tickers de deux symboles
+    tickers = market_data_manager.get_tickers(["BTC/USDT", "ETH/USDT"], "binance")
+
+    # Vérifier que seuls les symboles demandés sont renvoyés et mis en cache
+    assert tickers == {"BTC/USDT": TICKER_TEMPLATE, "ETH/USDT": eth_ticker}
+    assert market_data_manager.get_market_data("ETH/USDT", "ticker") is eth_ticker
+
+    # Vérifier qu'un seul appel groupé a été fait
+    mock_exchange.fetch_tickers.assert_called_once_with(["BTC/USDT", "ETH/USDT"])
+    mock_exchange.fetch_ticker.assert_not_called()
+
+    # Une erreur de l'exchange ou un exchange inconnu renvoie un résultat vide
+    assert market_data_manager.get_tickers(["BTC/USDT"], "kraken") == {}
+    mock_exchange.fetch_tickers.side_effect = Exception("timeout")
+    assert market_data_manager.get_tickers(["BTC/USDT"], "binance") == {}
+
+
+def test_get_tickers_without_batch_endpoint():
+    """
+    Teste la récupération des tickers un par un sur un exchange sans fetch_tickers.
+    """
+    eth_ticker = dict(TICKER_TEMPLATE, symbol="ETH/USDT", last=3000.0)
+    tickers_by_symbol = {"BTC/USDT": TICKER_TEMPLATE, "ETH/USDT": eth_ticker}
+
+    # Exchange limité à fetch_ticker, comme les connecteurs de src.exchanges
+    exchange = MagicMock(spec=["fetch_ticker"])
+
+    def fetch_ticker(symbol):
+        if symbol not in tickers_by_symbol:
+            raise Exception("symbole inconnu")
+        return tickers_by_symbol[symbol]
+
+    exchange.fetch_ticker.side_effect = fetch_ticker
+    manager = MarketDataManager(CONFIG, {"binance": exchange})
+
+    # Les symboles en erreur sont ignorés, les autres renvoyés et mis en cache
+    tickers = manager.get_tickers(["BTC/USDT", "ETH/USDT", "SOL/USDT"], "binance")
+    assert tickers == tickers_by_symbol
+    assert manager.get_market_data("ETH/USDT", "ticker") is eth_ticker
+    assert exchange.fetch_ticker.call_count == 3
+
+
+def test_get_order_book(market_data_manager, mock_exchange):
+    """
+    Teste la récupération d'un carnet d'ordres.
+    """
+    # Récupérer un carnet d'ordres
+    order_book = market_data_manager.get_order_book("BTC/USDT", "binance", 10)
+
+    # Vérifier que le carnet d'ordres est correctement récupéré et mis en cache
+    assert len(order_book["bids"]) == 3
+    assert order_book["asks"][0][0] == 50100.0
+    assert market_data_manager.get_market_data("BTC/USDT", "orderbook") is ORDER_BOOK_TEMPLATE
+
+    # Vérifier que le mock a été appelé
+    mock_exchange.fetch_order_book.assert_called_once_with("BTC/USDT", 10)
+
+    # Une erreur de l'exchange renvoie None
+    mock_exchange.fetch_order_book.side_effect = Exception("timeout")
+    assert market_data_manager.get_order_book("BTC/USDT", "binance") is None
+
+
+def test_get_recent_candles(market_data_manager, mock_exchange):
+    """
+    Teste la récupération des bougies OHLCV récentes.
+    """
+    # Récupérer les bougies OHLCV récentes sous forme de dictionnaires
+    candles = market_data_manager.get_recent_candles("BTC/USDT", "1h", 3, "binance")
+
+    # Vérifier que les bougies sont correctement récupérées
+    assert len(candles) == 3
+    assert list(candles[0]) == list(OHLCV_COLUMNS)
+    assert candles[0]["close"] == 50050.0
+
+    # Vérifier que le mock a été appelé
+    mock_exchange.fetch_ohlcv.assert_called_once_with("BTC/USDT", "1h", 3)
+
+
+def test_get_recent_candles_as_array(market_data_manager, mock_exchange):
+    """
+    Teste la récupération des bougies sous forme de tableau, avec et sans filtre temporel.
+    """
+    # Récupérer les bougies sous forme de tableau
+    candles = market_data_manager.get_recent_candles("BTC/USDT", "1h", 3, "binance", as_array=True)
+    np.testing.assert_array_equal(candles, OHLCV_TEMPLATE)
+
+    # Ne conserver que les bougies ouvertes depuis l'horodatage demandé, transmis à l'exchange
+    since = int(OHLCV_TEMPLATE[1, 0])
+    candles = market_data_manager.get_recent_candles("BTC/USDT", "1h", 3, "binance", since=since, as_array=True)
+    np.testing.assert_array_equal(candles, OHLCV_TEMPLATE[OHLCV_TEMPLATE[:, 0] >= since])
+    mock_exchange.fetch_ohlcv.assert_called_with("BTC/USDT", "1h", 3, since=since)
+
+
+def test_get_recent_candles_closed_only():
+    """
+    Teste l'exclusion de la bougie encore ouverte.
+    """
+    # Bougie horaire ouverte il y a une minute, pas encore clôturée
+    open_candle = [int(time.time() * 1000) - 60000, 50050.0, 50100.0, 50000.0, 50080.0, 10.0]
+    exchange = MagicMock()
+    exchange.fetch_ohlcv.return_value = np.vstack([OHLCV_TEMPLATE, open_candle])
+    market_data_manager = MarketDataManager(CONFIG, {"binance": exchange})
+
+    candles = market_data_manager.get_recent_candles("BTC/USDT", "1h", 4, "binance", as_array=True, closed_only=True)
+    np.testing.assert_array_equal(candles, OHLCV_TEMPLATE)
+
+    candles = market_data_manager.get_recent_candles("BTC/USDT", "1h", 4, "binance", closed_only=True)
+    assert [candle["timestamp"] for candle in candles] == OHLCV_TEMPLATE[:, 0].tolist()
+
+    # Sans closed_only, la bougie ouverte est conservée
+    candles = market_data_manager.get_recent_candles("BTC/USDT", "1h", 4, "binance", as_array=True)
+    assert len(candles) == 4
+
+
+def test_get_recent_candles_errors(market_data_manager, mock_exchange):
+    """
+    Teste la récupération des bougies en cas d'erreur ou d'exchange inconnu.
+    """
+    # Un exchange inconnu renvoie un résultat vide
+    assert market_data_manager.get_recent_candles("BTC/USDT", exchange_id="kraken") == []
+
+    # Une erreur de l'exchange renvoie un résultat vide
+    mock_exchange.fetch_ohlcv.side_effect = Exception("timeout")
+    candles = market_data_manager.get_recent_candles("BTC/USDT", exchange_id="binance", as_array=True)
+    assert candles.shape == (0, 6)
+
+
+def test_update(market_data_manager, mock_exchange):
+    """
+    Teste la mise à jour manuelle des données de marché.
+    """
+    # Mettre à jour les données de marché
+    market_data_manager.update()
+
+    # Vérifier que les mocks ont été appelés pour chaque symbole
+    assert mock_exchange.fetch_ticker.call_count == 2
+    assert mock_exchange.fetch_order_book.call_count == 2
+
+    # Vérifier que les données sont en cache
+    assert market_data_manager.get_market_data("ETH/USDT", "ticker") is TICKER_TEMPLATE
+    assert market_data_manager.get_market_data("ETH/USDT", "orderbook") is ORDER_BOOK_TEMPLATE
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__])
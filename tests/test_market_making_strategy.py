@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests unitaires pour la stratégie de market making.
+
+Ce module contient les tests unitaires pour valider le fonctionnement
+de la stratégie de market making.
+"""
+
+import itertools
+import logging
+import threading
+from unittest.mock import MagicMock
+import pytest
+from typing import Dict, Any
+
+from src.strategies.market_making_strategy import MarketMakingStrategy
+
+# Symboles suivis et tickers renvoyés par le gestionnaire de données factice
+SYMBOLS = ["BTC/USDT", "ETH/USDT"]
+TICKERS = {
+    "BTC/USDT": {"bid": 50000.0, "ask": 50100.0, "last": 50050.0},
+    "ETH/USDT": {"bid": 3000.0, "ask": 3001.0, "last": 3000.5},
+    "SOL/USDT": {"bid": 100.0, "ask": 100.1, "last": 100.05}
+}
+
+# Pas de cotation renvoyé par l'exécuteur d'ordres factice
+TICK = 0.5
+
+
+def _make_config(symbols=SYMBOLS) -> Dict[str, Any]:
+    """
+    Construit la configuration de la stratégie (un nouvel objet par appel).
+    """
+    return {
+        "name": "MarketMaking",
+        "symbols": list(symbols),
+        "parameters": {
+            "spread_bid": 0.1,
+            "spread_ask": 0.1,
+            "order_size": 0.01,
+            "order_count": 3,
+            "refresh_rate": 10
+        }
+    }
+
+
+@pytest.fixture
+def market_data_manager():
+    """
+    Gestionnaire de données de marché factice, enregistrant les threads appelants.
+    """
+    manager = MagicMock()
+    manager.threads = set()
+
+    def get_ticker(symbol, exchange_id=None):
+        manager.threads.add(threading.current_thread().name)
+        return TICKERS.get(symbol)
+
+    manager.get_ticker.side_effect = get_ticker
+    return manager
+
+
+@pytest.fixture
+def order_executor():
+    """
+    Exécuteur d'ordres factice attribuant un identifiant unique à chaque ordre placé.
+    """
+    executor = MagicMock()
+    executor.get_price_increment.return_value = TICK
+    ids = itertools.count(1)
+
+    def place_batch(symbol, orders, exchange_id=None):
+        return [dict(order, id=str(next(ids)), symbol=symbol) for order in orders]
+
+    executor.place_batch.side_effect = place_batch
+    return executor
+
+
+@pytest.fixture
+def strategy(market_data_manager, order_executor):
+    """
+    Stratégie de market making sur deux symboles, arrêtée en fin de test.
+    """
+    strategy = MarketMakingStrategy("mm_test", market_data_manager, order_executor, config=_make_config())
+    strategy.start()
+    yield strategy
+    if strategy.is_running:
+        strategy.stop()
+
+
+def test_execute_places_sorted_orders_for_each_symbol(strategy, market_data_manager):
+    """
+    Teste le placement des ordres de chaque symbole depuis les threads du pool.
+    """
+    strategy.execute()
+
+    for symbol in SYMBOLS:
+        orders = strategy.active_orders[symbol]
+        keys = strategy._order_keys[symbol]
+
+        # Trois niveaux par côté, du plus compétitif au moins compétitif
+        buy_prices = [order["price"] for order in orders["buy"]]
+        sell_prices = [order["price"] for order in orders["sell"]]
+        assert len(buy_prices) == len(sell_prices) == 3
+        assert buy_prices == sorted(buy_prices, reverse=True)
+        assert sell_prices == sorted(sell_prices)
+        assert list(keys["buy"]) == [-price for price in buy_prices]
+        assert list(keys["sell"]) == sell_prices
+
+        # Les cotations restent derrière le meilleur bid/ask
+        assert buy_prices[0] < TICKERS[symbol]["bid"]
+        assert sell_prices[0] > TICKERS[symbol]["ask"]
+
+    # Les symboles ont été traités par les threads du pool, pas par le thread appelant
+    assert all(name.startswith("mm_mm_test") for name in market_data_manager.threads)
+
+
+def test_execute_counts_missing_market_data(strategy, market_data_manager):
+    """
+    Teste le comptage des échecs d'obtention des données de marché par symbole.
+    """
+    market_data_manager.get_ticker.side_effect = lambda symbol, exchange_id=None: (
+        None if symbol == "ETH/USDT" else TICKERS[symbol])
+
+    strategy.execute()
+
+    status = strategy.get_status()
+    assert status["error_counts"] == {"BTC/USDT": 0, "ETH/USDT": 1}
+    assert len(strategy.active_orders["BTC/USDT"]["buy"]) == 3
+    assert strategy.active_orders["ETH/USDT"] == {"buy": [], "sell": []}
+
+
+def test_execute_merges_other_symbols_when_one_raises(strategy):
+    """
+    Teste que l'erreur d'un symbole n'empêche pas l'enregistrement des ordres placés pour les autres.
+    """
+    def detect_market_manipulation(symbol):
+        if symbol == "ETH/USDT":
+            raise RuntimeError("timeout")
+        return False
+
+    strategy.risk_manager = MagicMock()
+    strategy.risk_manager.detect_market_manipulation.side_effect = detect_market_manipulation
+
+    strategy.execute()
+
+    # Les ordres placés pour BTC/USDT sont suivis et pourront être annulés
+    assert len(strategy.active_orders["BTC/USDT"]["buy"]) == 3
+    assert len(strategy.active_orders["BTC/USDT"]["sell"]) == 3
+    assert strategy.get_status()["error_counts"] == {"BTC/USDT": 0, "ETH/USDT": 1}
+
+
+def test_execute_refreshes_orders_after_price_move(strategy, order_executor):
+    """
+    Teste l'annulation des ordres existants lorsque les prix ont dérivé.
+    """
+    strategy.execute()
+    previous_ids = {order["id"] for sides in strategy.active_orders.values()
+                    for orders in sides.values() for order in orders}
+
+    # Déplacer le marché et forcer un nouveau cycle
+    moved_tickers = {symbol: {"bid": t["bid"] * 1.01, "ask": t["ask"] * 1.01} for symbol, t in TICKERS.items()}
+    strategy.market_data_manager.get_ticker.side_effect = lambda symbol, exchange_id=None: moved_tickers[symbol]
+    strategy._last_refresh[:] = 0.0
+    strategy.execute()
+
+    cancelled_ids = {call.args[1] for call in order_executor.cancel_order.call_args_list}
+    assert cancelled_ids == previous_ids
+    assert all(len(strategy.active_orders[symbol]["sell"]) == 3 for symbol in SYMBOLS)
+
+
+def test_execute_skips_symbols_not_due(strategy, market_data_manager):
+    """
+    Teste que seuls les symboles dont l'intervalle de rafraîchissement est écoulé sont traités.
+    """
+    strategy.execute()
+    market_data_manager.get_ticker.reset_mock()
+
+    strategy.execute()
+    market_data_manager.get_ticker.assert_not_called()
+
+
+def test_start_stop_signals_ready(strategy):
+    """
+    Teste la signalisation de l'état démarré de la stratégie par son événement _ready.
+    """
+    assert strategy._ready.wait(timeout=2.0)
+
+    strategy.stop()
+    assert not strategy._ready.is_set()
+
+
+def test_stop_shuts_down_symbol_executor(strategy):
+    """
+    Teste l'arrêt du pool de threads à l'arrêt de la stratégie et sa recréation à la demande.
+    """
+    strategy.execute()
+    executor = strategy.symbol_executor
+
+    strategy.stop()
+    assert strategy.symbol_executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+    # Une nouvelle exécution recrée le pool
+    strategy._last_refresh[:] = 0.0
+    strategy.execute()
+    assert strategy.symbol_executor is not None
+    strategy.symbol_executor.shutdown(wait=True)
+
+
+def test_update_config_resizes_symbol_executor(strategy):
+    """
+    Teste le redimensionnement du pool de threads lors d'un changement de symboles.
+    """
+    executor = strategy.symbol_executor
+
+    strategy.update_config({"symbols": SYMBOLS + ["SOL/USDT"]})
+
+    assert strategy.symbol_executor is not executor
+    assert strategy.symbol_executor._max_workers == 3
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+    # Le nouveau symbole est traité au cycle suivant
+    strategy.execute()
+    assert len(strategy.active_orders["SOL/USDT"]["buy"]) == 3
+
+
+@pytest.mark.parametrize("tick", [0.0, TICK])
+def test_order_prices_stay_behind_best_quotes(strategy, tick):
+    """
+    Teste que les cotations restent strictement derrière le meilleur bid/ask, y compris sans pas de cotation.
+    """
+    # Marché large: les cotations calculées autour du prix moyen seraient à l'intérieur du spread
+    market_data = {"bid_price": 99.0, "ask_price": 101.0, "mid_price": 100.0}
+
+    prices = strategy._calculate_order_prices("BTC/USDT", market_data, tick)
+
+    assert max(prices["bid_prices"]) < market_data["bid_price"]
+    assert min(prices["ask_prices"]) > market_data["ask_price"]
+
+
+def test_start_refreshes_log_level(market_data_manager, order_executor):
+    """
+    Teste la réévaluation du niveau DEBUG au démarrage, après une reconfiguration de la journalisation.
+    """
+    strategy_logger = logging.getLogger("src.strategies.market_making_strategy")
+    previous_level = strategy_logger.level
+    strategy_logger.setLevel(logging.INFO)
+    try:
+        strategy = MarketMakingStrategy("mm_log", market_data_manager, order_executor, config=_make_config())
+        assert not strategy._debug_enabled
+
+        strategy_logger.setLevel(logging.DEBUG)
+        strategy.start()
+        assert strategy._debug_enabled
+        strategy.stop()
+    finally:
+        strategy_logger.setLevel(previous_level)
+
+
+def test_remove_filled_order(strategy):
+    """
+    Teste le retrait d'un ordre exécuté des ordres actifs.
+    """
+    strategy.execute()
+    order = strategy.active_orders["BTC/USDT"]["buy"][1]
+
+    assert strategy.remove_filled_order("BTC/USDT", order)
+    assert order not in strategy.active_orders["BTC/USDT"]["buy"]
+    assert len(strategy._order_keys["BTC/USDT"]["buy"]) == 2
+    assert not strategy.remove_filled_order("BTC/USDT", order)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,198 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Tests unitaires pour l'exécuteur d'ordres.
+
+Ce module contient les tests unitaires pour valider le placement des ordres,
+unitaires et groupés, sur un exchange factice.
+"""
+
+import itertools
+from unittest.mock import MagicMock, patch
+import pytest
+
+from src.execution.order_executor import OrderExecutor
+
+SYMBOL = "BTC/USDT"
+EXCHANGE_ID = "fake"
+
+
+class FakeExchange:
+    """
+    Exchange factice exposant la création groupée d'ordres (create_orders).
+
+    Les premiers appels peuvent échouer pour simuler des erreurs transitoires.
+    """
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.batches = []
+        self.limit_calls = []
+        self._ids = itertools.count(1)
+
+    def _maybe_fail(self):
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("erreur réseau simulée")
+
+    def create_orders(self, batch):
+        self.batches.append(batch)
+        self._maybe_fail()
+        return [{"id": str(next(self._ids)), "status": "open"} for _ in batch]
+
+    def create_limit_order(self, symbol, side, amount, price, params):
+        self.limit_calls.append((symbol, side, amount, price, params))
+        self._maybe_fail()
+        return {"id": str(next(self._ids)), "status": "open"}
+
+    def fetch_order(self, order_id, symbol):
+        return {"id": order_id, "status": "open"}
+
+    def cancel_all_orders(self, symbol):
+        return []
+
+    def load_markets(self):
+        return {SYMBOL: {}}
+
+
+def _make_executor(exchange, risk_manager=None) -> OrderExecutor:
+    """
+    Construit un exécuteur d'ordres sur l'exchange factice, sans délai entre les tentatives.
+    """
+    config = {"retry_attempts": 2, "retry_delay_seconds": 0, "use_iceberg_orders": True}
+    return OrderExecutor({EXCHANGE_ID: exchange}, config, risk_manager=risk_manager)
+
+
+@pytest.fixture
+def thread_mock():
+    """
+    Remplace le thread d'exécution: aucun thread réel, aucune attente de sa boucle à l'arrêt.
+    """
+    with patch("src.execution.order_executor.threading.Thread") as mock:
+        mock.return_value.is_alive.return_value = True
+        yield mock
+
+
+@pytest.fixture
+def executors(thread_mock):
+    """
+    Exécuteurs créés par le test, arrêtés en fin de test.
+    """
+    created = []
+
+    def factory(exchange, risk_manager=None):
+        executor = _make_executor(exchange, risk_manager)
+        created.append(executor)
+        return executor
+
+    yield factory
+    for executor in created:
+        executor.stop()
+
+
+def test_start_stop(executors, thread_mock):
+    """
+    Teste le démarrage du thread d'exécution à la construction et son attente à l'arrêt.
+    """
+    executor = executors(FakeExchange())
+
+    # Vérifier que le thread d'exécution est créé et démarré
+    assert executor.running is True
+    thread_mock.assert_called_once_with(target=executor._execution_loop)
+    thread_mock.return_value.start.assert_called_once()
+
+    # Arrêter l'exécuteur et vérifier que le thread est rejoint
+    executor.stop()
+    assert executor.running is False
+    thread_mock.return_value.join.assert_called()
+
+
+ORDERS = [
+    {"side": "buy", "type": "limit", "amount": 0.5, "price": 49900.0},
+    {"side": "buy", "type": "limit", "amount": 0.01, "price": 49800.0},
+    {"side": "sell", "type": "limit", "amount": 0.5, "price": 50100.0},
+]
+
+
+def test_place_batch_sends_one_request_with_order_params(executors):
+    """
+    Teste l'envoi d'une seule requête groupée avec les paramètres iceberg et les identifiants clients.
+    """
+    exchange = FakeExchange()
+    executor = executors(exchange)
+
+    placed = executor.place_batch(SYMBOL, ORDERS, exchange_id=EXCHANGE_ID)
+
+    assert len(exchange.batches) == 1
+    assert len(placed) == 3
+    params = [request["params"] for request in exchange.batches[0]]
+
+    # Paramètres iceberg pour les ordres limit au-delà de 0.1, comme pour place_order
+    assert params[0]["iceberg"] is True
+    assert params[0]["visible_size"] == pytest.approx(0.1)
+    assert "iceberg" not in params[1]
+    assert params[2]["iceberg"] is True
+
+    # Identifiants clients distincts au sein de la requête
+    assert [p["clientOrderId"][-2:] for p in params] == ["_0", "_1", "_2"]
+    assert [order["client_id"] for order in placed] == [p["clientOrderId"] for p in params]
+    assert len(executor.active_orders[EXCHANGE_ID][SYMBOL]) == 3
+
+
+def test_place_batch_retries_transient_failure(executors):
+    """
+    Teste le réessai de la requête groupée après une erreur transitoire.
+    """
+    exchange = FakeExchange(failures=1)
+    executor = executors(exchange)
+
+    placed = executor.place_batch(SYMBOL, ORDERS, exchange_id=EXCHANGE_ID)
+
+    assert len(exchange.batches) == 2
+    assert len(placed) == 3
+
+
+def test_place_batch_gives_up_after_retry_attempts(executors):
+    """
+    Teste l'abandon de la requête groupée une fois les tentatives épuisées.
+    """
+    exchange = FakeExchange(failures=10)
+    executor = executors(exchange)
+
+    assert executor.place_batch(SYMBOL, ORDERS, exchange_id=EXCHANGE_ID) == []
+    assert len(exchange.batches) == executor.retry_attempts + 1
+
+
+def test_place_batch_checks_risk_once_per_order(executors):
+    """
+    Teste la vérification unique des limites de risque pour chaque ordre du lot.
+    """
+    risk_manager = MagicMock()
+    risk_manager.check_position_limit.side_effect = lambda symbol, side, amount: side == "buy"
+    exchange = FakeExchange()
+    executor = executors(exchange, risk_manager)
+
+    placed = executor.place_batch(SYMBOL, ORDERS, exchange_id=EXCHANGE_ID)
+
+    assert risk_manager.check_position_limit.call_count == len(ORDERS)
+    assert [order["side"] for order in placed] == ["buy", "buy"]
+    assert [request["side"] for request in exchange.batches[0]] == ["buy", "buy"]
+
+
+def test_place_order_retry_is_bounded(executors):
+    """
+    Teste que place_order abandonne après retry_attempts réessais sans modifier les paramètres fournis.
+    """
+    exchange = FakeExchange(failures=10)
+    executor = executors(exchange)
+    params = {"timeInForce": "GTC"}
+
+    assert executor.place_order(SYMBOL, "buy", "limit", 0.5, 49900.0, exchange_id=EXCHANGE_ID, params=params) is None
+    assert len(exchange.limit_calls) == executor.retry_attempts + 1
+    assert params == {"timeInForce": "GTC"}
+    assert exchange.limit_calls[0][4]["iceberg"] is True
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
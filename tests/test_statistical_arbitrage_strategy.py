@@ -8,317 +8,562 @@ Ce module contient les tests unitaires pour valider le fonctionnement
 de la stratégie d'arbitrage statistique.
 """
 
-import unittest
+import asyncio
+import copy
+import threading
 import time
-import pandas as pd
 import numpy as np
-from unittest.mock import MagicMock, patch
-from typing import Dict, Any, List
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from typing import Dict, Any
 
-from src.strategies.statistical_arbitrage_strategy import StatisticalArbitrageStrategy
-from src.data.market_data_manager import MarketDataManager
+from src.strategies.statistical_arbitrage_strategy import StatisticalArbitrageStrategy, DIR_LONG, DIR_SHORT
 
+# Paire suivie par la stratégie de test
+_PAIR_ID = "BTC/USDT_ETH/USDT"
+_BTC = ("BTC/USDT", "binance")
+_ETH = ("ETH/USDT", "binance")
 
-class TestStatisticalArbitrageStrategy(unittest.TestCase):
+# Ticker renvoyé par le gestionnaire de données factice
+_TICKER = {"bid": 50000.0, "ask": 50100.0, "last": 50050.0}
+
+
+class _MDMStub:
     """
-    Tests unitaires pour la stratégie d'arbitrage statistique.
+    Gestionnaire de données de marché factice, limité aux méthodes utilisées par la stratégie.
     """
-    
-    def setUp(self):
-        """
-        Initialise l'environnement de test avant chaque test.
-        """
-        # Créer un mock pour le gestionnaire de données de marché
-        self.market_data_manager = MagicMock(spec=MarketDataManager)
-        
-        # Configurer les mocks pour les méthodes du gestionnaire de données
-        self.market_data_manager.get_recent_prices.return_value = [
-            50000.0, 50100.0, 50200.0, 50300.0, 50400.0
+
+    def __init__(self, candles: Dict[str, np.ndarray]):
+        def get_recent_candles(symbol, interval="1h", limit=100, exchange_id=None, since=None, as_array=False,
+                               closed_only=False):
+            rows = candles.get(symbol, np.empty((0, 6)))
+            return rows if since is None else rows[rows[:, 0] >= since]
+
+        def get_tickers(symbols, exchange_id=None):
+            return {symbol: {"last": candles[symbol][-1, 4]} for symbol in symbols if symbol in candles}
+
+        self.get_recent_candles = MagicMock(side_effect=get_recent_candles)
+        self.get_ticker = MagicMock(return_value=_TICKER)
+        self.get_tickers = MagicMock(side_effect=get_tickers)
+
+
+def _make_config() -> Dict[str, Any]:
+    """
+    Construit la configuration de la stratégie (un nouvel objet par appel).
+    """
+    return {
+        "name": "StatisticalArbitrage",
+        "enabled": True,
+        "symbols": ["BTC/USDT", "ETH/USDT"],
+        "exchanges": ["binance"],
+        "lookback_period": 30,
+        "z_score_threshold": 2.0,
+        "max_positions": 5,
+        "timeframe": "1h",
+        "pairs": [
+            {
+                "asset1": "BTC/USDT",
+                "asset2": "ETH/USDT",
+                "exchange1": "binance",
+                "exchange2": "binance"
+            }
         ]
-        
-        # Configuration pour la stratégie
-        self.config = {
-            "name": "StatisticalArbitrage",
-            "enabled": True,
-            "symbols": ["BTC/USDT", "ETH/USDT"],
-            "exchanges": ["binance"],
-            "lookback_period": 30,
-            "z_score_threshold": 2.0,
-            "position_size_usd": 1000.0,
-            "max_positions": 5,
-            "rebalance_interval_minutes": 60,
-            "correlation_threshold": 0.7,
-            "pairs": [
-                {
-                    "base": "BTC/USDT",
-                    "quote": "ETH/USDT",
-                    "exchange": "binance",
-                    "hedge_ratio": 0.15
-                }
-            ]
-        }
-        
-        # Créer la stratégie
-        self.strategy = StatisticalArbitrageStrategy(self.config, self.market_data_manager)
-        
-        # Configurer les données historiques pour les tests
-        self.btc_prices = pd.Series(
-            [50000.0 + i * 100 for i in range(100)],
-            index=pd.date_range(start="2023-01-01", periods=100, freq="H")
-        )
-        
-        self.eth_prices = pd.Series(
-            [3000.0 + i * 10 + np.random.normal(0, 50) for i in range(100)],
-            index=pd.date_range(start="2023-01-01", periods=100, freq="H")
-        )
-        
-        # Configurer le mock pour la méthode get_historical_prices
-        def mock_get_historical_prices(symbol, interval, lookback, exchange_id):
-            if symbol == "BTC/USDT":
-                return self.btc_prices.values.tolist()
-            elif symbol == "ETH/USDT":
-                return self.eth_prices.values.tolist()
-            else:
-                return []
-        
-        self.market_data_manager.get_historical_prices.side_effect = mock_get_historical_prices
-        
-        # Configurer le mock pour la méthode get_ticker
-        self.market_data_manager.get_ticker.return_value = {
-            "bid": 50000.0,
-            "ask": 50100.0,
-            "last": 50050.0
-        }
-    
-    def test_initialization(self):
-        """
-        Teste l'initialisation de la stratégie.
-        """
-        # Vérifier que la stratégie est correctement initialisée
-        self.assertEqual(self.strategy.name, "StatisticalArbitrage")
-        self.assertEqual(self.strategy.enabled, True)
-        self.assertEqual(self.strategy.symbols, ["BTC/USDT", "ETH/USDT"])
-        self.assertEqual(self.strategy.exchanges, ["binance"])
-        self.assertEqual(self.strategy.lookback_period, 30)
-        self.assertEqual(self.strategy.z_score_threshold, 2.0)
-        self.assertEqual(self.strategy.position_size_usd, 1000.0)
-        self.assertEqual(self.strategy.max_positions, 5)
-        self.assertEqual(self.strategy.rebalance_interval_minutes, 60)
-        self.assertEqual(self.strategy.correlation_threshold, 0.7)
-        
-        # Vérifier que les structures de données sont initialisées
-        self.assertEqual(len(self.strategy.pairs), 1)
-        self.assertEqual(self.strategy.pairs[0]["base"], "BTC/USDT")
-        self.assertEqual(self.strategy.pairs[0]["quote"], "ETH/USDT")
-        self.assertEqual(self.strategy.pairs[0]["exchange"], "binance")
-        self.assertEqual(self.strategy.pairs[0]["hedge_ratio"], 0.15)
-        
-        # Vérifier que les positions sont initialisées
-        self.assertEqual(self.strategy.positions, {})
-    
-    def test_initialize_model(self):
-        """
-        Teste l'initialisation du modèle d'arbitrage statistique.
-        """
-        # Initialiser le modèle
-        pair = self.strategy.pairs[0]
-        self.strategy._initialize_model(pair)
-        
-        # Vérifier que le modèle est correctement initialisé
-        self.assertIn("model", pair)
-        self.assertIn("spread_mean", pair)
-        self.assertIn("spread_std", pair)
-        self.assertIn("last_update_time", pair)
-        
-        # Vérifier que le gestionnaire de données a été appelé
-        self.market_data_manager.get_historical_prices.assert_called()
-    
-    def test_calculate_z_score(self):
-        """
-        Teste le calcul du Z-score.
-        """
-        # Initialiser le modèle
-        pair = self.strategy.pairs[0]
-        self.strategy._initialize_model(pair)
-        
-        # Configurer les données pour le test
-        pair["spread_mean"] = 0.0
-        pair["spread_std"] = 1.0
-        
-        # Calculer le Z-score
-        z_score = self.strategy._calculate_z_score(2.0, pair)
-        
-        # Vérifier que le Z-score est correctement calculé
-        self.assertEqual(z_score, 2.0)
-    
-    def test_get_current_prices(self):
-        """
-        Teste la récupération des prix actuels.
-        """
-        # Récupérer les prix actuels
-        pair = self.strategy.pairs[0]
-        base_price, quote_price = self.strategy._get_current_prices(pair)
-        
-        # Vérifier que les prix sont correctement récupérés
-        self.assertEqual(base_price, 50050.0)
-        self.assertEqual(quote_price, 50050.0)
-        
-        # Vérifier que le gestionnaire de données a été appelé
-        self.market_data_manager.get_ticker.assert_called()
-    
-    def test_calculate_spread(self):
-        """
-        Teste le calcul du spread.
-        """
-        # Calculer le spread
-        pair = self.strategy.pairs[0]
-        spread = self.strategy._calculate_spread(50000.0, 3000.0, pair)
-        
-        # Vérifier que le spread est correctement calculé
-        self.assertEqual(spread, 50000.0 - 0.15 * 3000.0)
-    
-    def test_should_open_position(self):
-        """
-        Teste la décision d'ouverture de position.
-        """
-        # Initialiser le modèle
-        pair = self.strategy.pairs[0]
-        self.strategy._initialize_model(pair)
-        
-        # Configurer les données pour le test
-        pair["spread_mean"] = 0.0
-        pair["spread_std"] = 1.0
-        
-        # Tester avec un Z-score au-dessus du seuil
-        should_open, position_type = self.strategy._should_open_position(2.5, pair)
-        self.assertTrue(should_open)
-        self.assertEqual(position_type, "short")
-        
-        # Tester avec un Z-score en dessous du seuil négatif
-        should_open, position_type = self.strategy._should_open_position(-2.5, pair)
-        self.assertTrue(should_open)
-        self.assertEqual(position_type, "long")
-        
-        # Tester avec un Z-score dans la plage normale
-        should_open, position_type = self.strategy._should_open_position(1.0, pair)
-        self.assertFalse(should_open)
-        self.assertIsNone(position_type)
-    
-    def test_should_close_position(self):
-        """
-        Teste la décision de fermeture de position.
-        """
-        # Tester la fermeture d'une position longue
-        should_close = self.strategy._should_close_position(0.5, "long")
-        self.assertTrue(should_close)
-        
-        # Tester la fermeture d'une position courte
-        should_close = self.strategy._should_close_position(-0.5, "short")
-        self.assertTrue(should_close)
-        
-        # Tester le maintien d'une position longue
-        should_close = self.strategy._should_close_position(-1.5, "long")
-        self.assertFalse(should_close)
-        
-        # Tester le maintien d'une position courte
-        should_close = self.strategy._should_close_position(1.5, "short")
-        self.assertFalse(should_close)
-    
-    def test_open_position(self):
-        """
-        Teste l'ouverture d'une position.
-        """
-        # Ouvrir une position longue
-        pair = self.strategy.pairs[0]
-        position_id = self.strategy._open_position(pair, "long", 50000.0, 3000.0)
-        
-        # Vérifier que la position est correctement ouverte
-        self.assertIn(position_id, self.strategy.positions)
-        position = self.strategy.positions[position_id]
-        self.assertEqual(position["pair_id"], f"{pair['base']}_{pair['quote']}_{pair['exchange']}")
-        self.assertEqual(position["type"], "long")
-        self.assertEqual(position["base_entry_price"], 50000.0)
-        self.assertEqual(position["quote_entry_price"], 3000.0)
-        self.assertIsNotNone(position["entry_time"])
-        self.assertEqual(position["status"], "open")
-    
-    def test_close_position(self):
-        """
-        Teste la fermeture d'une position.
-        """
-        # Ouvrir une position
-        pair = self.strategy.pairs[0]
-        position_id = self.strategy._open_position(pair, "long", 50000.0, 3000.0)
-        
-        # Fermer la position
-        self.strategy._close_position(position_id, 51000.0, 3100.0)
-        
-        # Vérifier que la position est correctement fermée
-        position = self.strategy.positions[position_id]
-        self.assertEqual(position["status"], "closed")
-        self.assertEqual(position["base_exit_price"], 51000.0)
-        self.assertEqual(position["quote_exit_price"], 3100.0)
-        self.assertIsNotNone(position["exit_time"])
-        self.assertIsNotNone(position["pnl"])
-        self.assertIsNotNone(position["pnl_percent"])
-    
-    def test_calculate_pnl(self):
-        """
-        Teste le calcul du P&L.
-        """
-        # Calculer le P&L pour une position longue
-        pair = self.strategy.pairs[0]
-        pnl, pnl_percent = self.strategy._calculate_pnl(
-            "long", 50000.0, 3000.0, 51000.0, 3100.0, pair
-        )
-        
-        # Vérifier que le P&L est correctement calculé
-        self.assertGreater(pnl, 0)  # Le P&L devrait être positif
-        
-        # Calculer le P&L pour une position courte
-        pnl, pnl_percent = self.strategy._calculate_pnl(
-            "short", 50000.0, 3000.0, 49000.0, 2900.0, pair
-        )
-        
-        # Vérifier que le P&L est correctement calculé
-        self.assertGreater(pnl, 0)  # Le P&L devrait être positif
-    
-    def test_update(self):
-        """
-        Teste la mise à jour de la stratégie.
-        """
-        # Initialiser les modèles
-        for pair in self.strategy.pairs:
-            self.strategy._initialize_model(pair)
-        
-        # Mettre à jour la stratégie
-        self.strategy.update()
-        
-        # Vérifier que le gestionnaire de données a été appelé
-        self.market_data_manager.get_ticker.assert_called()
-    
-    def test_rebalance(self):
-        """
-        Teste le rééquilibrage des positions.
-        """
-        # Initialiser les modèles
-        for pair in self.strategy.pairs:
-            self.strategy._initialize_model(pair)
-        
-        # Ouvrir une position
-        pair = self.strategy.pairs[0]
-        position_id = self.strategy._open_position(pair, "long", 50000.0, 3000.0)
-        
-        # Configurer la position pour qu'elle soit ouverte depuis longtemps
-        self.strategy.positions[position_id]["entry_time"] = time.time() - 3600 * 24  # 24 heures
-        
-        # Rééquilibrer les positions
-        self.strategy._rebalance()
-        
-        # Vérifier que la position a été fermée
-        position = self.strategy.positions[position_id]
-        self.assertEqual(position["status"], "closed")
+    }
+
+
+def _prices_at_z(strategy, z_score: float, asset1_price: float = 50000.0) -> Dict[tuple, float]:
+    """
+    Construit des prix actuels donnant le Z-score demandé pour la paire de test.
+    """
+    model = strategy.pair_models[_PAIR_ID]
+    asset2_price = (model["slope"] * asset1_price + model["intercept"] +
+                    model["spread_mean"] + z_score * model["spread_std"])
+    return {_BTC: asset1_price, _ETH: asset2_price}
+
+
+@pytest.fixture(scope="module")
+def candles():
+    """
+    Génère une fois les bougies OHLCV horaires partagées par tous les tests.
+
+    Returns:
+        Bougies (100, 6) indexées par symbole.
+    """
+    rng = np.random.default_rng(42)
+    timestamps = 1672531200000.0 + 3600000.0 * np.arange(100)
+    closes = {
+        "BTC/USDT": 50000.0 + 100.0 * np.arange(100),
+        "ETH/USDT": 3000.0 + 10.0 * np.arange(100) + rng.normal(0, 50, 100)
+    }
+
+    result = {}
+    for symbol, close in closes.items():
+        rows = np.zeros((100, 6))
+        rows[:, 0] = timestamps
+        rows[:, 1:5] = close[:, None]
+        rows[:, 5] = 100.0
+        result[symbol] = rows
+    return result
+
+
+@pytest.fixture
+def market_data_manager(candles):
+    """
+    Gestionnaire de données de marché factice, neuf pour chaque test.
+    """
+    return _MDMStub(candles)
+
+
+@pytest.fixture(scope="module")
+def fitted_strategy(candles):
+    """
+    Stratégie dont le modèle de la paire est ajusté une seule fois pour le module.
+    """
+    strategy = StatisticalArbitrageStrategy("stat_arb", _MDMStub(candles), config=_make_config())
+    yield strategy
+    if strategy.prefetch_executor is not None:
+        strategy.prefetch_executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def strategy(fitted_strategy, market_data_manager):
+    """
+    Copie de la stratégie ajustée, branchée sur un gestionnaire de données neuf.
+
+    Les tests qui ont besoin d'un modèle réajusté appellent _initialize_models explicitement.
+    La copie ne partage ni le pool de threads, recréé à la première requête, ni l'événement _ready.
+    """
+    memo = {id(fitted_strategy.market_data_manager): market_data_manager,
+            id(fitted_strategy.prefetch_executor): None,
+            id(fitted_strategy._ready): threading.Event()}
+    strategy = copy.deepcopy(fitted_strategy, memo)
+    yield strategy
+    if strategy.prefetch_executor is not None:
+        strategy.prefetch_executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def as_position():
+    """
+    Convertit une position (dictionnaire) en objet à attributs pour les assertions.
+
+    Returns:
+        Fonction de conversion d'une position.
+    """
+    def wrap(position: Dict[str, Any]) -> SimpleNamespace:
+        return SimpleNamespace(**position)
+
+    return wrap
+
+
+def test_initialization(strategy):
+    """
+    Teste l'initialisation de la stratégie.
+    """
+    # Vérifier que la stratégie est correctement initialisée
+    assert strategy.name == "StatisticalArbitrage"
+    assert strategy.enabled is True
+    assert strategy.symbols == ["BTC/USDT", "ETH/USDT"]
+    assert strategy.exchanges == ["binance"]
+    assert strategy.lookback_period == 30
+    assert strategy.z_score_threshold == 2.0
+    assert strategy.max_positions == 5
+    assert strategy.timeframe == "1h"
+    assert strategy._candle_limit == 30 * 24
+
+    # Vérifier que les structures de données sont initialisées
+    assert len(strategy.pairs) == 1
+    assert strategy.pairs[0]["asset1"] == "BTC/USDT"
+    assert strategy.pairs[0]["asset2"] == "ETH/USDT"
+    assert strategy._pair_ids == [_PAIR_ID]
+
+    # Vérifier que les positions sont initialisées
+    assert not strategy.get_active_positions()
+
+
+def test_strategy_copy_is_independent(strategy, fitted_strategy, market_data_manager):
+    """
+    Teste que chaque test reçoit une copie du modèle ajusté, sans réajustement ni état partagé.
+    """
+    assert strategy.market_data_manager is market_data_manager
+    assert strategy.pair_models[_PAIR_ID] is not fitted_strategy.pair_models[_PAIR_ID]
+    market_data_manager.get_recent_candles.assert_not_called()
+
+    strategy.pair_models[_PAIR_ID]["spread_buffer"].append(0.0)
+    assert len(fitted_strategy.pair_models[_PAIR_ID]["spread_buffer"]) == 100
+
+
+def test_initialize_models(strategy, market_data_manager, candles):
+    """
+    Teste l'initialisation du modèle d'arbitrage statistique.
+    """
+    strategy._initialize_models()
+
+    # Vérifier que le modèle est correctement initialisé
+    model = strategy.get_pair_models()[_PAIR_ID]
+    for key in ("slope", "intercept", "correlation", "spread_mean", "spread_std", "kalman_P", "last_update_ms"):
+        assert key in model
+    assert model["correlation"] > 0.9
+    assert model["last_update_ms"] == int(candles["BTC/USDT"][-1, 0]) + 1
+
+    # Vérifier la fenêtre glissante du spread et ses sommes courantes
+    buffer = np.array(model["spread_buffer"])
+    assert buffer.size == 100
+    assert model["sum_s"] == pytest.approx(buffer.sum())
+    assert model["spread_std"] == pytest.approx(buffer.std())
+
+    # Vérifier que le gestionnaire de données a été appelé
+    market_data_manager.get_recent_candles.assert_called()
+
+
+def test_prefetch_prices(strategy, candles):
+    """
+    Teste la récupération simultanée des prix, y compris depuis une boucle asyncio en cours.
+    """
+    requests = [("BTC/USDT", "binance", None), ("ETH/USDT", "binance", None), ("BTC/USDT", "binance", None)]
+
+    async def prefetch_in_loop():
+        return strategy._prefetch_prices(requests)
+
+    for prices_cache in (strategy._prefetch_prices(requests), asyncio.run(prefetch_in_loop())):
+        # Les doublons sont ignorés; horodatages et prix de clôture indexés par requête
+        assert list(prices_cache) == requests[:2]
+        np.testing.assert_array_equal(prices_cache[requests[1]], candles["ETH/USDT"][:, [0, 4]])
+
+
+def test_prefetch_prices_reuses_capped_pool(strategy):
+    """
+    Teste la réutilisation d'un seul pool de threads, limité à prefetch_workers, d'un rafraîchissement à l'autre.
+    """
+    strategy.prefetch_workers = 2
+    requests = [(f"SYM{i}/USDT", "binance", None) for i in range(5)]
+
+    strategy._prefetch_prices(requests)
+    executor = strategy.prefetch_executor
+    strategy._prefetch_prices(requests)
+
+    assert strategy.prefetch_executor is executor
+    assert executor._max_workers == 2
+    assert len(executor._threads) <= 2
+
+    # L'arrêt de la stratégie libère le pool
+    strategy.stop()
+    assert strategy.prefetch_executor is None
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+
+
+def test_update_models_without_new_candles(strategy):
+    """
+    Teste que l'horodatage du modèle n'avance que lorsque des bougies sont consommées.
+    """
+    model = strategy.pair_models[_PAIR_ID]
+    last_update_ms = model["last_update_ms"]
+    model["last_update_ts"] -= strategy._model_refresh_s
+
+    # Aucune bougie postérieure au dernier horodatage: le modèle reste inchangé
+    strategy._update_models()
+    assert model["last_update_ms"] == last_update_ms
+    assert time.monotonic() - model["last_update_ts"] >= strategy._model_refresh_s
+    assert len(model["spread_buffer"]) == 100
+
+
+def test_update_models_with_new_candles(strategy, candles):
+    """
+    Teste la mise à jour incrémentale du modèle à partir des nouvelles bougies.
+    """
+    model = strategy.pair_models[_PAIR_ID]
+    model["last_update_ts"] -= strategy._model_refresh_s
+    model["last_update_ms"] = int(candles["BTC/USDT"][-5, 0])
+    first_spread = model["spread_buffer"][0]
+
+    # Les cinq dernières bougies sont consommées et l'horodatage passe la dernière d'entre elles
+    strategy._update_models()
+    assert model["last_update_ms"] == int(candles["BTC/USDT"][-1, 0]) + 1
+    assert time.monotonic() - model["last_update_ts"] < strategy._model_refresh_s
+    assert len(model["spread_buffer"]) == 100
+    assert model["spread_buffer"][0] != first_spread
+    assert model["sum_s"] == pytest.approx(sum(model["spread_buffer"]))
+
+
+def test_update_models_kalman_reset(strategy, candles):
+    """
+    Teste la réinitialisation du filtre de Kalman et de la fenêtre du spread en cas de divergence.
+    """
+    model = strategy.pair_models[_PAIR_ID]
+    model["last_update_ts"] -= strategy._model_refresh_s
+    model["last_update_ms"] = int(candles["BTC/USDT"][-5, 0])
+
+    # Forcer un ratio de couverture filtré divergent
+    model["slope"] *= 10.0
+    strategy._update_models()
+
+    # Vérifier que le ratio et la fenêtre du spread sont recalculés par les moindres carrés
+    slope, intercept, _ = strategy._calculate_regression(model["asset1_prices"], model["asset2_prices"])
+    spreads = model["asset2_prices"] - (slope * model["asset1_prices"] + intercept)
+    assert model["slope"] == pytest.approx(slope)
+    assert model["intercept"] == pytest.approx(intercept)
+    np.testing.assert_allclose(np.array(model["spread_buffer"]), spreads)
+    assert model["sum_s"] == pytest.approx(spreads.sum(), abs=1e-6)
+    assert model["sum_s2"] == pytest.approx(np.dot(spreads, spreads))
+    assert model["spread_mean"] == pytest.approx(spreads.mean(), abs=1e-6)
+    assert model["spread_std"] == pytest.approx(spreads.std())
+
+
+def test_calculate_regression(strategy):
+    """
+    Teste la régression linéaire entre deux séries de prix.
+    """
+    x = np.arange(1.0, 51.0)
+    slope, intercept, correlation = strategy._calculate_regression(x, 2.0 * x + 3.0)
+
+    assert slope == pytest.approx(2.0)
+    assert intercept == pytest.approx(3.0)
+    assert correlation == pytest.approx(1.0)
+
+
+def test_calculate_z_score(strategy):
+    """
+    Teste le calcul du Z-score.
+    """
+    model = strategy.pair_models[_PAIR_ID]
+
+    # Configurer les données pour le test
+    model["spread_mean"] = 0.0
+    model["spread_std"] = 1.0
+
+    # Vérifier que le Z-score est correctement calculé
+    assert strategy._calculate_z_score(2.0, _PAIR_ID) == 2.0
+    assert strategy._calculate_z_score(2.0, "inconnue") == 0.0
+
+
+def test_get_current_price(strategy, market_data_manager):
+    """
+    Teste la récupération du prix actuel.
+    """
+    # Vérifier que le prix est correctement récupéré
+    assert strategy._get_current_price(*_BTC) == 50050.0
+
+    # Vérifier que le gestionnaire de données a été appelé
+    market_data_manager.get_ticker.assert_called_with(*_BTC)
+
+
+def test_evaluate_z_scores(strategy):
+    """
+    Teste le calcul vectoriel des spreads et des Z-scores.
+    """
+    model = strategy.pair_models[_PAIR_ID]
+
+    # Prix donnant un Z-score de 1.5
+    _, _, spreads, z_scores = strategy._evaluate_z_scores([0], _prices_at_z(strategy, 1.5))
+    assert spreads[0] == pytest.approx(model["spread_mean"] + 1.5 * model["spread_std"])
+    assert z_scores[0] == pytest.approx(1.5)
+
+    # Un prix manquant donne un Z-score NaN
+    _, _, _, z_scores = strategy._evaluate_z_scores([0], {_BTC: 50000.0})
+    assert np.isnan(z_scores[0])
+
+
+@pytest.mark.parametrize(
+    "z_score, expected_direction",
+    [
+        (2.5, DIR_SHORT),   # au-dessus du seuil
+        (-2.5, DIR_LONG),   # en dessous du seuil négatif
+        (1.0, None),        # dans la plage normale
+    ],
+)
+def test_should_open_position(strategy, z_score, expected_direction):
+    """
+    Teste la décision d'ouverture de position.
+    """
+    strategy._check_arbitrage_opportunities(_prices_at_z(strategy, z_score))
+
+    positions = strategy.get_active_positions()
+    if expected_direction is None:
+        assert not positions
+    else:
+        assert positions[_PAIR_ID]["direction"] == expected_direction
+
+
+@pytest.mark.parametrize(
+    "z_score, direction, expected",
+    [
+        (0.5, "long", True),     # objectif atteint pour une position longue
+        (-0.5, "short", True),   # objectif atteint pour une position courte
+        (-3.0, "long", True),    # stop loss atteint pour une position longue
+        (3.0, "short", True),    # stop loss atteint pour une position courte
+        (-1.5, "long", False),   # maintien d'une position longue
+        (1.5, "short", False),   # maintien d'une position courte
+        (-2.6, "long", False),   # maintien juste avant le stop d'une position longue
+        (2.6, "short", False),   # maintien juste avant le stop d'une position courte
+    ],
+)
+def test_should_close_position(strategy, z_score, direction, expected):
+    """
+    Teste la décision de fermeture de position.
+    """
+    # Ouvrir la position au Z-score d'entrée correspondant à sa direction
+    entry_z = -2.5 if direction == "long" else 2.5
+    prices = _prices_at_z(strategy, entry_z)
+    strategy._open_arbitrage_position(_PAIR_ID, direction, prices[_BTC], prices[_ETH], entry_z)
+
+    strategy._manage_positions(_prices_at_z(strategy, z_score))
+
+    assert (_PAIR_ID not in strategy.get_active_positions()) == expected
+
+
+@pytest.mark.parametrize(
+    "direction, entry_z, expected_stop",
+    [
+        ("long", -2.5, -2.625),   # stop au-delà de l'entrée, côté négatif
+        ("short", 2.5, 2.625),    # stop au-delà de l'entrée, côté positif
+    ],
+)
+def test_stop_loss_placement(strategy, as_position, direction, entry_z, expected_stop):
+    """
+    Teste le placement du stop loss en Z-score au-delà du Z-score d'entrée.
+    """
+    strategy.stop_loss_pct = 0.05
+    prices = _prices_at_z(strategy, entry_z)
+    strategy._open_arbitrage_position(_PAIR_ID, direction, prices[_BTC], prices[_ETH], entry_z)
+
+    # Vérifier le stop enregistré dans la position et dans les tableaux vectorisés
+    position = as_position(strategy.get_active_positions()[_PAIR_ID])
+    assert position.stop_loss_z_score == pytest.approx(expected_stop)
+    assert strategy._pos_stop[0] == pytest.approx(expected_stop)
+    assert strategy._pos_target[0] == 0.0
+
+
+def test_open_position(strategy, as_position):
+    """
+    Teste l'ouverture d'une position.
+    """
+    # Ouvrir une position longue
+    strategy._open_arbitrage_position(_PAIR_ID, "long", 50000.0, 3000.0, -2.5)
+
+    # Vérifier que la position est correctement ouverte
+    positions = strategy.get_active_positions()
+    assert _PAIR_ID in positions
+    position = as_position(positions[_PAIR_ID])
+    assert position.direction == DIR_LONG
+    assert position.asset1 == "BTC/USDT"
+    assert position.asset2 == "ETH/USDT"
+    assert position.entry_asset1_price == 50000.0
+    assert position.entry_asset2_price == 3000.0
+    assert position.entry_z_score == -2.5
+    assert position.target_z_score == 0.0
+    assert position.entry_time is not None
+    assert strategy._n_active == 1
+
+
+def test_close_position(strategy):
+    """
+    Teste la fermeture d'une position.
+    """
+    # Ouvrir une position
+    strategy._open_arbitrage_position(_PAIR_ID, "long", 50000.0, 3000.0, -2.5)
+
+    # Fermer la position
+    pnl = strategy._close_position(_PAIR_ID, {_BTC: 51000.0, _ETH: 3100.0})
+
+    # Vérifier que la position est correctement fermée
+    assert pnl is not None
+    assert _PAIR_ID not in strategy.get_active_positions()
+    assert strategy._n_active == 0
+
+    # Fermer une position inexistante ne renvoie rien
+    assert strategy._close_position(_PAIR_ID, {_BTC: 51000.0, _ETH: 3100.0}) is None
+
+
+def test_calculate_pnl(strategy):
+    """
+    Teste le calcul du P&L.
+    """
+    # P&L d'une position longue (achat de asset2, vente de asset1)
+    strategy._open_arbitrage_position(_PAIR_ID, "long", 50000.0, 3000.0, -2.5)
+    pnl = strategy._close_position(_PAIR_ID, {_BTC: 49000.0, _ETH: 3100.0})
+
+    # Vérifier que le P&L est correctement calculé
+    assert pnl > 0  # Le P&L devrait être positif
+
+    # P&L d'une position courte (vente de asset2, achat de asset1)
+    strategy._open_arbitrage_position(_PAIR_ID, "short", 50000.0, 3000.0, 2.5)
+    pnl = strategy._close_position(_PAIR_ID, {_BTC: 51000.0, _ETH: 2900.0})
+
+    # Vérifier que le P&L est correctement calculé
+    assert pnl > 0  # Le P&L devrait être positif
+
+
+def test_calculate_pnl_sign_grid(strategy):
+    """
+    Teste le signe du P&L réalisé sur une grille de directions et de prix d'entrée et de sortie.
+    """
+    directions = np.array([DIR_LONG, DIR_SHORT])
+    entries = np.array([49000.0, 50000.0, 51000.0])
+    exits = np.array([48000.0, 50000.0, 52000.0])
+    slope = strategy.pair_models[_PAIR_ID]["slope"]
+
+    # Signe attendu pour chaque triplet (direction, entrée, sortie), calculé par diffusion:
+    # rendement couvert de asset2 moins le rendement de asset1, orienté par la direction
+    expected = np.sign(directions[:, None, None] * (
+        slope * (3100.0 - 3000.0) / 3000.0 - (exits[None, None, :] - entries[None, :, None]) / entries[None, :, None]
+    ))
+
+    # P&L réalisé par la stratégie pour chaque triplet de la grille
+    pnl = np.empty(expected.shape)
+    for d, direction in enumerate(directions):
+        side = "long" if direction == DIR_LONG else "short"
+        for i, entry in enumerate(entries):
+            for j, exit_price in enumerate(exits):
+                strategy._open_arbitrage_position(_PAIR_ID, side, entry, 3000.0, -2.5 * direction)
+                pnl[d, i, j] = strategy._close_position(_PAIR_ID, {_BTC: exit_price, _ETH: 3100.0})
+
+    # Vérifier la cohérence des signes en une seule comparaison
+    assert np.all(expected != 0)
+    np.testing.assert_array_equal(np.sign(pnl), expected)
+
+
+def test_update(strategy, market_data_manager):
+    """
+    Teste la mise à jour de la stratégie.
+    """
+    # Mettre à jour la stratégie
+    strategy.update()
+
+    # Vérifier que les prix sont demandés en un seul appel groupé par exchange
+    market_data_manager.get_tickers.assert_called_once_with(["BTC/USDT", "ETH/USDT"], "binance")
+    market_data_manager.get_ticker.assert_not_called()
+
+
+def test_batch_fetch_tickers(strategy, market_data_manager, candles):
+    """
+    Teste la récupération groupée des derniers prix par exchange.
+    """
+    prices = strategy._batch_fetch_tickers({"binance": ["BTC/USDT", "ETH/USDT", "SOL/USDT"]})
+
+    # Vérifier que les prix sont indexés par (symbole, exchange) et que les symboles absents sont ignorés
+    assert prices == {_BTC: candles["BTC/USDT"][-1, 4], _ETH: candles["ETH/USDT"][-1, 4]}
+
+    # Une erreur du gestionnaire de données donne un résultat vide
+    market_data_manager.get_tickers.side_effect = Exception("timeout")
+    assert strategy._batch_fetch_tickers({"binance": ["BTC/USDT"]}) == {}
+
+
+def test_rebalance(strategy):
+    """
+    Teste le déclenchement du rééquilibrage du portefeuille.
+    """
+    assert not strategy._check_rebalance()
+
+    # Configurer le dernier rééquilibrage au-delà de l'intervalle
+    strategy._last_rebalance_ts = time.monotonic() - strategy._rebalance_interval_s - 1
+    assert strategy._check_rebalance()
+
+    # La mise à jour rééquilibre et réarme l'intervalle
+    strategy.update()
+    assert not strategy._check_rebalance()
 
 
 if __name__ == "__main__":
-    unittest.main()
+    pytest.main([__file__])